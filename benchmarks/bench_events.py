@@ -0,0 +1,68 @@
+"""
+Compare the parser engines on ASS dialogue events.
+
+Usage, with pyasstosrt installed or from the repository root:
+
+    PYTHONPATH=. python benchmarks/bench_events.py [--events N] [--file PATH] [--repeat N]
+
+With --file the engines parse that file instead of a generated document, which shows the
+fastest engine for your own subtitles and whether any engine drops events from them.
+"""
+
+import argparse
+import io
+import timeit
+
+from pyasstosrt.engines import DEFAULT_ENGINE, ENGINES
+
+HEADER = (
+    "[Script Info]\n"
+    "ScriptType: v4.00+\n"
+    "\n"
+    "[V4+ Styles]\n"
+    "Format: Name, Fontname, Fontsize, PrimaryColour, Bold, Italic, Alignment, MarginL, MarginR, MarginV\n"
+    "Style: Default,Arial,20,&H00FFFFFF,0,0,2,10,10,10\n"
+    "\n"
+    "[Events]\n"
+    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+)
+
+
+def make_document(events: int) -> str:
+    lines = [HEADER]
+    for i in range(events):
+        seconds = i * 2 % 36000  # the regex only accepts single-digit hours
+        start = f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}.00"
+        end = f"{(seconds + 1) // 3600}:{(seconds + 1) // 60 % 60:02d}:{(seconds + 1) % 60:02d}.50"
+        style = "Signs" if i % 7 == 0 else "Default"
+        text = "{\\pos(320,50)\\fad(100,100)}A sign, with commas" if style == "Signs" else f"Line {i}, said by someone"
+        lines.append(f"Dialogue: 0,{start},{end},{style},Actor,0,0,0,,{text}\n")
+    return "".join(lines)
+
+
+def main():
+    arguments = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arguments.add_argument("--events", type=int, default=100_000, help="number of Dialogue lines")
+    arguments.add_argument("--file", help="ASS file to parse instead of a generated document")
+    arguments.add_argument("--repeat", type=int, default=5, help="number of timed runs, the best one is reported")
+    args = arguments.parse_args()
+
+    if args.file:
+        with open(args.file, encoding="utf8") as file:
+            document = file.read()
+    else:
+        document = make_document(args.events)
+
+    results = {}
+    for name, engine in sorted(ENGINES.items()):
+        events = sum(1 for _ in engine.iter_ass_events(io.StringIO(document)))
+        timer = timeit.Timer(lambda engine=engine: sum(1 for _ in engine.iter_ass_events(io.StringIO(document))))
+        results[name] = min(timer.repeat(repeat=args.repeat, number=1))
+        print(f"{name:>8}: {results[name] * 1000:8.1f} ms, {events:,} events ({events / results[name]:,.0f} events/s)")
+    for name, elapsed in sorted(results.items()):
+        if name != DEFAULT_ENGINE:
+            print(f"{DEFAULT_ENGINE} vs {name}: {elapsed / results[DEFAULT_ENGINE]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
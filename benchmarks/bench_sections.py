@@ -0,0 +1,73 @@
+"""
+Measure how embedded [Fonts] payloads affect parsing, with and without the section index.
+
+Usage, with pyasstosrt installed or from the repository root:
+
+    PYTHONPATH=. python benchmarks/bench_sections.py [--fonts-mb N] [--events N] [--repeat N]
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+from pyasstosrt.parser import has_srt_timecode, index_sections, iter_ass_events, srt_timecode
+
+HEADER = (
+    "[Script Info]\n"
+    "ScriptType: v4.00+\n"
+    "\n"
+    "[Events]\n"
+    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+)
+
+
+def write_document(path: str, fonts_mb: int, events: int):
+    # uuencoded font data as embedded by Aegisub: 80 characters per line
+    font_line = "".join(chr(33 + i % 64) for i in range(80)) + "\n"
+    with open(path, "w", encoding="utf8") as file:
+        file.write(HEADER)
+        for i in range(events):
+            seconds = i * 2 % 36000
+            time = f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}.00"
+            file.write(f"Dialogue: 0,{time},{time},Default,,0,0,0,,Line {i}\n")
+        file.write("\n[Fonts]\nfontname: embedded_0.ttf\n")
+        file.write(font_line * (fonts_mb * 1024 * 1024 // len(font_line)))
+
+
+def scan_all_lines(path: str) -> int:
+    # What conversion did before the index: detect SRT and parse events over every decoded line
+    with open(path, encoding="utf8") as stream:
+        any("-->" in line and srt_timecode.search(line) for line in stream)
+    with open(path, encoding="utf8") as stream:
+        return sum(1 for _ in iter_ass_events(stream))
+
+
+def seek_events(path: str) -> int:
+    # What conversion does now: index the sections once, then skip fonts in both passes
+    sections = index_sections(path)
+    has_srt_timecode(path, sections=sections)
+    return sum(1 for _ in iter_ass_events(path, sections=sections))
+
+
+def main():
+    arguments = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arguments.add_argument("--fonts-mb", type=int, default=20, help="size of the embedded font payload")
+    arguments.add_argument("--events", type=int, default=5_000, help="number of Dialogue lines")
+    arguments.add_argument("--repeat", type=int, default=5, help="number of timed runs, the best one is reported")
+    args = arguments.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "fonts.ass")
+        write_document(path, args.fonts_mb, args.events)
+        assert scan_all_lines(path) == seek_events(path) == args.events
+
+        results = {}
+        for name, parse in (("scan", scan_all_lines), ("index", seek_events)):
+            results[name] = min(timeit.repeat(lambda parse=parse: parse(path), repeat=args.repeat, number=1))
+            print(f"{name:>8}: {results[name] * 1000:8.1f} ms")
+        print(f" speedup: {results['scan'] / results['index']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compare the buffered SrtWriter with writing one str(dialogue) per entry.
+
+Usage, with pyasstosrt installed or from the repository root:
+
+    PYTHONPATH=. python benchmarks/bench_writer.py [--events N] [--buffer-size N ...] [--repeat N]
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+
+from pyasstosrt import Dialogue, SrtWriter
+
+
+def make_dialogues(events: int):
+    return [Dialogue(i + 1, i * 2000, i * 2000 + 1500, f"Line {i}\nsecond line") for i in range(events)]
+
+
+def write_loop(stream, dialogues):
+    # What export did before SrtWriter: one formatted string and one write per dialogue
+    if isinstance(stream, io.BufferedIOBase):
+        writer = io.TextIOWrapper(stream, encoding="utf8", newline="")
+        for dialogue in dialogues:
+            writer.write(str(dialogue))
+        writer.flush()
+        writer.detach()
+        return
+    for dialogue in dialogues:
+        stream.write(str(dialogue))
+
+
+def write_buffered(stream, dialogues, buffer_size: int):
+    with SrtWriter(stream, buffer_size=buffer_size) as writer:
+        writer.write_dialogues(dialogues)
+
+
+def best_time(open_stream, write, events: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        # Fresh dialogues per run, so the SRT strings cached on Time objects do not carry over
+        dialogues = make_dialogues(events)
+        stream = open_stream()
+        started = time.perf_counter()
+        write(stream, dialogues)
+        stream.flush()
+        timings.append(time.perf_counter() - started)
+        stream.close()
+    return min(timings)
+
+
+def main():
+    arguments = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arguments.add_argument("--events", type=int, default=100_000, help="number of dialogues to write")
+    arguments.add_argument(
+        "--buffer-size", type=int, nargs="+", default=[8192, 65536, 1048576], help="SrtWriter buffer sizes to try"
+    )
+    arguments.add_argument("--repeat", type=int, default=5, help="number of timed runs, the best one is reported")
+    args = arguments.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "out.srt")
+        targets = {
+            "StringIO": io.StringIO,
+            "BytesIO": io.BytesIO,
+            "text file": lambda: open(path, "w", encoding="utf8"),
+            "binary file": lambda: open(path, "wb"),
+        }
+        for target, open_stream in targets.items():
+            loop = best_time(open_stream, write_loop, args.events, args.repeat)
+            print(f"{target}: loop {loop * 1000:.1f} ms")
+            for buffer_size in args.buffer_size:
+
+                def write(stream, dialogues, buffer_size=buffer_size):
+                    write_buffered(stream, dialogues, buffer_size)
+
+                buffered = best_time(open_stream, write, args.events, args.repeat)
+                print(f"  buffer {buffer_size:>8}: {buffered * 1000:8.1f} ms ({loop / buffered:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,16 @@
 :copyright: (c) 2021 GitBib
 """
 
+from .cache import DiskCache, SubtitleCache
+from .conversion import ConversionResult, convert_many, iter_convert_many, iter_scan_styles, scan_styles
 from .dialogue import Dialogue
+from .engines import ParserEngine, get_engine, register_engine
 from .pyasstosrt import Subtitle
+from .stats import ConversionStats, StageStats
+from .styles import StyleReport
+from .table import DialogueTable
 from .time import Time
+from .writer import SrtWriter
 
 VERSION = (1, 4, 0)
 __version__ = ".".join(map(str, VERSION))
@@ -15,4 +22,23 @@ __version__ = ".".join(map(str, VERSION))
 __author__ = "GitBib"
 __email__ = "pyasstosrt@bnff.website"
 
-__all__ = ["Subtitle", "Time", "Dialogue"]
+__all__ = [
+    "Subtitle",
+    "Time",
+    "Dialogue",
+    "DialogueTable",
+    "SrtWriter",
+    "DiskCache",
+    "SubtitleCache",
+    "ConversionResult",
+    "convert_many",
+    "iter_convert_many",
+    "StyleReport",
+    "scan_styles",
+    "iter_scan_styles",
+    "ParserEngine",
+    "get_engine",
+    "register_engine",
+    "ConversionStats",
+    "StageStats",
+]
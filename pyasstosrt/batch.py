@@ -1,5 +1,9 @@
+import cProfile
+import os
+import sys
+import time
 from pathlib import Path
-from typing import Annotated, List, Optional
+from typing import Annotated, Dict, List, Optional
 
 try:
     import typer
@@ -13,7 +17,20 @@ except ModuleNotFoundError as e:
         "pyasstosrt was installed without the cli extra. Please reinstall it with: pip install 'pyasstosrt[cli]'"
     ) from e
 
-from pyasstosrt import Subtitle, __version__
+from pyasstosrt import (
+    ConversionResult,
+    ConversionStats,
+    DiskCache,
+    StyleReport,
+    Subtitle,
+    __version__,
+    iter_convert_many,
+    iter_scan_styles,
+)
+from pyasstosrt.conversion import peak_memory
+from pyasstosrt.engines import DEFAULT_ENGINE, ENGINES
+from pyasstosrt.manifest import Manifest
+from pyasstosrt.report import RunReport
 
 # Install rich traceback for better error display
 install_rich_traceback(show_locals=True)
@@ -27,6 +44,13 @@ app = typer.Typer(
     pretty_exceptions_show_locals=False,
 )
 console = Console()
+# Diagnostics go to standard error when the SRT output itself is written to standard output
+error_console = Console(stderr=True)
+STDIN = Path("-")
+# Stages of ConversionStats shown in each time column of --stats
+PARSE_STAGES = ("read", "index", "parse")
+CONVERT_STAGES = ("cache", "filter", "sort", "merge", "format")
+WRITE_STAGES = ("write",)
 
 
 def version_callback(value: bool):
@@ -62,8 +86,9 @@ def export(
     filepath: Annotated[
         List[Path],
         typer.Argument(
-            help="Path(s) to the ASS/SSA file(s) to convert",
+            help="Path(s) to the ASS/SSA file(s) to convert, or - to read from standard input",
             exists=True,
+            allow_dash=True,
             file_okay=True,
             dir_okay=False,
             readable=True,
@@ -145,30 +170,164 @@ def export(
             show_default=True,
         ),
     ] = False,
+    jobs: Annotated[
+        Optional[int],
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of files to convert in parallel worker processes. Defaults to the number of CPUs",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental",
+            "-I",
+            help="Skip files whose SRT output is up to date, tracked in a manifest in the output directory",
+            show_default=True,
+        ),
+    ] = False,
+    cache: Annotated[
+        bool,
+        typer.Option(
+            "--cache",
+            help="Reuse conversions of files with identical content from an on-disk cache",
+            show_default=True,
+        ),
+    ] = False,
+    cache_dir: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--cache-dir",
+            help="Directory of the conversion cache, implies --cache. Defaults to ~/.cache/pyasstosrt",
+            file_okay=False,
+            dir_okay=True,
+            show_default=False,
+        ),
+    ] = None,
+    cache_size: Annotated[
+        int,
+        typer.Option(
+            "--cache-size",
+            help="Maximum size of the conversion cache in megabytes",
+            min=1,
+            show_default=True,
+        ),
+    ] = 256,
+    sort: Annotated[
+        bool,
+        typer.Option(
+            "--sort",
+            help="With - as input, sort the dialogues by time. This reads the whole input before writing anything",
+            show_default=True,
+        ),
+    ] = False,
+    engine: Annotated[
+        str,
+        typer.Option(
+            "--engine",
+            help="Parser engine: 'scanner' (fastest, any column order) or 'regex' (strict standard format)",
+            show_default=True,
+        ),
+    ] = DEFAULT_ENGINE,
+    stats: Annotated[
+        bool,
+        typer.Option(
+            "--stats",
+            help="Print the size, event counts, time per stage and throughput of each file and in total",
+            show_default=True,
+        ),
+    ] = False,
+    profile: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--profile",
+            help="Write a cProfile dump of each conversion to this directory, named <file>-<path hash>.prof",
+            file_okay=False,
+            dir_okay=True,
+            show_default=False,
+        ),
+    ] = None,
+    report: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--report",
+            help="Write a JSON lines record of each file and a final summary to this file, flushed as files complete",
+            dir_okay=False,
+            show_default=False,
+        ),
+    ] = None,
 ):
     """
     Convert ASS/SSA subtitle file(s) to SRT format.
 
+    With [bold]-[/bold] as the only file, subtitles are read from standard input and the SRT
+    output is streamed to standard output as the input is parsed, in the order of the input.
+
     [bold]Examples:[/bold]
         pyasstosrt export subtitle.ass
         pyasstosrt export subtitle.ass --remove-effects --remove-duplicates
         pyasstosrt export subtitle.ass --only-default -o output/
         pyasstosrt export *.ass --include-styles "Default,Alt"
+        pyasstosrt export *.ass --jobs 4
+        pyasstosrt export *.ass --incremental -o output/
+        pyasstosrt export *.ass --cache-dir /var/cache/subtitles
+        pyasstosrt export broken.ass --engine regex
+        pyasstosrt export *.ass --stats --profile profiles/
+        pyasstosrt export *.ass -o output/ --report run.jsonl
+        curl -s https://example.com/episode.ass | pyasstosrt export - | gzip > episode.srt.gz
     """
+    piping = STDIN in filepath
     # Validate mutually exclusive style options
     style_options_count = sum([only_default_style, bool(include_styles), bool(exclude_styles)])
     if style_options_count > 1:
-        console.print(
+        (error_console if piping else console).print(
             "[red]Error:[/red] Options [bold]--only-default[/bold], [bold]--include-styles[/bold], "
             "and [bold]--exclude-styles[/bold] are mutually exclusive. Please use only one.",
             style="bold red",
         )
         raise typer.Exit(1)
 
+    if engine not in ENGINES:
+        (error_console if piping else console).print(
+            f"[red]Error:[/red] Unknown parser engine [bold]{engine}[/bold]. "
+            f"Available engines: {', '.join(sorted(ENGINES))}.",
+            style="bold red",
+        )
+        raise typer.Exit(1)
+
     # Parse style filters
     include_styles_list = [s.strip() for s in include_styles.split(",")] if include_styles else None
     exclude_styles_list = [s.strip() for s in exclude_styles.split(",")] if exclude_styles else None
 
+    if piping:
+        if len(filepath) > 1 or output_dir or output_dialogues or incremental or cache or cache_dir:
+            error_console.print(
+                "[red]Error:[/red] Reading from standard input ([bold]-[/bold]) writes SRT to standard output "
+                "and cannot be combined with other files, [bold]--output-dir[/bold], "
+                "[bold]--output-dialogues[/bold], [bold]--incremental[/bold] or [bold]--cache[/bold].",
+                style="bold red",
+            )
+            raise typer.Exit(1)
+        _export_pipe(
+            {
+                "removing_effects": removing_effects,
+                "remove_duplicates": remove_duplicates,
+                "only_default_style": only_default_style,
+                "include_styles": include_styles_list,
+                "exclude_styles": exclude_styles_list,
+                "engine": engine,
+            },
+            encoding,
+            sort,
+            stats,
+            profile,
+            report,
+        )
+        return
+
     # Show conversion summary
     console.print(f"\n[bold cyan]🎬 Starting conversion of {len(filepath)} file(s)[/bold cyan]")
     if removing_effects:
@@ -181,11 +340,49 @@ def export(
         console.print(f"  • Filter: [yellow]Include styles: {include_styles}[/yellow]")
     elif exclude_styles:
         console.print(f"  • Filter: [yellow]Exclude styles: {exclude_styles}[/yellow]")
+    if engine != DEFAULT_ENGINE:
+        console.print(f"  • Parser engine: [yellow]{engine}[/yellow]")
     console.print()
 
     success_count = 0
     error_count = 0
-
+    skipped_count = 0
+
+    options = {
+        "removing_effects": removing_effects,
+        "remove_duplicates": remove_duplicates,
+        "only_default_style": only_default_style,
+        "include_styles": include_styles_list,
+        "exclude_styles": exclude_styles_list,
+        "engine": engine,
+    }
+    # The manifest also tracks the encoding, since it changes the written file
+    manifest_options = dict(options, encoding=encoding)
+    run_report = RunReport(report, manifest_options) if report is not None else None
+    manifests: Dict[Path, Manifest] = {}
+
+    def get_manifest(directory: Path) -> Manifest:
+        if directory not in manifests:
+            manifests[directory] = Manifest.for_directory(directory, __version__)
+        return manifests[directory]
+
+    incremental = incremental and not output_dialogues
+    if incremental:
+        pending = []
+        for file in filepath:
+            output = Path(output_dir or file.parent) / f"{file.stem}.srt"
+            if get_manifest(output.parent).is_up_to_date(file, output, manifest_options):
+                skipped_count += 1
+                if run_report is not None:
+                    run_report.add_skipped(file, output)
+            else:
+                pending.append(file)
+        if skipped_count:
+            console.print(f"[dim]⏭ Skipping {skipped_count} up-to-date file(s)[/dim]")
+        filepath = pending
+
+    converted: List[ConversionResult] = []
+    started = time.perf_counter()
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -193,19 +390,28 @@ def export(
     ) as progress:
         task = progress.add_task("[cyan]Converting files...", total=len(filepath))
 
-        for file in filepath:
-            progress.console.print(f"[bold blue]📄 Processing:[/bold blue] {file.name}")
+        jobs = jobs or os.cpu_count() or 1
+        results = iter_convert_many(
+            filepath,
+            output_dir,
+            encoding,
+            output_dialogues,
+            executor="process" if jobs > 1 and len(filepath) > 1 else "serial",
+            max_workers=max(min(jobs, len(filepath)), 1),
+            on_submit=lambda file: progress.console.print(f"[bold blue]📄 Processing:[/bold blue] {file.name}"),
+            cache=DiskCache(cache_dir, max_size=cache_size * 1024 * 1024) if cache or cache_dir else None,
+            # The report takes the event counts from the stats
+            collect_stats=stats or run_report is not None,
+            profile_dir=profile,
+            **options,
+        )
 
+        for conversion in results:
+            file = conversion.source
             try:
-                sub = Subtitle(
-                    file,
-                    removing_effects,
-                    remove_duplicates,
-                    only_default_style,
-                    include_styles_list,
-                    exclude_styles_list,
-                )
-                result = sub.export(output_dir, encoding, output_dialogues)
+                if conversion.error is not None:
+                    raise conversion.error
+                result = conversion.dialogues
 
                 if output_dialogues and result:
                     progress.console.print(
@@ -220,44 +426,205 @@ def export(
                     if len(result) > 5:
                         progress.console.print(f"... and {len(result) - 5} more dialogue(s)")
 
-                output_file = Path(output_dir) / f"{file.stem}.srt" if output_dir else file.with_suffix(".srt")
                 if not output_dialogues:
-                    progress.console.print(f"[green]✓ Success:[/green] {file.name} → {output_file.name}")
+                    progress.console.print(f"[green]✓ Success:[/green] {file.name} → {conversion.output.name}")
+                if incremental:
+                    get_manifest(conversion.output.parent).record(file, conversion.output, manifest_options)
+                if stats:
+                    converted.append(conversion)
                 success_count += 1
 
-            except FileNotFoundError:
+            except FileNotFoundError as e:
                 progress.console.print(f"[red]✗ Error:[/red] File not found: {file.name}", style="bold red")
+                conversion.error = e
                 error_count += 1
-            except PermissionError:
+            except PermissionError as e:
                 progress.console.print(
                     f"[red]✗ Error:[/red] Permission denied when processing {file.name}", style="bold red"
                 )
+                conversion.error = e
                 error_count += 1
             except Exception as e:
                 progress.console.print(f"[red]✗ Error:[/red] Failed to convert {file.name}: {str(e)}", style="bold red")
+                conversion.error = e
                 error_count += 1
 
+            if run_report is not None:
+                run_report.add(conversion)
             progress.update(task, advance=1)
 
+    for manifest in manifests.values():
+        manifest.save()
+    if run_report is not None:
+        run_report.close()
+
+    if stats and converted:
+        console.print()
+        _print_stats(console, converted, time.perf_counter() - started)
+    if profile is not None:
+        console.print(f"[dim]Profiles written to {profile}, open them with python -m pstats[/dim]")
+
     # Show summary
     console.print()
     if error_count == 0:
         console.print(f"[bold green]✓ Conversion completed successfully![/bold green] ({success_count} file(s))")
+        if skipped_count:
+            console.print(f"[dim]{skipped_count} file(s) already up to date[/dim]")
     else:
         console.print(
             f"[bold yellow]⚠ Conversion completed with errors:[/bold yellow] "
             f"{success_count} successful, {error_count} failed"
+            + (f", {skipped_count} up to date" if skipped_count else "")
         )
         if error_count > 0:
             raise typer.Exit(1)
 
 
-@app.command(name="styles", help="List all unique styles found in an ASS subtitle file")
+def _export_pipe(
+    options: Dict,
+    encoding: str,
+    sort: bool,
+    stats: bool = False,
+    profile: Optional[Path] = None,
+    report: Optional[Path] = None,
+):
+    # Plain SRT on standard output, without rich rendering, so it can feed the next command of a pipeline
+    run_report = RunReport(report, dict(options, encoding=encoding)) if report is not None else None
+    conversion = ConversionResult(STDIN, STDIN, stats=ConversionStats() if stats or report is not None else None)
+    profiler = cProfile.Profile() if profile is not None else None
+    started = time.perf_counter()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        sub = Subtitle.from_stream(sys.stdin.buffer, buffered=False, stats=conversion.stats, **options)
+        conversion.dialogue_count = sub.save(stream=sys.stdout.buffer, encoding=encoding, sort=sort)
+        conversion.elapsed = time.perf_counter() - started
+        if profiler is not None:
+            profiler.disable()
+            profile.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(profile / "stdin.prof")
+        if stats:
+            _print_stats(error_console, [conversion], conversion.elapsed)
+    except BrokenPipeError as e:
+        conversion.error = e
+        # The reader went away (e.g. `| head`); silence the flush of standard output at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        raise typer.Exit(1) from None
+    except Exception as e:
+        conversion.error = e
+        error_console.print(f"[red]✗ Error:[/red] Failed to convert standard input: {str(e)}", style="bold red")
+        raise typer.Exit(1) from e
+    finally:
+        if run_report is not None:
+            conversion.elapsed = time.perf_counter() - started
+            conversion.peak_memory = peak_memory()
+            run_report.add(conversion)
+            run_report.close()
+
+
+def _stage_time(stats: ConversionStats, stages) -> float:
+    return sum(stats[stage].elapsed for stage in stages)
+
+
+def _input_bytes(conversion: ConversionResult) -> int:
+    size = max(conversion.stats["read"].bytes, conversion.stats["parse"].bytes)
+    if not size and conversion.source != STDIN:
+        # Conversions found in the cache are not parsed
+        size = conversion.source.stat().st_size
+    return size
+
+
+def _stats_row(conversion: ConversionResult) -> List[float]:
+    stats = conversion.stats
+    return [
+        _input_bytes(conversion),
+        stats["parse"].items,
+        stats["filter"].items,
+        conversion.dialogue_count,
+        _stage_time(stats, PARSE_STAGES),
+        _stage_time(stats, CONVERT_STAGES),
+        _stage_time(stats, WRITE_STAGES),
+        conversion.elapsed,
+    ]
+
+
+def _format_stats_row(row: List[float]) -> List[str]:
+    size, parsed, kept, written, parse, convert, write, elapsed = row
+    megabytes = size / 1024 / 1024
+    return [
+        f"{megabytes:.2f} MB",
+        f"{parsed:,}",
+        f"{kept:,}",
+        f"{written:,}",
+        *(f"{seconds * 1000:.1f} ms" for seconds in (parse, convert, write)),
+        f"{megabytes / elapsed:.1f}" if elapsed else "-",
+        f"{parsed / elapsed:,.0f}" if elapsed else "-",
+    ]
+
+
+def _print_stats(target: Console, conversions: List[ConversionResult], wall: float):
+    table = Table(title="Conversion stats", show_header=True, header_style="bold cyan")
+    table.add_column("File", style="green")
+    for column in ("Size", "Parsed", "Kept", "Written", "Parse", "Convert", "Write", "MB/s", "Events/s"):
+        table.add_column(column, justify="right")
+
+    totals = [0] * 8
+    for conversion in sorted(conversions, key=lambda conversion: str(conversion.source)):
+        row = _stats_row(conversion)
+        name = "<stdin>" if conversion.source == STDIN else conversion.source.name
+        table.add_row(name, *_format_stats_row(row))
+        for index, value in enumerate(row):
+            totals[index] += value
+    if len(conversions) > 1:
+        table.add_section()
+        # Times are summed over the files, which may have run in parallel
+        table.add_row("Total", *_format_stats_row(totals), style="bold")
+    target.print(table)
+    target.print(
+        "[dim]Kept counts the events left after the style and effect filters, throughput is of the input. "
+        f"Wall time {wall:.2f} s: {totals[0] / 1024 / 1024 / wall:.1f} MB/s, {totals[1] / wall:,.0f} events/s.[/dim]"
+    )
+
+
+def _print_style_list(report: StyleReport, name: str, table_format: bool):
+    style_names = sorted(set(report.declared) | set(report.counts))
+    if table_format:
+        # Display as a rich table
+        table = Table(title=f"Styles in {name}", show_header=True, header_style="bold cyan")
+        table.add_column("#", style="dim", width=6, justify="right")
+        table.add_column("Style Name", style="green")
+        table.add_column("Events", justify="right")
+
+        for idx, style in enumerate(style_names, start=1):
+            table.add_row(str(idx), style, str(report.counts.get(style, 0)))
+
+        console.print(table)
+    else:
+        # Display as a simple list
+        console.print(f"[bold blue]Styles found in {name}:[/bold blue]\n")
+        for idx, style in enumerate(style_names, start=1):
+            count = f"[dim]{report.counts.get(style, 0)} event(s)[/dim]"
+            # Highlight "Default" styles
+            if "Default" in style:
+                console.print(f"  {idx}. [bold green]{style}[/bold green] [dim](default)[/dim] {count}")
+            else:
+                console.print(f"  {idx}. [green]{style}[/green] {count}")
+
+    console.print(
+        f"\n[bold]Total:[/bold] [cyan]{len(style_names)}[/cyan] unique style(s), "
+        f"[cyan]{report.event_count}[/cyan] event(s)"
+    )
+    if report.unused:
+        console.print(f"[dim]Declared but unused: {', '.join(report.unused)}[/dim]")
+
+
+@app.command(name="styles", help="List all unique styles found in ASS subtitle files")
 def styles(
     filepath: Annotated[
-        Path,
+        List[Path],
         typer.Argument(
-            help="Path to the ASS/SSA file to analyze",
+            help="Path to the ASS/SSA files to analyze",
             exists=True,
             file_okay=True,
             dir_okay=False,
@@ -274,49 +641,46 @@ def styles(
             show_default=True,
         ),
     ] = False,
+    jobs: Annotated[
+        Optional[int],
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of files to scan in parallel worker processes. Defaults to the number of CPUs",
+            min=1,
+            show_default=False,
+        ),
+    ] = None,
 ):
     """
-    List all unique styles found in an ASS/SSA subtitle file.
+    List all unique styles found in ASS/SSA subtitle files, with the number of events of each.
 
-    This command helps you identify available styles before using
-    --include-styles or --exclude-styles options in the export command.
+    Only the style definitions and the Style column of the events are read, so
+    whole libraries can be audited quickly. This command helps you identify
+    available styles before using --include-styles or --exclude-styles options
+    in the export command.
 
     [bold]Examples:[/bold]
         pyasstosrt styles subtitle.ass
         pyasstosrt styles subtitle.ass --table
+        pyasstosrt styles *.ass --jobs 4
     """
+    if len(filepath) > 1:
+        _styles_many(filepath, table_format, jobs)
+        return
+
+    filepath = filepath[0]
     try:
         console.print(f"\n[bold cyan]🔍 Analyzing styles in:[/bold cyan] {filepath.name}\n")
 
-        sub = Subtitle(filepath)
-        style_list = sub.get_styles()
+        report = Subtitle(filepath).scan_styles()
 
-        if not style_list:
+        if not report.declared and not report.counts:
             console.print("[yellow]⚠ No styles found or file is in SRT format[/yellow]")
             console.print("[dim]Note: SRT files don't have style information[/dim]")
             return
 
-        if table_format:
-            # Display as a rich table
-            table = Table(title=f"Styles in {filepath.name}", show_header=True, header_style="bold cyan")
-            table.add_column("#", style="dim", width=6, justify="right")
-            table.add_column("Style Name", style="green")
-
-            for idx, style in enumerate(style_list, start=1):
-                table.add_row(str(idx), style)
-
-            console.print(table)
-        else:
-            # Display as a simple list
-            console.print(f"[bold blue]Styles found in {filepath.name}:[/bold blue]\n")
-            for idx, style in enumerate(style_list, start=1):
-                # Highlight "Default" styles
-                if "Default" in style:
-                    console.print(f"  {idx}. [bold green]{style}[/bold green] [dim](default)[/dim]")
-                else:
-                    console.print(f"  {idx}. [green]{style}[/green]")
-
-        console.print(f"\n[bold]Total:[/bold] [cyan]{len(style_list)}[/cyan] unique style(s)")
+        _print_style_list(report, filepath.name, table_format)
 
         # Show helpful tips
         console.print("\n[dim]💡 Tips:[/dim]")
@@ -332,5 +696,48 @@ def styles(
         raise typer.Exit(1) from e
 
 
+def _styles_many(filepath: List[Path], table_format: bool, jobs: Optional[int]):
+    console.print(f"\n[bold cyan]🔍 Analyzing styles in {len(filepath)} files[/bold cyan]\n")
+
+    jobs = jobs or os.cpu_count() or 1
+    files: Dict[str, int] = {}
+    events: Dict[str, int] = {}
+    error_count = 0
+    for report in iter_scan_styles(
+        filepath,
+        executor="process" if jobs > 1 else "serial",
+        max_workers=min(jobs, len(filepath)),
+    ):
+        if not report.ok:
+            error_count += 1
+            console.print(f"[red]✗[/red] {report.source.name}: {report.error}")
+            continue
+        for style in set(report.declared) | set(report.counts):
+            files[style] = files.get(style, 0) + 1
+            events[style] = events.get(style, 0) + report.counts.get(style, 0)
+        if not table_format:
+            used = ", ".join(f"{style} ({count})" for style, count in sorted(report.counts.items()))
+            console.print(f"[green]✓[/green] {report.source.name}: {used or '[dim]no styles[/dim]'}")
+
+    if files:
+        table = Table(title="Styles across files", show_header=True, header_style="bold cyan")
+        table.add_column("#", style="dim", width=6, justify="right")
+        table.add_column("Style Name", style="green")
+        table.add_column("Files", justify="right")
+        table.add_column("Events", justify="right")
+        for idx, style in enumerate(sorted(files), start=1):
+            table.add_row(str(idx), style, str(files[style]), str(events[style]))
+        console.print()
+        console.print(table)
+
+    console.print(
+        f"\n[bold]Total:[/bold] [cyan]{len(files)}[/cyan] unique style(s) in "
+        f"[cyan]{len(filepath) - error_count}[/cyan] file(s)"
+    )
+    if error_count > 0:
+        console.print(f"[red]{error_count} file(s) failed[/red]")
+        raise typer.Exit(1)
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,37 @@
+"""
+Benchmarks of pyasstosrt on synthetic workloads, with saved results and regression comparison.
+
+Run ``python -m pyasstosrt.bench --help`` for the command line interface.
+"""
+
+import importlib
+from typing import Any
+
+from .history import Comparison, collect_metadata, compare_results, load_results, save_results, slower_p_value
+
+# Imported on first use, so that ``python -m pyasstosrt.bench.workloads`` does not find its module already loaded
+_LAZY_ATTRIBUTES = {
+    "OPERATIONS": "suite",
+    "run_suite": "suite",
+    "WORKLOADS": "workloads",
+    "write_workload": "workloads",
+}
+
+__all__ = [
+    "OPERATIONS",
+    "WORKLOADS",
+    "Comparison",
+    "collect_metadata",
+    "compare_results",
+    "load_results",
+    "run_suite",
+    "save_results",
+    "slower_p_value",
+    "write_workload",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
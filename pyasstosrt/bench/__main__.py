@@ -0,0 +1,130 @@
+"""
+Benchmark pyasstosrt and compare the results with a saved baseline.
+
+Usage:
+
+    python -m pyasstosrt.bench [--workload NAME ...] [--operation NAME ...] [--file PATH ...]
+        [--scale N] [--seed N] [--repeat N] [--engine NAME] [--directory PATH]
+        [--output PATH] [--compare BASELINE] [--results PATH] [--alpha N] [--threshold N]
+
+Typical use before upgrading a pinned version:
+
+    python -m pyasstosrt.bench --file corpus/*.ass --output baseline.json
+    pip install --upgrade pyasstosrt
+    python -m pyasstosrt.bench --file corpus/*.ass --compare baseline.json
+
+The exit status is 1 when --compare finds a significant slowdown.
+"""
+
+import argparse
+import sys
+from typing import Any, Dict, List, Optional
+
+from ..engines import DEFAULT_ENGINE, ENGINES
+from .history import collect_metadata, compare_results, load_results, save_results
+from .suite import OPERATIONS, run_suite
+from .workloads import WORKLOADS
+
+
+def _describe(document: Dict[str, Any]) -> str:
+    metadata = document["metadata"]
+    commit = metadata.get("commit")
+    revision = f" ({commit['hash'][:12]}{', modified' if commit['dirty'] else ''})" if commit else ""
+    python = metadata["python"]
+    return (
+        f"pyasstosrt {metadata['pyasstosrt']}{revision}, {python['implementation']} {python['version']}, "
+        f"{metadata['machine']['node']} {metadata['machine']['machine']}, {metadata['created']}"
+    )
+
+
+def _print_comparison(baseline: Dict[str, Any], current: Dict[str, Any], alpha: float, threshold: float) -> bool:
+    print(f"\nBaseline: {_describe(baseline)}")
+    print(f"Current:  {_describe(current)}")
+    if baseline["parameters"] != current["parameters"]:
+        print(f"Warning: the runs used different parameters: {baseline['parameters']} and {current['parameters']}")
+    for key in ("python", "machine"):
+        if baseline["metadata"][key] != current["metadata"][key]:
+            print(f"Warning: the runs used a different {key}, differences may not come from pyasstosrt")
+
+    comparisons = compare_results(baseline, current, alpha, threshold)
+    print(f"\n{'workload':<16} {'operation':<9} {'baseline':>11} {'current':>11} {'change':>8} {'p':>7}  status")
+    for comparison in comparisons:
+        print(
+            f"{comparison.workload:<16} {comparison.operation:<9} {comparison.baseline * 1000:8.2f} ms"
+            f" {comparison.current * 1000:8.2f} ms {comparison.change:+8.1%} {comparison.p_value:7.4f}"
+            f"  {comparison.status}"
+        )
+    regressions = [comparison for comparison in comparisons if comparison.regression]
+    if regressions:
+        print(f"\n{len(regressions)} significant slowdown(s) at p < {alpha} and more than {threshold:.0%}")
+    else:
+        print(f"\nNo significant slowdowns at p < {alpha} and more than {threshold:.0%}")
+    return not regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arguments = argparse.ArgumentParser(
+        prog="python -m pyasstosrt.bench",
+        description=__doc__.strip().splitlines()[0],
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    arguments.add_argument(
+        "--workload",
+        choices=sorted(WORKLOADS),
+        nargs="*",
+        help="synthetic workloads to run, defaults to all of them unless --file is given",
+    )
+    arguments.add_argument("--operation", choices=OPERATIONS, nargs="+", default=list(OPERATIONS))
+    arguments.add_argument("--file", nargs="+", default=[], help="subtitle files to measure, such as your corpus")
+    arguments.add_argument("--scale", type=float, default=1.0, help="factor applied to the default workload sizes")
+    arguments.add_argument("--seed", type=int, default=0, help="seed of the workload generators")
+    arguments.add_argument("--repeat", type=int, default=5, help="number of timed runs of each operation")
+    arguments.add_argument("--engine", choices=sorted(ENGINES), default=DEFAULT_ENGINE, help="parser engine")
+    arguments.add_argument("--directory", help="keep the generated workloads in this directory")
+    arguments.add_argument("--output", help="save the results as JSON to this file or directory")
+    arguments.add_argument("--compare", metavar="BASELINE", help="compare the results with saved baseline results")
+    arguments.add_argument("--results", help="use saved results instead of running the benchmarks")
+    arguments.add_argument("--alpha", type=float, default=0.05, help="significance level of the comparison")
+    arguments.add_argument(
+        "--threshold", type=float, default=0.05, help="smallest relative slowdown to report, 0.05 is 5%%"
+    )
+    args = arguments.parse_args(argv)
+
+    if args.results:
+        current = load_results(args.results)
+    else:
+        workloads = args.workload
+        if workloads is None:
+            workloads = [] if args.file else list(WORKLOADS)
+        parameters = {
+            "workloads": workloads,
+            "operations": args.operation,
+            "files": args.file,
+            "scale": args.scale,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "engine": args.engine,
+        }
+        metadata = collect_metadata()
+        results = run_suite(
+            workloads,
+            args.operation,
+            args.scale,
+            args.seed,
+            args.repeat,
+            args.engine,
+            args.directory,
+            args.file,
+            log=print,
+        )
+        current = {"metadata": metadata, "parameters": parameters, "results": results}
+        if args.output:
+            print(f"Saved results to {save_results(args.output, results, parameters, metadata)}")
+
+    if args.compare:
+        return 0 if _print_comparison(load_results(args.compare), current, args.alpha, args.threshold) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
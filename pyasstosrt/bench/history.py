@@ -0,0 +1,242 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+# Bump when the layout of saved results changes
+RESULTS_FORMAT = 1
+
+
+def _git_commit() -> Optional[Dict[str, Any]]:
+    # Only a checkout of pyasstosrt itself, not a virtual environment that happens to be inside a repository
+    root = Path(__file__).resolve().parents[2]
+    try:
+        toplevel = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        if Path(toplevel).resolve() != root:
+            return None
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {"hash": commit, "dirty": bool(status.strip())}
+
+
+def collect_metadata() -> Dict[str, Any]:
+    """
+    Describe the environment a benchmark runs in.
+
+    :return: Time of the run, pyasstosrt version, git commit when run from a checkout,
+        interpreter and machine
+    :rtype: Dict[str, Any]
+    """
+    from .. import __version__
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "pyasstosrt": __version__,
+        "commit": _git_commit(),
+        "python": {
+            "implementation": platform.python_implementation(),
+            "version": platform.python_version(),
+            "compiler": platform.python_compiler(),
+        },
+        "machine": {
+            "node": platform.node(),
+            "system": platform.system(),
+            "release": platform.release(),
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cpus": os.cpu_count(),
+        },
+    }
+
+
+def save_results(
+    path: Union[str, os.PathLike],
+    results: List[Dict[str, Any]],
+    parameters: Dict[str, Any],
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Path:
+    """
+    Save benchmark results as JSON.
+
+    :param path: File to write, or a directory to add a file named after the time and commit to.
+        A path ending with a separator is created as a directory
+    :type path: Union[str, os.PathLike]
+    :param results: Results returned by :func:`~pyasstosrt.bench.suite.run_suite`
+    :type results: List[Dict[str, Any]]
+    :param parameters: Parameters the suite was run with
+    :type parameters: Dict[str, Any]
+    :param metadata: Environment of the run (optional, defaults to :func:`collect_metadata`)
+    :type metadata: Optional[Dict[str, Any]]
+    :return: Path of the written file
+    :rtype: Path
+    """
+    if metadata is None:
+        metadata = collect_metadata()
+    directory = str(path).endswith(("/", os.sep))
+    path = Path(path)
+    if directory or path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+        created = datetime.fromisoformat(metadata["created"]).strftime("%Y%m%d-%H%M%S")
+        revision = metadata["commit"]["hash"][:12] if metadata.get("commit") else metadata["pyasstosrt"]
+        path = path / f"{created}-{revision}.json"
+    document = {"format": RESULTS_FORMAT, "metadata": metadata, "parameters": parameters, "results": results}
+    path.write_text(json.dumps(document, indent=2), encoding="utf8")
+    return path
+
+
+def load_results(path: Union[str, os.PathLike]) -> Dict[str, Any]:
+    """
+    Load benchmark results saved by :func:`save_results`.
+
+    :param path: Path of the JSON file
+    :type path: Union[str, os.PathLike]
+    :return: Dictionary with the ``metadata``, ``parameters`` and ``results`` of the run
+    :rtype: Dict[str, Any]
+    :raises ValueError: If the file does not contain benchmark results in a known format
+    """
+    document = json.loads(Path(path).read_text(encoding="utf8"))
+    if not isinstance(document, dict) or document.get("format") != RESULTS_FORMAT:
+        raise ValueError(f'"{path}" does not contain benchmark results of format {RESULTS_FORMAT}')
+    return document
+
+
+def _u_distribution(m: int, n: int) -> List[int]:
+    # Number of orderings of m + n distinct values for each value of the Mann-Whitney U statistic,
+    # the coefficients of the Gaussian binomial coefficient [m + n choose m]
+    counts = [1]
+    for i in range(1, m + 1):
+        shift = n + i
+        product = counts + [0] * shift
+        for k, count in enumerate(counts):
+            product[k + shift] -= count
+        for k in range(i, len(product)):
+            product[k] += product[k - i]
+        counts = product
+    return counts[: m * n + 1]
+
+
+def slower_p_value(baseline: Sequence[float], current: Sequence[float]) -> float:
+    """
+    Probability of the current times being at least this much slower by chance.
+
+    This is the exact one-sided Mann-Whitney U test, which makes no assumption about the
+    distribution of the times. With ``n`` runs on each side the smallest possible value is
+    ``1 / binomial(2n, n)``, so at least 4 runs per side are needed to go below 0.05.
+
+    :param baseline: Times of the baseline runs
+    :type baseline: Sequence[float]
+    :param current: Times of the current runs
+    :type current: Sequence[float]
+    :return: One-sided p-value
+    :rtype: float
+    """
+    if not baseline or not current:
+        return 1.0
+    # Ties count half, rounding down only makes the test more conservative
+    u = int(sum((c > b) + 0.5 * (c == b) for b in baseline for c in current))
+    counts = _u_distribution(len(baseline), len(current))
+    return sum(counts[u:]) / sum(counts)
+
+
+@dataclass
+class Comparison:
+    """
+    Comparison of one workload and operation between a baseline and the current run.
+
+    :ivar workload: Name of the workload
+    :type workload: str
+    :ivar operation: Name of the operation
+    :type operation: str
+    :ivar baseline: Median time of the baseline runs in seconds
+    :type baseline: float
+    :ivar current: Median time of the current runs in seconds
+    :type current: float
+    :ivar p_value: One-sided p-value of the change in the direction it went
+    :type p_value: float
+    :ivar status: ``slower`` or ``faster`` for significant changes, ``unchanged`` otherwise,
+        ``incomparable`` when the input differs between the runs
+    :type status: str
+    """
+
+    workload: str
+    operation: str
+    baseline: float
+    current: float
+    p_value: float
+    status: str
+
+    @property
+    def change(self) -> float:
+        """Relative change of the median time, positive when the current run is slower."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    @property
+    def regression(self) -> bool:
+        """Whether the current run is significantly slower."""
+        return self.status == "slower"
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], alpha: float = 0.05, threshold: float = 0.05
+) -> List[Comparison]:
+    """
+    Compare benchmark results with a baseline.
+
+    A change is reported when it is both statistically significant (see :func:`slower_p_value`)
+    and larger than ``threshold``, so that noise and negligible differences are not flagged.
+    Workloads and operations missing from either run are left out.
+
+    :param baseline: Baseline results loaded with :func:`load_results`
+    :type baseline: Dict[str, Any]
+    :param current: Current results in the same form
+    :type current: Dict[str, Any]
+    :param alpha: Significance level
+    :type alpha: float
+    :param threshold: Smallest relative change of the median time to report, 0.05 is 5%
+    :type threshold: float
+    :return: One comparison per workload and operation present in both runs
+    :rtype: List[Comparison]
+    """
+    previous = {(result["workload"], result["operation"]): result for result in baseline["results"]}
+    comparisons = []
+    for result in current["results"]:
+        before = previous.get((result["workload"], result["operation"]))
+        if before is None:
+            continue
+        comparison = Comparison(
+            result["workload"],
+            result["operation"],
+            statistics.median(before["timings"]),
+            statistics.median(result["timings"]),
+            1.0,
+            "unchanged",
+        )
+        if (before["events"], before["bytes"]) != (result["events"], result["bytes"]):
+            comparison.status = "incomparable"
+        elif comparison.change > 0:
+            comparison.p_value = slower_p_value(before["timings"], result["timings"])
+            if comparison.p_value < alpha and comparison.change > threshold:
+                comparison.status = "slower"
+        elif comparison.change < 0:
+            comparison.p_value = slower_p_value(result["timings"], before["timings"])
+            if comparison.p_value < alpha and -comparison.change > threshold:
+                comparison.status = "faster"
+        comparisons.append(comparison)
+    return comparisons
@@ -0,0 +1,129 @@
+import importlib.util
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from ..engines import DEFAULT_ENGINE
+from ..pyasstosrt import Subtitle
+from .workloads import WORKLOADS, write_workload
+
+OPERATIONS = ("init", "convert", "export", "cli")
+
+
+def _operations(path: str, output_dir: str, engine: str) -> Dict[str, Callable[[], object]]:
+    # Every operation starts from a new Subtitle, so nothing is shared between runs
+    command = [sys.executable, "-c", "from pyasstosrt.batch import app; app()", "export", path, "-o", output_dir]
+    return {
+        "init": lambda: Subtitle(path, engine=engine),
+        "convert": lambda: Subtitle(path, engine=engine).convert(),
+        "export": lambda: Subtitle(path, engine=engine).export(output_dir),
+        "cli": lambda: subprocess.run([*command, "--engine", engine], check=True, stdout=subprocess.DEVNULL),
+    }
+
+
+def measure(function: Callable[[], object], repeat: int) -> List[float]:
+    """
+    Time a function, in batches long enough to be measured reliably.
+
+    The number of calls per batch is chosen so that a batch takes at least 0.2 seconds.
+
+    :param function: Function to time
+    :type function: Callable[[], object]
+    :param repeat: Number of timed batches
+    :type repeat: int
+    :return: Time per call of each batch in seconds
+    :rtype: List[float]
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+
+
+def run_suite(
+    workloads: Iterable[str] = tuple(WORKLOADS),
+    operations: Sequence[str] = OPERATIONS,
+    scale: float = 1.0,
+    seed: int = 0,
+    repeat: int = 5,
+    engine: str = DEFAULT_ENGINE,
+    directory: Optional[str] = None,
+    files: Iterable[str] = (),
+    log: Optional[Callable[[str], Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Measure loading, conversion, export and the CLI on synthetic workloads and subtitle files.
+
+    The CLI is run in a separate interpreter and includes its startup time, it is skipped
+    when typer is not installed.
+
+    :param workloads: Names of the synthetic workloads in :data:`~pyasstosrt.bench.workloads.WORKLOADS` to run
+    :type workloads: Iterable[str]
+    :param operations: Operations to measure, any of ``init``, ``convert``, ``export`` and ``cli``
+    :type operations: Sequence[str]
+    :param scale: Factor applied to the default number of events of each workload
+    :type scale: float
+    :param seed: Seed of the workload generators
+    :type seed: int
+    :param repeat: Number of timed runs of each operation
+    :type repeat: int
+    :param engine: Name of the parser engine
+    :type engine: str
+    :param directory: Directory to generate the workloads in, where they are kept for later runs
+        (optional, defaults to a temporary directory)
+    :type directory: Optional[str]
+    :param files: Paths of subtitle files to measure in addition to the workloads, such as your own corpus
+    :type files: Iterable[str]
+    :param log: Function called with a line of progress for every measurement (optional)
+    :type log: Optional[Callable[[str], Any]]
+    :return: One result per workload and operation, with the per-call times of every run in seconds
+    :rtype: List[Dict[str, Any]]
+    """
+    if "cli" in operations and importlib.util.find_spec("typer") is None:
+        if log is not None:
+            log("typer is not installed, skipping the CLI. Install pyasstosrt[cli] to measure it.")
+        operations = [operation for operation in operations if operation != "cli"]
+
+    with tempfile.TemporaryDirectory() as temporary:
+        if directory is None:
+            directory = temporary
+        sources = [(name, write_workload(name, directory, scale, seed)) for name in workloads]
+        sources.extend((os.path.basename(path), path) for path in files)
+
+        results = []
+        for name, path in sources:
+            size = os.path.getsize(path)
+            events = len(Subtitle(path, engine=engine).export(output_dialogues=True))
+            if log is not None:
+                log(f"{name}: {events:,} dialogues, {size / 1024 / 1024:.1f} MB")
+            with tempfile.TemporaryDirectory() as output_dir:
+                functions = _operations(path, output_dir, engine)
+                for operation in operations:
+                    timings = measure(functions[operation], repeat)
+                    results.append(
+                        {"workload": name, "operation": operation, "events": events, "bytes": size, "timings": timings}
+                    )
+                    if log is not None:
+                        log(format_result(results[-1]))
+    return results
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """
+    Format a result of :func:`run_suite` as a line with the time and throughput of the best run.
+
+    :param result: Result of a single workload and operation
+    :type result: Dict[str, Any]
+    :return: Formatted line
+    :rtype: str
+    """
+    best = min(result["timings"])
+    median = statistics.median(result["timings"])
+    line = f"  {result['operation']:>8}: {best * 1000:10.2f} ms (median {median * 1000:.2f})"
+    if result["operation"] != "init":
+        # Creating a Subtitle only checks that the file exists, so throughput means nothing there
+        line += f" {result['events'] / best:12,.0f} events/s {result['bytes'] / 1024 / 1024 / best:8.1f} MB/s"
+    return line
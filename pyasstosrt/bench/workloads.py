@@ -0,0 +1,232 @@
+"""
+Deterministic generators of large synthetic subtitle files for the benchmarks.
+
+Every workload is generated from a seeded random number generator, so the same name, size
+and seed always produce byte-identical files. Run this module to write them to a directory:
+
+    python -m pyasstosrt.bench.workloads DIRECTORY [--workload NAME ...] [--scale N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+from typing import Callable, Dict, Iterator, NamedTuple, Optional
+
+FONT_BYTES_PER_EVENT = 32 * 1024 * 1024 // 5_000
+
+# Two and a half hours, so the timestamps stay realistic however many events there are
+SPAN_CENTISECONDS = 9_000_00
+
+WORDS = (
+    "the you what this that know have just here there come right well think about going never want "
+    "really something tell need over back time little maybe people still before after again nothing "
+    "everyone tonight tomorrow remember listen wait sorry thank promise together forever alone"
+).split()
+SYLLABLES = "ka ki ku ke ko sa shi su se so ta chi tsu te to na ni nu ne no ha hi fu he ho ma mi mu me mo ra ri".split()
+
+SCRIPT_INFO = (
+    "[Script Info]\n"
+    "; Generated by pyasstosrt.bench\n"
+    "Title: {title}\n"
+    "ScriptType: v4.00+\n"
+    "WrapStyle: 0\n"
+    "PlayResX: 1920\n"
+    "PlayResY: 1080\n"
+    "ScaledBorderAndShadow: yes\n"
+    "\n"
+    "[V4+ Styles]\n"
+    "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, "
+    "Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, "
+    "MarginL, MarginR, MarginV, Encoding\n"
+)
+STYLE = (
+    "Style: {name},Arial,{size},&H00FFFFFF,&H000000FF,&H00000000,&H00000000,"
+    "0,0,0,0,100,100,0,0,1,2,1,{alignment},10,10,30,1\n"
+)
+EVENTS_HEADER = "\n[Events]\nFormat: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+
+
+def ass_time(centiseconds: int) -> str:
+    seconds, centiseconds = divmod(centiseconds, 100)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return "%d:%02d:%02d.%02d" % (hours, minutes, seconds, centiseconds)
+
+
+def srt_time(milliseconds: int) -> str:
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return "%02d:%02d:%02d,%03d" % (hours, minutes, seconds, milliseconds)
+
+
+def sentence(rng: random.Random, low: int = 3, high: int = 12) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+    return text[0].upper() + text[1:] + rng.choice((".", "?", "!", "...", ","))
+
+
+def header(title: str, styles: Dict[str, int]) -> Iterator[str]:
+    yield SCRIPT_INFO.format(title=title)
+    for name, alignment in styles.items():
+        yield STYLE.format(name=name, size=48 if alignment == 2 else 40, alignment=alignment)
+    yield EVENTS_HEADER
+
+
+def dialogue(events: int, rng: random.Random) -> Iterator[str]:
+    # Ordinary dialogue: two speaker styles, some italics and line breaks, in chronological order
+    yield from header("Dialogue", {"Default": 2, "Alt": 8})
+    step = SPAN_CENTISECONDS // max(events, 1)
+    for i in range(events):
+        start = i * step
+        text = sentence(rng)
+        if rng.random() < 0.3:
+            text += "\\N" + sentence(rng)
+        if rng.random() < 0.1:
+            text = "{\\i1}" + text + "{\\i0}"
+        style = "Alt" if rng.random() < 0.15 else "Default"
+        yield f"Dialogue: 0,{ass_time(start)},{ass_time(start + rng.randint(80, 400))},{style},,0,0,0,,{text}\n"
+
+
+def karaoke(events: int, rng: random.Random) -> Iterator[str]:
+    # Song lyrics where every syllable has its own {\k} timing tag, with a romaji and a translation line
+    yield from header("Karaoke", {"Romaji": 8, "Translation": 2})
+    step = SPAN_CENTISECONDS // max(events, 1)
+    for i in range(events):
+        start = i * step
+        end = start + rng.randint(300, 600)
+        if i % 2:
+            text = sentence(rng, 4, 10)
+            style = "Translation"
+        else:
+            syllables = [rng.choice(SYLLABLES) for _ in range(rng.randint(16, 32))]
+            text = "{\\fad(150,150)\\be1}" + "".join(f"{{\\k{rng.randint(8, 40)}}}{s}" for s in syllables)
+            style = "Romaji"
+        yield f"Dialogue: 0,{ass_time(start)},{ass_time(end)},{style},,0,0,0,karaoke,{text}\n"
+
+
+def fonts(events: int, rng: random.Random) -> Iterator[str]:
+    # A short script that embeds several fonts, uuencoded as Aegisub does it: 80 characters per line.
+    # The fonts grow with the script, 32 MB for the default 5,000 events
+    yield from dialogue(events, rng)
+    yield "\n[Fonts]\n"
+    encode = bytes(33 + i % 64 for i in range(256))
+    remaining = events * FONT_BYTES_PER_EVENT
+    for index in range(4):
+        yield f"fontname: embedded_{index}.ttf\n"
+        size = remaining // (4 - index)
+        remaining -= size
+        data = bytes(rng.getrandbits(8) for _ in range(4096)).translate(encode).decode("ascii")
+        lines = [data[offset : offset + 80] + "\n" for offset in range(0, len(data), 80)]
+        chunk = "".join(lines)
+        for _ in range(max(size // len(chunk), 1)):
+            yield chunk
+
+
+def typesetting(events: int, rng: random.Random) -> Iterator[str]:
+    # Signs in dozens of styles, with positioning, transforms and vector drawings, layered out of order
+    styles = {f"Sign-{index:02d}": 7 for index in range(40)}
+    styles.update(Default=2, Alt=8)
+    yield from header("Typesetting", styles)
+    names = list(styles)
+    for i in range(events):
+        start = rng.randrange(SPAN_CENTISECONDS)
+        end = start + rng.randint(50, 800)
+        kind = rng.random()
+        if kind < 0.4:
+            style, layer = "Default", 0
+            text = sentence(rng)
+        elif kind < 0.7:
+            style, layer = rng.choice(names[:40]), rng.randint(1, 5)
+            text = (
+                f"{{\\an7\\pos({rng.randint(0, 1920)},{rng.randint(0, 1080)})\\fscx{rng.randint(80, 120)}"
+                f"\\frz{rng.uniform(-15, 15):.2f}\\t(0,{rng.randint(100, 900)},\\alpha&HFF&)\\blur0.6}}"
+                + sentence(rng, 1, 4)
+            )
+        elif kind < 0.9:
+            style, layer = rng.choice(names[:40]), rng.randint(0, 3)
+            points = " ".join(f"l {rng.randint(0, 400)} {rng.randint(0, 300)}" for _ in range(rng.randint(6, 24)))
+            position = f"\\pos({rng.randint(0, 1500)},{rng.randint(0, 800)})"
+            text = f"{{\\an7{position}\\p1\\c&H{rng.getrandbits(24):06X}&}}m 0 0 {points}{{\\p0}}"
+        else:
+            style, layer = "Alt", 0
+            text = "{\\i1}" + sentence(rng) + "{\\i0}"
+        yield f"Dialogue: {layer},{ass_time(start)},{ass_time(end)},{style},,0,0,0,,{text}\n"
+        if rng.random() < 0.05:
+            yield f"Comment: 0,{ass_time(start)},{ass_time(end)},{style},,0,0,0,,TS note {i}\n"
+
+
+def srt(events: int, rng: random.Random) -> Iterator[str]:
+    # A large SubRip file with one or two lines per entry and some HTML-style formatting
+    step = SPAN_CENTISECONDS * 10 // max(events, 1)
+    for i in range(events):
+        start = i * step
+        text = sentence(rng)
+        if rng.random() < 0.3:
+            text += "\n" + sentence(rng)
+        if rng.random() < 0.05:
+            text = "<i>" + text + "</i>"
+        yield f"{i + 1}\n{srt_time(start)} --> {srt_time(start + rng.randint(800, 4000))}\n{text}\n\n"
+
+
+class Workload(NamedTuple):
+    generate: Callable[[int, random.Random], Iterator[str]]
+    events: int
+    suffix: str
+    description: str
+
+
+WORKLOADS: Dict[str, Workload] = {
+    "dialogue": Workload(dialogue, 100_000, ".ass", "chronological dialogue lines in two styles"),
+    "karaoke": Workload(karaoke, 40_000, ".ass", "lyrics with a {\\k} tag on every syllable"),
+    "fonts": Workload(fonts, 5_000, ".ass", "a short script with 32 MB of embedded [Fonts]"),
+    "typesetting": Workload(typesetting, 50_000, ".ass", "signs in 42 styles with drawings, out of order"),
+    "srt": Workload(srt, 100_000, ".srt", "SubRip entries of one or two lines"),
+}
+
+
+def write_workload(name: str, directory: str, scale: float = 1.0, seed: int = 0, events: Optional[int] = None) -> str:
+    """
+    Write a workload file, reusing it if it was already generated with the same parameters.
+
+    :param name: Name of the workload in :data:`WORKLOADS`
+    :type name: str
+    :param directory: Directory to write the file to, created if it does not exist
+    :type directory: str
+    :param scale: Factor applied to the default number of events of the workload
+    :type scale: float
+    :param seed: Seed of the random number generator
+    :type seed: int
+    :param events: Number of events, overrides ``scale`` (optional)
+    :type events: Optional[int]
+    :return: Path of the written file
+    :rtype: str
+    """
+    workload = WORKLOADS[name]
+    if events is None:
+        events = max(int(workload.events * scale), 1)
+    path = os.path.join(directory, f"{name}-{events}-{seed}{workload.suffix}")
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        rng = random.Random(f"{name}:{seed}")
+        partial = path + ".part"
+        with open(partial, "w", encoding="utf8", newline="\n") as file:
+            file.writelines(workload.generate(events, rng))
+        os.replace(partial, path)
+    return path
+
+
+def main():
+    arguments = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arguments.add_argument("directory", help="directory to write the files to")
+    arguments.add_argument("--workload", choices=sorted(WORKLOADS), nargs="+", default=list(WORKLOADS))
+    arguments.add_argument("--scale", type=float, default=1.0, help="factor applied to the default sizes")
+    arguments.add_argument("--seed", type=int, default=0, help="seed of the random number generator")
+    args = arguments.parse_args()
+
+    for name in args.workload:
+        path = write_workload(name, args.directory, args.scale, args.seed)
+        print(f"{name:>12}: {path} ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
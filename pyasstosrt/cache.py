@@ -0,0 +1,304 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from .manifest import file_digest
+
+if TYPE_CHECKING:
+    from .pyasstosrt import Subtitle
+
+CACHE_FORMAT = 1
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the default cache directory.
+
+    This is ``$PYASSTOSRT_CACHE_DIR`` if set, otherwise ``pyasstosrt`` inside
+    ``$XDG_CACHE_HOME`` (``~/.cache`` by default).
+
+    :return: Path to the cache directory
+    :rtype: Path
+    """
+    directory = os.environ.get("PYASSTOSRT_CACHE_DIR")
+    if directory:
+        return Path(directory)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pyasstosrt"
+
+
+class DiskCache:
+    """
+    Persistent cache of converted subtitles, addressed by the content of the source file.
+
+    Entries are keyed on the SHA-256 hash of the source bytes together with the conversion
+    options, so byte-identical files share one entry regardless of their name or location.
+    Each entry stores the converted dialogues and the styles of the file, which lets
+    :class:`~pyasstosrt.Subtitle` skip parsing on a hit.
+
+    The total size of the entries is bounded: when it exceeds ``max_size``, the least
+    recently used entries are removed. Entries are written atomically, so one cache
+    directory can be shared by several processes.
+
+    :param directory: Directory to store the entries in (optional, see :func:`default_cache_dir`)
+    :type directory: Optional[Union[str, os.PathLike]]
+    :param max_size: Maximum total size of the entries in bytes
+    :type max_size: int
+
+    :ivar directory: Directory the entries are stored in
+    :type directory: Path
+    :ivar max_size: Maximum total size of the entries in bytes
+    :type max_size: int
+
+    :Example:
+
+    >>> from pyasstosrt import DiskCache, Subtitle
+    >>> cache = DiskCache("~/.cache/subtitles", max_size=64 * 1024 * 1024)
+    >>> sub = Subtitle("path/to/subtitle.ass", removing_effects=True, cache=cache)
+    >>> sub.export()
+    """
+
+    def __init__(self, directory: Optional[Union[str, os.PathLike]] = None, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = Path(directory).expanduser() if directory else default_cache_dir()
+        self.max_size = max_size
+        self._size: Optional[int] = None
+
+    def key(self, source: Union[str, os.PathLike, bytes], options: Dict[str, Any]) -> str:
+        """
+        Compute the cache key of a source file converted with the given options.
+
+        :param source: Path to the subtitle file, or its content
+        :type source: Union[str, os.PathLike, bytes]
+        :param options: JSON serializable conversion options
+        :type options: Dict[str, Any]
+        :return: Hexadecimal key
+        :rtype: str
+        """
+        from . import __version__
+
+        digest = hashlib.sha256(source).hexdigest() if isinstance(source, bytes) else file_digest(source)
+        payload = json.dumps(
+            {"format": CACHE_FORMAT, "version": __version__, "options": options, "source": digest},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an entry and mark it as recently used.
+
+        :param key: Key returned by :meth:`key`
+        :type key: str
+        :return: The stored entry, or None if there is none or it cannot be read
+        :rtype: Optional[Dict[str, Any]]
+        """
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]):
+        """
+        Store an entry, evicting the least recently used ones if the cache grows too large.
+
+        :param key: Key returned by :meth:`key`
+        :type key: str
+        :param entry: JSON serializable entry
+        :type entry: Dict[str, Any]
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf8")
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(payload)
+            try:
+                # An existing entry under the same key is replaced, not added to
+                replaced = path.stat().st_size
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += len(payload) - replaced
+        if self._size > self.max_size:
+            self.evict()
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """
+        Return the total size of the entries in bytes.
+
+        :return: Size in bytes
+        :rtype: int
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits into ``max_size``.
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._size = total
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        for _, _, path in self._entries():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._size = 0
+
+
+class SubtitleCache:
+    """
+    In-memory LRU cache of converted :class:`~pyasstosrt.Subtitle` objects.
+
+    Subtitles are keyed on the absolute path of the file and the constructor options, and
+    each entry remembers the modification time and size of the file it was converted from.
+    A lookup costs a single ``stat`` call: when the file is unchanged the cached object is
+    returned, otherwise the file is converted again and the entry replaced.
+
+    The cache holds at most ``max_entries`` subtitles and at most ``max_bytes`` of source
+    files, measured by their size on disk; the least recently used entries are evicted
+    first. It can be shared between threads.
+
+    Cached subtitles are shared by all callers and should be treated as read-only.
+
+    :param max_entries: Maximum number of cached subtitles
+    :type max_entries: int
+    :param max_bytes: Maximum total size in bytes of the source files of the cached subtitles
+    :type max_bytes: int
+
+    :ivar hits: Number of lookups answered from the cache
+    :type hits: int
+    :ivar misses: Number of lookups that had to convert the file
+    :type misses: int
+
+    :Example:
+
+    >>> from pyasstosrt import SubtitleCache
+    >>> cache = SubtitleCache(max_entries=256)
+    >>> sub = cache.get("path/to/subtitle.ass", removing_effects=True)
+    >>> cache.hits, cache.misses
+    (0, 1)
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._entries: "OrderedDict[Tuple[str, Tuple], Tuple[int, int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: str, options: Dict[str, Any]) -> Tuple[str, Tuple]:
+        # The disk cache does not change the conversion result, so it is not part of the key
+        return path, tuple(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in sorted(options.items())
+            if name != "cache"
+        )
+
+    def get(self, filepath: Union[str, os.PathLike], **options: Any) -> "Subtitle":
+        """
+        Return the converted subtitles of a file, converting it only if it is not cached or has changed.
+
+        :param filepath: Path to a file that contains text in ASS or SRT format
+        :type filepath: Union[str, os.PathLike]
+        :param options: Keyword arguments passed to :class:`~pyasstosrt.Subtitle`
+        :return: A converted subtitle object shared with other callers
+        :rtype: Subtitle
+        :raises FileNotFoundError: If the specified file does not exist
+        """
+        from .pyasstosrt import Subtitle
+
+        path = os.path.abspath(filepath)
+        stat = os.stat(path)
+        key = self._key(path, options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        sub = Subtitle(path, **options)
+        sub.convert()
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, sub)
+            self._bytes += stat.st_size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, size, _) = self._entries.popitem(last=False)
+                self._bytes -= size
+        return sub
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the source files of the cached subtitles."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Remove all entries and reset the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+#: Cache used by :meth:`Subtitle.cached <pyasstosrt.Subtitle.cached>`
+default_subtitle_cache = SubtitleCache()
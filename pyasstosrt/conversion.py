@@ -0,0 +1,404 @@
+import cProfile
+import hashlib
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .dialogue import Dialogue
+from .pyasstosrt import Subtitle
+from .stats import ConversionStats
+from .styles import StyleReport
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+EXECUTORS = ("process", "thread", "serial")
+
+
+def peak_memory() -> Optional[int]:
+    """
+    Return the peak resident memory of the current process.
+
+    :return: Highest resident set size of the process so far in bytes, None where it is not available
+    :rtype: Optional[int]
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes everywhere except macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class ConversionResult:
+    """
+    Outcome of converting a single file with :func:`convert_many`.
+
+    :ivar source: Path to the converted subtitle file
+    :type source: Path
+    :ivar output: Path to the written SRT file, None if nothing was written
+    :type output: Optional[Path]
+    :ivar dialogue_count: Number of dialogues in the converted subtitles
+    :type dialogue_count: int
+    :ivar elapsed: Wall time spent on the conversion, in seconds
+    :type elapsed: float
+    :ivar error: Exception raised while converting, None on success
+    :type error: Optional[BaseException]
+    :ivar dialogues: Converted dialogues when ``output_dialogues`` was requested
+    :type dialogues: Optional[Sequence[Dialogue]]
+    :ivar stats: Measurements of each stage of the conversion when ``collect_stats`` was requested
+    :type stats: Optional[ConversionStats]
+    :ivar profile: Path to the cProfile dump of the conversion when ``profile_dir`` was given
+    :type profile: Optional[Path]
+    :ivar peak_memory: Peak resident memory in bytes of the process that converted the file, see
+        :func:`peak_memory`. It covers everything the process did before, so with a pool of
+        workers it is an upper bound for the file
+    :type peak_memory: Optional[int]
+    """
+
+    source: Path
+    output: Optional[Path] = None
+    dialogue_count: int = 0
+    elapsed: float = 0.0
+    error: Optional[BaseException] = None
+    dialogues: Optional[Sequence[Dialogue]] = None
+    stats: Optional[ConversionStats] = None
+    profile: Optional[Path] = None
+    peak_memory: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was converted without errors."""
+        return self.error is None
+
+
+def profile_path(profile_dir: Union[str, os.PathLike], source: Union[str, os.PathLike]) -> Path:
+    """
+    Return the path of the cProfile dump of a conversion.
+
+    The name is the file name followed by a short hash of the absolute path of the source, so
+    files with the same name from different directories get their own dump.
+
+    :param profile_dir: Directory of the dumps
+    :type profile_dir: Union[str, os.PathLike]
+    :param source: Path to the converted subtitle file
+    :type source: Union[str, os.PathLike]
+    :return: Path of the dump, e.g. ``profiles/episode01-3f2a9c1e.prof``
+    :rtype: Path
+    """
+    source = Path(source)
+    digest = hashlib.sha256(str(source.resolve()).encode("utf8")).hexdigest()[:8]
+    return Path(profile_dir) / f"{source.stem}-{digest}.prof"
+
+
+def convert_file(
+    path: Union[str, os.PathLike],
+    output_dir: Optional[Union[str, os.PathLike]] = None,
+    encoding: str = "utf8",
+    output_dialogues: bool = False,
+    collect_stats: bool = False,
+    profile_dir: Optional[Union[str, os.PathLike]] = None,
+    **options: Any,
+) -> ConversionResult:
+    """
+    Convert a single file and capture the outcome instead of raising.
+
+    :param path: Path to a file that contains text in ASS or SRT format
+    :type path: Union[str, os.PathLike]
+    :param output_dir: Export path for the SRT file (optional)
+    :type output_dir: Optional[Union[str, os.PathLike]]
+    :param encoding: Encoding to use when saving the file (default is UTF-8)
+    :type encoding: str
+    :param output_dialogues: Whether to return the dialogues instead of creating an SRT file
+    :type output_dialogues: bool
+    :param collect_stats: Whether to measure the stages of the conversion, see :class:`~pyasstosrt.ConversionStats`
+    :type collect_stats: bool
+    :param profile_dir: Directory to write a cProfile dump of the conversion to, named by
+        :func:`profile_path` (optional)
+    :type profile_dir: Optional[Union[str, os.PathLike]]
+    :param options: Keyword arguments passed to :class:`~pyasstosrt.Subtitle`. A ``stats`` object
+        given here collects the measurements and is returned in the result, as if ``collect_stats``
+        was set
+    :return: The conversion result
+    :rtype: ConversionResult
+    """
+    source = Path(path)
+    stats = options.pop("stats", None)
+    if stats is None and collect_stats:
+        stats = ConversionStats()
+    profiler = cProfile.Profile() if profile_dir is not None else None
+    profile = None
+    started = time.perf_counter()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        try:
+            sub = Subtitle(source, stats=stats, **options)
+            if output_dialogues:
+                dialogues = sub.export(output_dir, encoding, output_dialogues)
+                dialogue_count = len(dialogues)
+            else:
+                dialogues = None
+                dialogue_count = sub.save(output_dir, encoding)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                # Failed conversions are profiled too, a slow failure is worth a look as well
+                Path(profile_dir).mkdir(parents=True, exist_ok=True)
+                profile = profile_path(profile_dir, source)
+                profiler.dump_stats(profile)
+    except Exception as e:
+        return ConversionResult(
+            source,
+            elapsed=time.perf_counter() - started,
+            error=e,
+            stats=stats,
+            profile=profile,
+            peak_memory=peak_memory(),
+        )
+    return ConversionResult(
+        source,
+        output=None if output_dialogues else sub.output_path(output_dir),
+        dialogue_count=dialogue_count,
+        elapsed=time.perf_counter() - started,
+        dialogues=dialogues,
+        stats=stats,
+        profile=profile,
+        peak_memory=peak_memory(),
+    )
+
+
+def _make_executor(executor: str, max_workers: Optional[int]) -> Executor:
+    if executor == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown executor {executor!r}, expected one of {', '.join(EXECUTORS)}")
+
+
+def _iter_indexed(
+    paths: Sequence[Union[str, os.PathLike]],
+    executor: Union[str, Executor],
+    max_workers: Optional[int],
+    on_submit: Optional[Callable[[Path], None]],
+    kwargs: dict,
+    task: Callable[..., Any] = convert_file,
+    failure: Callable[..., Any] = ConversionResult,
+) -> Iterator[Tuple[int, Any]]:
+    if executor == "serial":
+        for index, path in enumerate(paths):
+            if on_submit is not None:
+                on_submit(Path(path))
+            yield index, task(path, **kwargs)
+        return
+
+    pool = executor if isinstance(executor, Executor) else _make_executor(executor, max_workers)
+    try:
+        futures = {}
+        for index, path in enumerate(paths):
+            if on_submit is not None:
+                on_submit(Path(path))
+            futures[pool.submit(task, path, **kwargs)] = index
+        for future in as_completed(futures):
+            # Let go of finished results, as_completed drops its own references too
+            index = futures.pop(future)
+            try:
+                yield index, future.result()
+            except Exception as e:
+                # The worker itself failed (e.g. a crashed process or an unpicklable result)
+                yield index, failure(Path(paths[index]), error=e)
+    finally:
+        if pool is not executor:
+            pool.shutdown(cancel_futures=True)
+
+
+def iter_convert_many(
+    paths: Iterable[Union[str, os.PathLike]],
+    output_dir: Optional[Union[str, os.PathLike]] = None,
+    encoding: str = "utf8",
+    output_dialogues: bool = False,
+    executor: Union[str, Executor] = "process",
+    max_workers: Optional[int] = None,
+    on_submit: Optional[Callable[[Path], None]] = None,
+    collect_stats: bool = False,
+    profile_dir: Optional[Union[str, os.PathLike]] = None,
+    **options: Any,
+) -> Iterator[ConversionResult]:
+    """
+    Convert many files concurrently and yield the results as they complete.
+
+    Errors never interrupt the iteration: they are reported in
+    :attr:`ConversionResult.error` of the file that caused them.
+
+    :param paths: Paths to files that contain text in ASS or SRT format
+    :type paths: Iterable[Union[str, os.PathLike]]
+    :param output_dir: Export path for the SRT files (optional, defaults to each source directory)
+    :type output_dir: Optional[Union[str, os.PathLike]]
+    :param encoding: Encoding to use when saving the files (default is UTF-8)
+    :type encoding: str
+    :param output_dialogues: Whether to return the dialogues instead of creating SRT files
+    :type output_dialogues: bool
+    :param executor: ``"process"``, ``"thread"``, ``"serial"`` or an existing
+        :class:`~concurrent.futures.Executor`, which is left running afterwards
+    :type executor: Union[str, Executor]
+    :param max_workers: Maximum number of workers of a newly created pool (optional)
+    :type max_workers: Optional[int]
+    :param on_submit: Called with each path when its conversion is scheduled (optional)
+    :type on_submit: Optional[Callable[[Path], None]]
+    :param collect_stats: Whether to measure the stages of each conversion in :attr:`ConversionResult.stats`
+    :type collect_stats: bool
+    :param profile_dir: Directory to write a cProfile dump of each conversion to (optional)
+    :type profile_dir: Optional[Union[str, os.PathLike]]
+    :param options: Keyword arguments passed to :class:`~pyasstosrt.Subtitle`
+    :return: Generator yielding results in completion order
+    :rtype: Iterator[ConversionResult]
+    :raises ValueError: If the executor name is unknown
+
+    :Example:
+
+    >>> from pyasstosrt import iter_convert_many
+    >>> for result in iter_convert_many(["a.ass", "b.ass"], executor="thread", removing_effects=True):
+    ...     print(result.source, result.ok)
+    """
+    if isinstance(executor, str) and executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor {executor!r}, expected one of {', '.join(EXECUTORS)}")
+    kwargs = dict(
+        options,
+        output_dir=output_dir,
+        encoding=encoding,
+        output_dialogues=output_dialogues,
+        collect_stats=collect_stats,
+        profile_dir=profile_dir,
+    )
+    for _, result in _iter_indexed(list(paths), executor, max_workers, on_submit, kwargs):
+        yield result
+
+
+def convert_many(
+    paths: Iterable[Union[str, os.PathLike]],
+    output_dir: Optional[Union[str, os.PathLike]] = None,
+    encoding: str = "utf8",
+    output_dialogues: bool = False,
+    executor: Union[str, Executor] = "process",
+    max_workers: Optional[int] = None,
+    collect_stats: bool = False,
+    profile_dir: Optional[Union[str, os.PathLike]] = None,
+    **options: Any,
+) -> List[ConversionResult]:
+    """
+    Convert many files concurrently and return the results in input order.
+
+    Takes the same arguments as :func:`iter_convert_many`.
+
+    :return: One result per path, in the order of ``paths``
+    :rtype: List[ConversionResult]
+    :raises ValueError: If the executor name is unknown
+
+    :Example:
+
+    >>> from pyasstosrt import convert_many
+    >>> results = convert_many(["a.ass", "b.ass"], output_dir="output", max_workers=4)
+    >>> failed = [result for result in results if not result.ok]
+    """
+    if isinstance(executor, str) and executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor {executor!r}, expected one of {', '.join(EXECUTORS)}")
+    paths = list(paths)
+    kwargs = dict(
+        options,
+        output_dir=output_dir,
+        encoding=encoding,
+        output_dialogues=output_dialogues,
+        collect_stats=collect_stats,
+        profile_dir=profile_dir,
+    )
+    results: List[Optional[ConversionResult]] = [None] * len(paths)
+    for index, result in _iter_indexed(paths, executor, max_workers, None, kwargs):
+        results[index] = result
+    return results
+
+
+def scan_file_styles(path: Union[str, os.PathLike]) -> StyleReport:
+    """
+    Scan the styles of a single file and capture errors instead of raising.
+
+    :param path: Path to a file that contains text in ASS or SRT format
+    :type path: Union[str, os.PathLike]
+    :return: The style report
+    :rtype: StyleReport
+    """
+    source = Path(path)
+    started = time.perf_counter()
+    try:
+        report = Subtitle(source).scan_styles()
+    except Exception as e:
+        return StyleReport(source, elapsed=time.perf_counter() - started, error=e)
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def iter_scan_styles(
+    paths: Iterable[Union[str, os.PathLike]],
+    executor: Union[str, Executor] = "process",
+    max_workers: Optional[int] = None,
+    on_submit: Optional[Callable[[Path], None]] = None,
+) -> Iterator[StyleReport]:
+    """
+    Scan the styles of many files concurrently and yield the reports as they complete.
+
+    Each file is read with :meth:`Subtitle.scan_styles <pyasstosrt.Subtitle.scan_styles>`,
+    so no dialogues are built. Errors are reported in :attr:`StyleReport.error`.
+
+    :param paths: Paths to files that contain text in ASS or SRT format
+    :type paths: Iterable[Union[str, os.PathLike]]
+    :param executor: ``"process"``, ``"thread"``, ``"serial"`` or an existing
+        :class:`~concurrent.futures.Executor`, which is left running afterwards
+    :type executor: Union[str, Executor]
+    :param max_workers: Maximum number of workers of a newly created pool (optional)
+    :type max_workers: Optional[int]
+    :param on_submit: Called with each path when its scan is scheduled (optional)
+    :type on_submit: Optional[Callable[[Path], None]]
+    :return: Generator yielding reports in completion order
+    :rtype: Iterator[StyleReport]
+    :raises ValueError: If the executor name is unknown
+    """
+    if isinstance(executor, str) and executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor {executor!r}, expected one of {', '.join(EXECUTORS)}")
+    for _, report in _iter_indexed(
+        list(paths), executor, max_workers, on_submit, {}, task=scan_file_styles, failure=StyleReport
+    ):
+        yield report
+
+
+def scan_styles(
+    paths: Iterable[Union[str, os.PathLike]],
+    executor: Union[str, Executor] = "process",
+    max_workers: Optional[int] = None,
+) -> List[StyleReport]:
+    """
+    Scan the styles of many files concurrently and return the reports in input order.
+
+    Takes the same arguments as :func:`iter_scan_styles`.
+
+    :return: One report per path, in the order of ``paths``
+    :rtype: List[StyleReport]
+    :raises ValueError: If the executor name is unknown
+
+    :Example:
+
+    >>> from pyasstosrt import scan_styles
+    >>> for report in scan_styles(["a.ass", "b.ass"], max_workers=4):
+    ...     print(report.source, report.counts)
+    """
+    if isinstance(executor, str) and executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor {executor!r}, expected one of {', '.join(EXECUTORS)}")
+    paths = list(paths)
+    reports: List[Optional[StyleReport]] = [None] * len(paths)
+    for index, report in _iter_indexed(paths, executor, max_workers, None, {}, scan_file_styles, StyleReport):
+        reports[index] = report
+    return reports
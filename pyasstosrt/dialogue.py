@@ -1,3 +1,5 @@
+from typing import Union
+
 from .time import Time
 
 
@@ -10,10 +12,10 @@ class Dialogue:
 
     :param index: The position of the dialogue in the subtitle file
     :type index: int
-    :param start: The start time of the dialogue
-    :type start: str
-    :param end: The end time of the dialogue
-    :type end: str
+    :param start: The start time of the dialogue as an ASS timestamp or in milliseconds
+    :type start: Union[str, int, Time]
+    :param end: The end time of the dialogue as an ASS timestamp or in milliseconds
+    :type end: Union[str, int, Time]
     :param text: The text content of the dialogue
     :type text: str
 
@@ -27,22 +29,24 @@ class Dialogue:
     :type index: int
     """
 
-    def __init__(self, index: int, start: str, end: str, text: str):
+    __slots__ = ("index", "start", "end", "text")
+
+    def __init__(self, index: int, start: Union[str, int, Time], end: Union[str, int, Time], text: str):
         """
         Initialize a Dialogue instance.
 
         :param index: The position of the dialogue in the subtitle file
         :type index: int
-        :param start: The start time of the dialogue
-        :type start: str
-        :param end: The end time of the dialogue
-        :type end: str
+        :param start: The start time of the dialogue as an ASS timestamp or in milliseconds
+        :type start: Union[str, int, Time]
+        :param end: The end time of the dialogue as an ASS timestamp or in milliseconds
+        :type end: Union[str, int, Time]
         :param text: The text content of the dialogue
         :type text: str
         """
         self.index = index
-        self.start = Time(start)
-        self.end = Time(end)
+        self.start = start if isinstance(start, Time) else Time(start)
+        self.end = end if isinstance(end, Time) else Time(end)
         self.text = text
 
     def get_timestamp(self) -> str:
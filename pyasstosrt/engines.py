@@ -0,0 +1,144 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+from . import parser
+
+
+class ParserEngine(ABC):
+    """
+    Interface of the parsers that read dialogue events out of ASS and SRT sources.
+
+    An engine only turns text into raw events; style filtering, timestamp conversion, sorting
+    and formatting are done by :class:`~pyasstosrt.Subtitle` and are the same for every engine.
+    Subclasses set :attr:`name` and implement both methods, and can be made selectable by name
+    with :func:`register_engine`. A subclass missing one of them cannot be instantiated.
+
+    :Example:
+
+    >>> from pyasstosrt import Subtitle
+    >>> sub = Subtitle("path/to/subtitle.ass", engine="regex")
+    """
+
+    #: Name used to select the engine, e.g. ``Subtitle(..., engine="scanner")``
+    name: str = ""
+
+    @abstractmethod
+    def iter_ass_events(
+        self, source: parser.Source, encoding: str = "utf8", sections: Optional[parser.SectionIndex] = None
+    ) -> Iterator[Tuple[str, str, str, str]]:
+        """
+        Parse the dialogue events of ASS/SSA subtitles.
+
+        :param source: Path to a file, text stream or any iterable of lines in ASS format
+        :type source: Union[str, os.PathLike, Iterable[str]]
+        :param encoding: Encoding used when ``source`` is a path
+        :type encoding: str
+        :param sections: Index returned by :func:`~pyasstosrt.parser.index_sections` when ``source`` is a path
+        :type sections: Optional[Dict[str, List[Tuple[int, int]]]]
+        :return: Generator yielding (start, end, style, text) tuples in file order
+        :rtype: Iterator[Tuple[str, str, str, str]]
+        """
+
+    @abstractmethod
+    def iter_srt_entries(self, source: parser.Source, encoding: str = "utf8") -> Iterator[Tuple[str, str, str]]:
+        """
+        Parse the entries of SRT subtitles.
+
+        :param source: Path to a file, text stream or any iterable of lines in SRT format
+        :type source: Union[str, os.PathLike, Iterable[str]]
+        :param encoding: Encoding used when ``source`` is a path
+        :type encoding: str
+        :return: Generator yielding (start, end, text) tuples with SRT timestamps, in file order
+        :rtype: Iterator[Tuple[str, str, str]]
+        """
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class ScannerEngine(ParserEngine):
+    """
+    Scanner that splits each line by the columns of the Format line.
+
+    It does not backtrack and accepts any column order, which makes it the fastest engine and
+    the most tolerant of unusual files. This is the default engine.
+
+    Rather than stepping through the characters one at a time, which is slow in Python, it finds
+    the column separators with a single bounded :meth:`str.split` per line and SRT blocks with a
+    line reader, so the character scanning runs in C.
+    """
+
+    name = "scanner"
+
+    def iter_ass_events(
+        self, source: parser.Source, encoding: str = "utf8", sections: Optional[parser.SectionIndex] = None
+    ) -> Iterator[Tuple[str, str, str, str]]:
+        return parser.iter_ass_events(source, encoding, sections)
+
+    def iter_srt_entries(self, source: parser.Source, encoding: str = "utf8") -> Iterator[Tuple[str, str, str]]:
+        return parser.iter_srt_entries(source, encoding)
+
+
+class RegexEngine(ParserEngine):
+    """
+    Regular expression parser matching each dialogue line against a fixed pattern.
+
+    It expects the standard ASS column order and reads SRT documents as a whole. Lines that do
+    not match the pattern exactly are skipped, so it can be used as a stricter fallback when
+    the scanner misreads a malformed file.
+    """
+
+    name = "regex"
+
+    def iter_ass_events(
+        self, source: parser.Source, encoding: str = "utf8", sections: Optional[parser.SectionIndex] = None
+    ) -> Iterator[Tuple[str, str, str, str]]:
+        return parser.iter_ass_events_regex(source, encoding, sections)
+
+    def iter_srt_entries(self, source: parser.Source, encoding: str = "utf8") -> Iterator[Tuple[str, str, str]]:
+        return parser.iter_srt_entries_regex(source, encoding)
+
+
+DEFAULT_ENGINE = ScannerEngine.name
+
+ENGINES: Dict[str, ParserEngine] = {}
+
+
+def register_engine(engine: ParserEngine):
+    """
+    Make a parser engine selectable by its name.
+
+    A previously registered engine with the same name is replaced.
+
+    :param engine: Engine instance with a non-empty :attr:`~ParserEngine.name`
+    :type engine: ParserEngine
+    :raises ValueError: If the engine has no name
+    """
+    if not engine.name:
+        raise ValueError("Parser engines must have a name")
+    ENGINES[engine.name] = engine
+
+
+def get_engine(engine: Union[str, ParserEngine, None] = None) -> ParserEngine:
+    """
+    Resolve a parser engine from its name.
+
+    :param engine: Name of a registered engine or an engine instance, which is returned as is.
+        None selects the default engine
+    :type engine: Union[str, ParserEngine, None]
+    :return: The parser engine
+    :rtype: ParserEngine
+    :raises ValueError: If no engine is registered under the given name
+    """
+    if engine is None:
+        engine = DEFAULT_ENGINE
+    if isinstance(engine, ParserEngine):
+        return engine
+    try:
+        return ENGINES[engine]
+    except KeyError:
+        raise ValueError(f'Unknown parser engine "{engine}", expected one of: {", ".join(sorted(ENGINES))}') from None
+
+
+register_engine(ScannerEngine())
+register_engine(RegexEngine())
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+MANIFEST_NAME = ".pyasstosrt-manifest.json"
+MANIFEST_FORMAT = 1
+
+
+def file_digest(path: Union[str, os.PathLike], chunk_size: int = 1 << 20) -> str:
+    """
+    Compute the SHA-256 digest of a file, reading it in chunks.
+
+    :param path: Path to the file
+    :type path: Union[str, os.PathLike]
+    :param chunk_size: Number of bytes read at a time
+    :type chunk_size: int
+    :return: Hexadecimal digest
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Manifest:
+    """
+    Record of converted sources kept next to the SRT files, used to skip up-to-date conversions.
+
+    For every source the manifest stores its size, modification time and SHA-256 digest,
+    the output path and the options used for the conversion. A source is up to date when
+    its output still exists, it was converted with the same options and version of
+    pyasstosrt, and either its size and modification time are unchanged or, if only the
+    modification time changed, its content hash is.
+
+    :param path: Path to the manifest file
+    :type path: Union[str, os.PathLike]
+    :param version: Version of pyasstosrt that produces the outputs, a different version invalidates all entries
+    :type version: str
+
+    :ivar path: Path to the manifest file
+    :type path: Path
+    :ivar entries: Recorded conversions, keyed by absolute source path
+    :type entries: Dict[str, Dict[str, Any]]
+
+    :Example:
+
+    >>> manifest = Manifest.for_directory("output", version="1.5.0")
+    >>> if not manifest.is_up_to_date(source, output, options):
+    ...     Subtitle(source, **options).export("output")
+    ...     manifest.record(source, output, options)
+    >>> manifest.save()
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], version: str):
+        self.path = Path(path)
+        self.version = version
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    @classmethod
+    def for_directory(cls, directory: Union[str, os.PathLike], version: str) -> "Manifest":
+        """
+        Open the manifest stored in an output directory.
+
+        :param directory: Output directory of the SRT files
+        :type directory: Union[str, os.PathLike]
+        :param version: Version of pyasstosrt that produces the outputs
+        :type version: str
+        :return: The manifest, empty if the directory has none yet
+        :rtype: Manifest
+        """
+        return cls(Path(directory) / MANIFEST_NAME, version)
+
+    def load(self):
+        """
+        Load the entries from disk. Missing, unreadable or outdated manifests start out empty.
+        """
+        try:
+            data = json.loads(self.path.read_text(encoding="utf8"))
+        except (OSError, ValueError):
+            return
+        if data.get("format") == MANIFEST_FORMAT and data.get("version") == self.version:
+            self.entries = data.get("entries", {})
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return str(path.resolve())
+
+    def is_up_to_date(self, source: Union[str, os.PathLike], output: Union[str, os.PathLike], options: Dict) -> bool:
+        """
+        Check whether a source needs to be converted again.
+
+        :param source: Path to the subtitle file
+        :type source: Union[str, os.PathLike]
+        :param output: Path to the SRT file it is converted to
+        :type output: Union[str, os.PathLike]
+        :param options: JSON serializable conversion options
+        :type options: Dict
+        :return: True if the recorded output is still valid
+        :rtype: bool
+        """
+        source = Path(source)
+        entry = self.entries.get(self._key(source))
+        if entry is None or entry["options"] != options or entry["output"] != self._key(Path(output)):
+            return False
+        if not os.path.isfile(output):
+            return False
+        stat = source.stat()
+        if stat.st_size != entry["size"]:
+            return False
+        if stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        if file_digest(source) != entry["sha256"]:
+            return False
+        # Touched but unchanged: remember the new time to skip hashing next time
+        entry["mtime_ns"] = stat.st_mtime_ns
+        self._dirty = True
+        return True
+
+    def record(
+        self,
+        source: Union[str, os.PathLike],
+        output: Union[str, os.PathLike],
+        options: Dict,
+        digest: Optional[str] = None,
+    ):
+        """
+        Record a successful conversion.
+
+        :param source: Path to the subtitle file
+        :type source: Union[str, os.PathLike]
+        :param output: Path to the SRT file it was converted to
+        :type output: Union[str, os.PathLike]
+        :param options: JSON serializable conversion options
+        :type options: Dict
+        :param digest: SHA-256 digest of the source if already known (optional)
+        :type digest: Optional[str]
+        """
+        source = Path(source)
+        stat = source.stat()
+        self.entries[self._key(source)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest or file_digest(source),
+            "options": options,
+            "output": self._key(Path(output)),
+        }
+        self._dirty = True
+
+    def save(self):
+        """
+        Write the manifest atomically if it changed since it was loaded.
+        """
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"format": MANIFEST_FORMAT, "version": self.version, "entries": self.entries}
+        # A temporary file of its own, so concurrent runs on the same directory cannot clash
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf8") as file:
+                file.write(json.dumps(data, indent=1, sort_keys=True))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._dirty = False
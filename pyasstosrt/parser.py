@@ -0,0 +1,464 @@
+import mmap
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+dialog_mask = re.compile(r"Dialogue: \d+?,(\d:\d{2}:\d{2}.\d{2}),(\d:\d{2}:\d{2}.\d{2}),(.*?),.*?,\d+,\d+,\d+,.*?,(.*)")
+cleaning_old_format = re.compile(r"{.*?}")
+srt_timecode = re.compile(r"(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*")
+srt_entry_pattern = re.compile(
+    r"^\d+\s*$\s+"
+    r"^(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*$\s+"
+    r"((?:^(?!\d+\s*$).+$\s*)*)",
+    re.MULTILINE,
+)
+
+EVENTS_SECTION = "[events]"
+STYLES_SECTIONS = ("[v4+ styles]", "[v4 styles]", "[v4 styles+]")
+# Sections holding uuencoded binary attachments rather than text
+BINARY_SECTIONS = ("[fonts]", "[graphics]")
+STYLE_PREFIX = "Style:"
+DIALOGUE_PREFIX = "Dialogue:"
+FORMAT_PREFIX = "Format:"
+# Column order used by files that have no Format line in [Events]
+DEFAULT_EVENT_FORMAT = ("layer", "start", "end", "style", "name", "marginl", "marginr", "marginv", "effect", "text")
+
+
+Source = Union[str, os.PathLike, Iterable[str]]
+SectionIndex = Dict[str, List[Tuple[int, int]]]
+
+
+def iter_lines(source: Source, encoding: str = "utf8") -> Iterator[str]:
+    """
+    Iterate over the lines of a file path or an already opened text stream.
+
+    Files opened from a path are closed once the iteration is exhausted.
+
+    :param source: Path to a file, text stream or any iterable of lines
+    :type source: Union[str, os.PathLike, Iterable[str]]
+    :param encoding: Encoding used when ``source`` is a path
+    :type encoding: str
+    :return: Generator yielding lines including their line terminators
+    :rtype: Iterator[str]
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding=encoding) as stream:
+            yield from stream
+    else:
+        yield from source
+
+
+def _map_file(file) -> Union[mmap.mmap, bytes]:
+    if os.fstat(file.fileno()).st_size == 0:
+        return b""
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _next_header(data: Union[mmap.mmap, bytes], position: int) -> int:
+    found = data.find(b"\n[", position)
+    return found + 1 if found >= 0 else -1
+
+
+def index_sections(path: Union[str, os.PathLike]) -> SectionIndex:
+    """
+    Build an index of the sections of an ASS document and their byte ranges.
+
+    The file is scanned as raw bytes for lines starting with ``[``, without decoding it, so
+    large embedded ``[Fonts]`` and ``[Graphics]`` payloads cost little more than reading
+    them. The header line itself is not part of the range of its section.
+
+    :param path: Path to the file
+    :type path: Union[str, os.PathLike]
+    :return: Dictionary mapping lowercased header lines, e.g. ``"[events]"``, to the list of
+        (start, end) byte offsets of the sections with that header
+    :rtype: Dict[str, List[Tuple[int, int]]]
+
+    :Example:
+
+    >>> index_sections("subtitle.ass")["[events]"]
+    [(1830, 912455)]
+    """
+    sections: SectionIndex = {}
+    with open(path, "rb") as file:
+        data = _map_file(file)
+        try:
+            size = len(data)
+            header = None
+            content_start = 0
+            position = 3 if data[:3] == b"\xef\xbb\xbf" else 0
+            if data[position : position + 1] != b"[":
+                position = _next_header(data, position)
+            while position >= 0:
+                line_end = data.find(b"\n", position)
+                if line_end < 0:
+                    line_end = size
+                if header is not None:
+                    sections.setdefault(header, []).append((content_start, position))
+                header = data[position:line_end].strip().decode("utf8", "replace").lower()
+                content_start = min(line_end + 1, size)
+                position = _next_header(data, line_end)
+            if header is not None:
+                sections.setdefault(header, []).append((content_start, size))
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+    return sections
+
+
+def iter_section_lines(
+    path: Union[str, os.PathLike], header: str, encoding: str = "utf8", sections: Optional[SectionIndex] = None
+) -> Iterator[str]:
+    """
+    Iterate over the lines of the sections of a file with the given header, skipping everything else.
+
+    Only the bytes of the matching sections are read and decoded. Line terminators are
+    normalized to ``\\n`` like in text mode. The encoding must be ASCII compatible.
+
+    :param path: Path to the file
+    :type path: Union[str, os.PathLike]
+    :param header: Section header, e.g. ``"[Events]"`` (case-insensitive)
+    :type header: str
+    :param encoding: Encoding of the file
+    :type encoding: str
+    :param sections: Index returned by :func:`index_sections` (optional, built if not given)
+    :type sections: Optional[Dict[str, List[Tuple[int, int]]]]
+    :return: Generator yielding lines including their line terminators
+    :rtype: Iterator[str]
+    """
+    if sections is None:
+        sections = index_sections(path)
+    ranges = sections.get(header.lower())
+    if not ranges:
+        return
+    with open(path, "rb") as file:
+        for start, end in ranges:
+            file.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                line = file.readline(remaining)
+                if not line:
+                    break
+                remaining -= len(line)
+                if line.endswith(b"\r\n"):
+                    line = line[:-2] + b"\n"
+                yield line.decode(encoding)
+
+
+def has_srt_timecode(
+    path: Union[str, os.PathLike], encoding: str = "utf8", sections: Optional[SectionIndex] = None
+) -> bool:
+    """
+    Check whether any line of a file contains an SRT timecode (``00:00:00,000 --> 00:00:00,000``).
+
+    The file is searched as raw bytes and only the lines around each ``-->`` are decoded
+    and matched. If a section index is given, the ``[Fonts]`` and ``[Graphics]`` sections
+    are not searched at all.
+
+    :param path: Path to the file
+    :type path: Union[str, os.PathLike]
+    :param encoding: Encoding of the file, must be ASCII compatible
+    :type encoding: str
+    :param sections: Index returned by :func:`index_sections` (optional)
+    :type sections: Optional[Dict[str, List[Tuple[int, int]]]]
+    :return: True if a timecode was found
+    :rtype: bool
+    """
+    with open(path, "rb") as file:
+        data = _map_file(file)
+        try:
+            skipped = sorted(span for header in BINARY_SECTIONS for span in (sections or {}).get(header, ()))
+            searched_from = 0
+            for start, end in [*skipped, (len(data), len(data))]:
+                if _find_srt_timecode(data, searched_from, start, encoding):
+                    return True
+                searched_from = max(searched_from, end)
+            return False
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+
+def _find_srt_timecode(data: Union[mmap.mmap, bytes], start: int, end: int, encoding: str) -> bool:
+    position = data.find(b"-->", start, end)
+    while position >= 0:
+        line_start = data.rfind(b"\n", 0, position) + 1
+        line_end = data.find(b"\n", position)
+        if line_end < 0:
+            line_end = len(data)
+        if srt_timecode.search(data[line_start:line_end].decode(encoding, "replace")):
+            return True
+        position = data.find(b"-->", line_end, end)
+    return False
+
+
+class EventFormat:
+    """
+    Column layout of the events of an ASS document, as declared by its ``Format:`` line.
+
+    :param columns: Column names in the order they appear in ``Dialogue:`` lines
+    :type columns: Iterable[str]
+    :raises ValueError: If the Start, End, Style or Text column is missing
+    """
+
+    __slots__ = ("columns", "start", "end", "style", "text", "splits")
+
+    def __init__(self, columns: Iterable[str] = DEFAULT_EVENT_FORMAT):
+        self.columns: List[str] = [column.strip().lower() for column in columns]
+        try:
+            self.start = self.columns.index("start")
+            self.end = self.columns.index("end")
+            self.style = self.columns.index("style")
+            self.text = self.columns.index("text")
+        except ValueError as e:
+            raise ValueError(f"Event format {self.columns} lacks a required column") from e
+        # Text is the last column by definition and may contain commas itself
+        self.splits = len(self.columns) - 1
+
+    @classmethod
+    def from_line(cls, line: str) -> "EventFormat":
+        """
+        Create the layout from a ``Format:`` line.
+
+        :param line: The line, including the ``Format:`` prefix
+        :type line: str
+        :return: The column layout
+        :rtype: EventFormat
+        """
+        return cls(line[len(FORMAT_PREFIX) :].split(","))
+
+    @property
+    def layout(self) -> Tuple[int, int, int, int, int]:
+        """
+        The number of splits of a ``Dialogue:`` line and the indices of its Start, End, Style and Text columns.
+        """
+        return self.splits, self.start, self.end, self.style, self.text
+
+
+def iter_ass_events(
+    source: Source, encoding: str = "utf8", sections: Optional[SectionIndex] = None
+) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Incrementally parse dialogue events from an ASS document.
+
+    Lines are consumed one at a time, so a file object can be passed directly and the
+    memory footprint stays flat regardless of the size of the input. When a path is given,
+    only the ``[Events]`` sections found by :func:`index_sections` are read. Only ``Dialogue:``
+    lines inside the ``[Events]`` section are examined. Each of them is split once, in
+    linear time, using the column positions declared by the section's ``Format:`` line
+    (the standard ASS layout if there is none), so non-standard column orders and SSA
+    files are supported. A ``Format:`` line that lacks one of the Start, End, Style and
+    Text columns is ignored. Override tags (``{...}``) are stripped before the line is split.
+    Lines with too few columns are skipped; timestamps are returned as they appear and are
+    validated when they are converted.
+
+    :param source: Path to a file, text stream or any iterable of lines in ASS format
+    :type source: Union[str, os.PathLike, Iterable[str]]
+    :param encoding: Encoding used when ``source`` is a path
+    :type encoding: str
+    :param sections: Index returned by :func:`index_sections` when ``source`` is a path (optional)
+    :type sections: Optional[Dict[str, List[Tuple[int, int]]]]
+    :return: Generator yielding (start, end, style, text) tuples in file order
+    :rtype: Iterator[Tuple[str, str, str, str]]
+    """
+    if isinstance(source, (str, os.PathLike)):
+        # Seek straight to the [Events] sections instead of reading fonts, graphics and styles
+        return _parse_events(iter_section_lines(source, EVENTS_SECTION, encoding, sections), True)
+    return _parse_events(source, False)
+
+
+def _parse_events(lines: Iterable[str], in_events: bool) -> Iterator[Tuple[str, str, str, str]]:
+    event_format = EventFormat()
+    splits, start, end, style, text = event_format.layout
+    prefix_length = len(DIALOGUE_PREFIX)
+    for line in lines:
+        if line.startswith("["):
+            in_events = line.strip().lower() == EVENTS_SECTION
+            continue
+        if not in_events:
+            continue
+        if line.startswith(DIALOGUE_PREFIX):
+            if "{" in line:
+                line = cleaning_old_format.sub("", line)
+            fields = line[prefix_length:].split(",", splits)
+            if len(fields) > splits:
+                value = fields[text]
+                yield fields[start], fields[end], fields[style], value[:-1] if value[-1:] == "\n" else value
+        elif line.startswith(FORMAT_PREFIX):
+            try:
+                event_format = EventFormat.from_line(line)
+            except ValueError:
+                event_format = EventFormat()
+            splits, start, end, style, text = event_format.layout
+
+
+def iter_ass_events_regex(
+    source: Source, encoding: str = "utf8", sections: Optional[SectionIndex] = None
+) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Parse dialogue events by matching every line against :data:`dialog_mask`.
+
+    This is the previous implementation of :func:`iter_ass_events`, used by the ``regex``
+    parser engine. It assumes the standard column order and backtracks over each line.
+
+    :param source: Path to a file, text stream or any iterable of lines in ASS format
+    :type source: Union[str, os.PathLike, Iterable[str]]
+    :param encoding: Encoding used when ``source`` is a path
+    :type encoding: str
+    :param sections: Index returned by :func:`index_sections` when ``source`` is a path (optional)
+    :type sections: Optional[Dict[str, List[Tuple[int, int]]]]
+    :return: Generator yielding (start, end, style, text) tuples in file order
+    :rtype: Iterator[Tuple[str, str, str, str]]
+    """
+    in_events = isinstance(source, (str, os.PathLike))
+    lines = iter_section_lines(source, EVENTS_SECTION, encoding, sections) if in_events else source
+    for line in lines:
+        if line.startswith("["):
+            in_events = line.strip().lower() == EVENTS_SECTION
+            continue
+        if not in_events or not line.startswith(DIALOGUE_PREFIX):
+            continue
+        match = dialog_mask.match(cleaning_old_format.sub("", line))
+        if match:
+            yield match.groups()
+
+
+def _lines_of_sections(
+    source: Source, headers: Tuple[str, ...], encoding: str, sections: Optional[SectionIndex]
+) -> Iterator[str]:
+    if isinstance(source, (str, os.PathLike)):
+        if sections is None:
+            sections = index_sections(source)
+        for header in headers:
+            yield from iter_section_lines(source, header, encoding, sections)
+        return
+    inside = False
+    for line in source:
+        if line.startswith("["):
+            inside = line.strip().lower() in headers
+        elif inside:
+            yield line
+
+
+def iter_style_names(source: Source, encoding: str = "utf8", sections: Optional[SectionIndex] = None) -> Iterator[str]:
+    """
+    Iterate over the names of the styles declared in the ``[V4+ Styles]`` (or SSA ``[V4 Styles]``) section.
+
+    Only the Name column of each ``Style:`` line is extracted, at the position given by the
+    section's ``Format:`` line.
+
+    :param source: Path to a file, text stream or any iterable of lines in ASS format
+    :type source: Union[str, os.PathLike, Iterable[str]]
+    :param encoding: Encoding used when ``source`` is a path
+    :type encoding: str
+    :param sections: Index returned by :func:`index_sections` when ``source`` is a path (optional)
+    :type sections: Optional[Dict[str, List[Tuple[int, int]]]]
+    :return: Generator yielding style names in declaration order
+    :rtype: Iterator[str]
+    """
+    name = 0
+    prefix_length = len(STYLE_PREFIX)
+    for line in _lines_of_sections(source, STYLES_SECTIONS, encoding, sections):
+        if line.startswith(STYLE_PREFIX):
+            yield line[prefix_length:].split(",", name + 1)[name].strip()
+        elif line.startswith(FORMAT_PREFIX):
+            columns = [column.strip().lower() for column in line[len(FORMAT_PREFIX) :].split(",")]
+            name = columns.index("name") if "name" in columns else 0
+
+
+def count_event_styles(
+    source: Source, encoding: str = "utf8", sections: Optional[SectionIndex] = None
+) -> Dict[str, int]:
+    """
+    Count the ``Dialogue:`` events of each style without parsing the rest of the events.
+
+    Only the Style column is extracted from each line, at the position declared by the
+    ``Format:`` line of ``[Events]``. Lines with fewer columns than declared are not counted.
+
+    :param source: Path to a file, text stream or any iterable of lines in ASS format
+    :type source: Union[str, os.PathLike, Iterable[str]]
+    :param encoding: Encoding used when ``source`` is a path
+    :type encoding: str
+    :param sections: Index returned by :func:`index_sections` when ``source`` is a path (optional)
+    :type sections: Optional[Dict[str, List[Tuple[int, int]]]]
+    :return: Dictionary mapping style names to the number of events using them
+    :rtype: Dict[str, int]
+    """
+    counts: Dict[str, int] = {}
+    splits, _, _, style, _ = EventFormat().layout
+    prefix_length = len(DIALOGUE_PREFIX)
+    for line in _lines_of_sections(source, (EVENTS_SECTION,), encoding, sections):
+        if line.startswith(DIALOGUE_PREFIX):
+            if line.count(",") >= splits:
+                name = line[prefix_length:].split(",", style + 1)[style].strip()
+                counts[name] = counts.get(name, 0) + 1
+        elif line.startswith(FORMAT_PREFIX):
+            try:
+                splits, _, _, style, _ = EventFormat.from_line(line).layout
+            except ValueError:
+                splits, _, _, style, _ = EventFormat().layout
+    return counts
+
+
+def iter_srt_entries_regex(source: Source, encoding: str = "utf8") -> Iterator[Tuple[str, str, str]]:
+    """
+    Parse SRT entries by matching :data:`srt_entry_pattern` against the whole document.
+
+    This is the previous implementation of :func:`iter_srt_entries`, used by the ``regex``
+    parser engine. The document is read into memory first, and entries are yielded in the
+    same form as :func:`iter_srt_entries`.
+
+    :param source: Path to a file, text stream or any iterable of lines in SRT format
+    :type source: Union[str, os.PathLike, Iterable[str]]
+    :param encoding: Encoding used when ``source`` is a path
+    :type encoding: str
+    :return: Generator yielding (start, end, text) tuples with SRT timestamps, in file order
+    :rtype: Iterator[Tuple[str, str, str]]
+    """
+    text = "".join(iter_lines(source, encoding))
+    for start, end, body in srt_entry_pattern.findall(text):
+        yield start, end, " ".join(line.strip() for line in body.strip().split("\n") if line.strip())
+
+
+def _is_srt_index(line: str) -> bool:
+    # Equivalent to ``^\d+\s*$``: digits at the very start of the line, optional trailing whitespace
+    return line[:1].isdecimal() and line.rstrip().isdecimal()
+
+
+def iter_srt_entries(source: Source, encoding: str = "utf8") -> Iterator[Tuple[str, str, str]]:
+    """
+    Incrementally parse entries from an SRT document block by block.
+
+    Only the entry being assembled is kept in memory. An entry starts with a line holding
+    the subtitle number, followed by a timecode line; every following line up to the next
+    number line belongs to its text. Blank lines inside the text are skipped and the
+    remaining lines are stripped and joined with a single space. Subtitle numbers are
+    ignored, and blocks with malformed timecodes are skipped.
+
+    :param source: Path to a file, text stream or any iterable of lines in SRT format
+    :type source: Union[str, os.PathLike, Iterable[str]]
+    :param encoding: Encoding used when ``source`` is a path
+    :type encoding: str
+    :return: Generator yielding (start, end, text) tuples with SRT timestamps, in file order
+    :rtype: Iterator[Tuple[str, str, str]]
+    """
+    timecodes = None
+    text_lines = []
+    expect_timecode = False
+    for line in iter_lines(source, encoding):
+        if _is_srt_index(line):
+            if timecodes is not None:
+                yield timecodes[0], timecodes[1], " ".join(text_lines)
+                timecodes = None
+                text_lines = []
+            expect_timecode = True
+        elif timecodes is not None:
+            stripped = line.strip()
+            if stripped:
+                text_lines.append(stripped)
+        elif expect_timecode and line.strip():
+            match = srt_timecode.fullmatch(line)
+            if match:
+                timecodes = match.groups()
+            expect_timecode = False
+    if timecodes is not None:
+        yield timecodes[0], timecodes[1], " ".join(text_lines)
@@ -1,9 +1,50 @@
+import asyncio
+import io
+import itertools
 import os
 import re
+import tempfile
+from concurrent.futures import Executor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
-from typing import Any, Generator, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    ContextManager,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+from . import parser, timing
+from .cache import DiskCache, default_subtitle_cache
 from .dialogue import Dialogue
+from .engines import DEFAULT_ENGINE, ParserEngine, get_engine
+from .stats import ConversionStats, StageStats
+from .styles import StyleReport
+from .table import DialogueTable
+from .time import ass_to_ms, srt_to_ms
+from .writer import DEFAULT_BUFFER_SIZE, SrtWriter
+
+T = TypeVar("T")
+
+# Temporary files are created private, the output gets the permissions a plain open() would give it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class _OutOfOrder(Exception):
+    pass
 
 
 class Subtitle:
@@ -25,17 +66,31 @@ class Subtitle:
     :type include_styles: Optional[List[str]]
     :param exclude_styles: List of styles to exclude (if specified, these styles will be filtered out)
     :type exclude_styles: Optional[List[str]]
+    :param compact: Store dialogues in a columnar :class:`~pyasstosrt.table.DialogueTable` instead of a list,
+        which uses far less memory on large files
+    :type compact: bool
+    :param cache: Cache to look up converted dialogues in before parsing the file, and to store them in after
+    :type cache: Optional[DiskCache]
+    :param engine: Parser engine, either the name of a registered engine (``"scanner"`` or ``"regex"``)
+        or a :class:`~pyasstosrt.engines.ParserEngine` instance (default is ``"scanner"``)
+    :type engine: Union[str, ParserEngine]
+    :param stats: Collects the time, item counts and bytes of each stage of conversion and export (optional)
+    :type stats: Optional[ConversionStats]
 
     :raises FileNotFoundError: If the specified file does not exist
+    :raises ValueError: If no parser engine is registered under the given name
 
-    :ivar filepath: The path to the input subtitle file
-    :type filepath: Path
+    :ivar filepath: The path to the input subtitle file, None for subtitles created with
+        :meth:`from_string`, :meth:`from_bytes` or :meth:`from_stream`
+    :type filepath: Optional[Path]
     :ivar file: The stem (filename without extension) of the input file
     :type file: str
-    :ivar raw_text: The raw content of the input file
+    :ivar raw_text: The raw content of the input file, read lazily on first access. Assigning it
+        replaces the content that is converted
     :type raw_text: str
-    :ivar dialogues: List of :class:`~pyasstosrt.dialogue.Dialogue` objects representing the subtitles
-    :type dialogues: List[Dialogue]
+    :ivar dialogues: List of :class:`~pyasstosrt.dialogue.Dialogue` objects representing the subtitles,
+        or a :class:`~pyasstosrt.table.DialogueTable` when ``compact`` is enabled
+    :type dialogues: Union[List[Dialogue], DialogueTable]
     :ivar removing_effects: Flag indicating whether to remove effects from the text
     :type removing_effects: bool
     :ivar is_remove_duplicates: Flag indicating whether to remove and merge consecutive duplicate dialogues
@@ -46,6 +101,12 @@ class Subtitle:
     :type include_styles: Optional[List[str]]
     :ivar exclude_styles: List of styles to exclude (if specified, these styles will be filtered out)
     :type exclude_styles: Optional[List[str]]
+    :ivar cache: Cache of converted dialogues, if any
+    :type cache: Optional[DiskCache]
+    :ivar engine: Parser engine used to read the events, assigning a name selects a registered engine
+    :type engine: ParserEngine
+    :ivar stats: Measurements of the conversion stages, if any
+    :type stats: Optional[ConversionStats]
 
     :Example:
 
@@ -55,9 +116,7 @@ class Subtitle:
     >>> sub.export("output/directory", encoding="utf-8")
     """
 
-    dialog_mask = re.compile(
-        r"Dialogue: \d+?,(\d:\d{2}:\d{2}.\d{2}),(\d:\d{2}:\d{2}.\d{2}),(.*?),.*?,\d+,\d+,\d+,.*?,(.*)"
-    )
+    dialog_mask = parser.dialog_mask
     effects = re.compile(r"(\s?[ml].+?(-?\d+(\.\d+)?).+?(-?\d+(\.\d+)?).+)")
     srt_pattern = re.compile(r"(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})")
 
@@ -69,19 +128,214 @@ class Subtitle:
         only_default_style: bool = False,
         include_styles: Optional[List[str]] = None,
         exclude_styles: Optional[List[str]] = None,
+        compact: bool = False,
+        cache: Optional[DiskCache] = None,
+        engine: Union[str, ParserEngine] = DEFAULT_ENGINE,
+        stats: Optional[ConversionStats] = None,
     ):
-        self.filepath = Path(filepath)
+        self.filepath: Optional[Path] = Path(filepath)
         if not self.filepath.is_file():
             raise FileNotFoundError(f'"{self.filepath}" does not exist')
-        self.file: str = self.filepath.stem
-        self.raw_text: str = self.get_text()
-        self.dialogues: List[Dialogue] = []
+        self._init_state(
+            self.filepath.name,
+            None,
+            removing_effects,
+            remove_duplicates,
+            only_default_style,
+            include_styles,
+            exclude_styles,
+            compact,
+            cache,
+            engine,
+            stats,
+        )
+
+    def _init_state(
+        self,
+        name: str,
+        text: Optional[str],
+        removing_effects: bool = False,
+        remove_duplicates: bool = False,
+        only_default_style: bool = False,
+        include_styles: Optional[List[str]] = None,
+        exclude_styles: Optional[List[str]] = None,
+        compact: bool = False,
+        cache: Optional[DiskCache] = None,
+        engine: Union[str, ParserEngine] = DEFAULT_ENGINE,
+        stats: Optional[ConversionStats] = None,
+    ):
+        self.file: str = Path(name).stem
+        self._suffix: str = Path(name).suffix.lower()
+        self._raw_text: Optional[str] = text
+        # The file conversion reads from, None once the text is held in memory only
+        self._source: Optional[Path] = self.filepath
+        self._stream: Optional[Iterator[str]] = None
+        self._stream_srt: Optional[bool] = None
+        self._sections: Optional[parser.SectionIndex] = None
+        self._conversion: Optional[Tuple] = None
+        self._compact: bool = compact
+        self.dialogues: Union[List[Dialogue], DialogueTable] = DialogueTable() if compact else []
         self.styles: List[str] = []
         self.removing_effects: bool = removing_effects
         self.is_remove_duplicates: bool = remove_duplicates
         self.only_default_style: bool = only_default_style
         self.include_styles: Optional[List[str]] = include_styles
         self.exclude_styles: Optional[List[str]] = exclude_styles
+        self.cache: Optional[DiskCache] = cache
+        self.engine = engine
+        self.stats: Optional[ConversionStats] = stats
+
+    @classmethod
+    def from_string(cls, text: str, name: str = "subtitle.ass", **kwargs: Any) -> "Subtitle":
+        """
+        Create subtitles from text held in memory, without a file on disk.
+
+        :param text: Subtitles in ASS or SRT format
+        :type text: str
+        :param name: File name used for the SRT file written by :meth:`export`; an ``.srt``
+            extension marks the text as SRT, otherwise the format is detected from the content
+        :type name: str
+        :param kwargs: Keyword arguments passed to the constructor
+        :return: A new :class:`Subtitle` with :attr:`filepath` set to None
+        :rtype: Subtitle
+
+        :Example:
+
+        >>> sub = Subtitle.from_string(request_body, name="episode.ass", remove_duplicates=True)
+        >>> dialogues = sub.export(output_dialogues=True)
+        """
+        sub = cls.__new__(cls)
+        sub.filepath = None
+        sub._init_state(name, text, **kwargs)
+        return sub
+
+    @classmethod
+    def from_bytes(cls, data: bytes, name: str = "subtitle.ass", encoding: str = "utf8", **kwargs: Any) -> "Subtitle":
+        """
+        Create subtitles from encoded bytes held in memory.
+
+        :param data: Subtitles in ASS or SRT format
+        :type data: bytes
+        :param name: File name, see :meth:`from_string`
+        :type name: str
+        :param encoding: Encoding of the data (default is UTF-8)
+        :type encoding: str
+        :param kwargs: Keyword arguments passed to the constructor
+        :return: A new :class:`Subtitle` with :attr:`filepath` set to None
+        :rtype: Subtitle
+        """
+        return cls.from_string(data.decode(encoding), name, **kwargs)
+
+    @classmethod
+    def from_stream(
+        cls,
+        stream: Union[TextIO, BinaryIO],
+        name: Optional[str] = None,
+        encoding: str = "utf8",
+        buffered: bool = True,
+        **kwargs: Any,
+    ) -> "Subtitle":
+        """
+        Create subtitles from a text or binary file-like object, such as an uploaded file.
+
+        By default the whole stream is read immediately. With ``buffered=False`` it is instead
+        read line by line while :meth:`export` or :meth:`iter_dialogues` run, so a pipe can be
+        converted while it is still being written. Such a stream can only be converted once,
+        and unless the name has an ``.srt`` extension the format is told from its first
+        non-blank line: a subtitle number means SRT, anything else ASS. Methods that need
+        the whole content, such as :meth:`get_text` or :meth:`scan_styles`, read the rest of
+        the stream into memory first.
+
+        :param stream: Readable stream with subtitles in ASS or SRT format
+        :type stream: Union[TextIO, BinaryIO]
+        :param name: File name, see :meth:`from_string` (optional, defaults to the name of the stream if it has one)
+        :type name: Optional[str]
+        :param encoding: Encoding of binary streams (default is UTF-8)
+        :type encoding: str
+        :param buffered: Whether to read the whole stream into memory right away
+        :type buffered: bool
+        :param kwargs: Keyword arguments passed to the constructor
+        :return: A new :class:`Subtitle` with :attr:`filepath` set to None
+        :rtype: Subtitle
+
+        :Example:
+
+        >>> import sys
+        >>> sub = Subtitle.from_stream(sys.stdin.buffer, buffered=False)
+        >>> sub.export(stream=sys.stdout.buffer, sort=False)
+        """
+        if name is None:
+            stream_name = getattr(stream, "name", None)
+            name = os.path.basename(stream_name) if isinstance(stream_name, str) else "subtitle.ass"
+        if not buffered:
+            sub = cls.__new__(cls)
+            sub.filepath = None
+            sub._init_state(name, None, **kwargs)
+            if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(stream, "mode", ""):
+                stream = io.TextIOWrapper(stream, encoding=encoding)
+            sub._stream = iter(stream)
+            return sub
+        data = stream.read()
+        if isinstance(data, bytes):
+            return cls.from_bytes(data, name, encoding, **kwargs)
+        return cls.from_string(data, name, **kwargs)
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """
+        The options that affect the conversion result.
+
+        :return: Dictionary of option names and values, as passed to the constructor
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "removing_effects": self.removing_effects,
+            "remove_duplicates": self.is_remove_duplicates,
+            "only_default_style": self.only_default_style,
+            "include_styles": self.include_styles,
+            "exclude_styles": self.exclude_styles,
+            "engine": self.engine.name,
+        }
+
+    @property
+    def engine(self) -> ParserEngine:
+        return self._engine
+
+    @engine.setter
+    def engine(self, engine: Union[str, ParserEngine]):
+        self._engine = get_engine(engine)
+
+    def _options_key(self) -> Tuple:
+        # Hashable snapshot of the options, so later in-place changes to the style lists are noticed
+        return tuple((name, tuple(value) if isinstance(value, list) else value) for name, value in self.options.items())
+
+    @property
+    def _converted(self) -> bool:
+        return self._conversion is not None and self._conversion == self._options_key()
+
+    @classmethod
+    def cached(cls, filepath: Union[str, os.PathLike], **kwargs: Any) -> "Subtitle":
+        """
+        Return converted subtitles from the shared in-memory cache.
+
+        Repeated calls for an unchanged file with the same options return the same object
+        after a single ``stat`` call, without reading or parsing the file again. See
+        :class:`~pyasstosrt.cache.SubtitleCache` for the eviction policy and counters.
+        The returned object is shared and should not be modified.
+
+        :param filepath: Path to a file that contains text in ASS or SRT format
+        :type filepath: Union[str, os.PathLike]
+        :param kwargs: Keyword arguments passed to the constructor
+        :return: A converted :class:`Subtitle`
+        :rtype: Subtitle
+        :raises FileNotFoundError: If the specified file does not exist
+
+        :Example:
+
+        >>> sub = Subtitle.cached("path/to/subtitle.ass", remove_duplicates=True)
+        >>> dialogues = sub.dialogues
+        """
+        return default_subtitle_cache.get(filepath, **kwargs)
 
     def get_text(self) -> str:
         """
@@ -90,7 +344,84 @@ class Subtitle:
         :return: File contents as a string
         :rtype: str
         """
-        return self.filepath.read_text(encoding="utf8")
+        if self._source is None:
+            self._read_stream()
+            return self._raw_text
+        return self._source.read_text(encoding="utf8")
+
+    @property
+    def raw_text(self) -> str:
+        """
+        The complete contents of the file, read on first access.
+
+        Conversion streams the file line by line and never needs this attribute, so large
+        files are only loaded into memory when it is accessed explicitly.
+
+        Assigning new text replaces the source: the converted dialogues and styles are
+        forgotten and the next conversion reads the assigned text instead of the file.
+
+        :return: File contents as a string
+        :rtype: str
+        """
+        if self._raw_text is None:
+            self._raw_text = self.get_text()
+        return self._raw_text
+
+    @raw_text.setter
+    def raw_text(self, text: str):
+        # Replaces the source: conversions read this text from now on, the file is only used to name the output
+        self._raw_text = text
+        self._source = None
+        self._stream = None
+        self._stream_srt = None
+        self.invalidate()
+
+    def open_text(self) -> TextIO:
+        """
+        Open the file as a text stream for incremental reading.
+
+        :return: Text stream positioned at the beginning of the file
+        :rtype: TextIO
+        """
+        if self._source is None:
+            self._read_stream()
+            return io.StringIO(self._raw_text, newline=None)
+        return open(self._source, encoding="utf8")
+
+    def _read_stream(self):
+        # Reads the rest of a lazily read stream into memory, for anything that needs more than one pass
+        if self._stream is not None:
+            self._raw_text = "".join(self._read_lines(self._stream))
+            self._stream = None
+        elif self._raw_text is None:
+            raise ValueError("The stream of this subtitle has already been read")
+
+    def _measure(self, name: str) -> ContextManager[Optional[StageStats]]:
+        # Measures a block as a stage when stats are collected, checked once per stage rather than per item
+        return nullcontext() if self.stats is None else self.stats.measure(name)
+
+    def _stage(self, name: str, iterable: Iterable[T], nbytes: int = 0) -> Iterable[T]:
+        return iterable if self.stats is None else self.stats.iterate(name, iterable, nbytes)
+
+    def _input_size(self) -> int:
+        # Only worked out when stats are collected, lazily read streams are counted by the read stage
+        if self._source is not None:
+            return self._source.stat().st_size
+        return len(self._raw_text.encode("utf8")) if self._raw_text is not None else 0
+
+    def _read_lines(self, stream: Iterable[str]) -> Iterable[str]:
+        if self.stats is None:
+            return stream
+        return self.stats.iterate("read", stream, size=lambda line: len(line.encode("utf8")))
+
+    def _memory_lines(self) -> Iterable[str]:
+        # A lazily read stream is handed out only once, text held in memory can be read again
+        if self._stream is not None:
+            stream, self._stream = self._stream, None
+            return self._read_lines(stream)
+        self._read_stream()
+        # Newlines are translated like in a file opened from its path, so CRLF text parses the same
+        return io.StringIO(self._raw_text, newline=None)
 
     def get_styles(self) -> List[str]:
         """
@@ -102,11 +433,50 @@ class Subtitle:
         :return: List of unique style names found in the file
         :rtype: List[str]
         """
-        if not self.styles:
+        if not self._converted:
             self.convert()
 
         return self.styles
 
+    def scan_styles(self) -> StyleReport:
+        """
+        Report the declared styles and the number of events of each style without converting.
+
+        Only the ``[V4+ Styles]`` section and the Style column of ``[Events]`` are read, so
+        this is much cheaper than :meth:`get_styles` on large files: no dialogues are built
+        and no timestamps are parsed. SRT files have no styles and give an empty report.
+
+        :return: The style report of the file
+        :rtype: StyleReport
+
+        :Example:
+
+        >>> from pyasstosrt import Subtitle
+        >>> report = Subtitle("path/to/subtitle.ass").scan_styles()
+        >>> report.counts
+        {'Default': 412, 'Signs': 18}
+        """
+        report = StyleReport(self.filepath)
+        if self.is_srt_format():
+            return report
+        if self._source is None:
+            with self.open_text() as file:
+                report.declared = list(parser.iter_style_names(file))
+            with self.open_text() as file:
+                report.counts = parser.count_event_styles(file)
+        else:
+            sections = self._index_sections()
+            report.declared = list(parser.iter_style_names(self._source, sections=sections))
+            report.counts = parser.count_event_styles(self._source, sections=sections)
+        return report
+
+    def _index_sections(self) -> parser.SectionIndex:
+        # Byte offsets of the sections, shared by format detection and parsing
+        if self._sections is None:
+            with self._measure("index"):
+                self._sections = parser.index_sections(self._source)
+        return self._sections
+
     def is_srt_format(self) -> bool:
         """
         Determines if the file is in SRT format.
@@ -114,7 +484,25 @@ class Subtitle:
         :return: True if the file is in SRT format, False otherwise
         :rtype: bool
         """
-        return self.filepath.suffix.lower() == ".srt" or bool(self.srt_pattern.search(self.raw_text))
+        if self._suffix == ".srt":
+            return True
+        if self._stream is not None or self._stream_srt is not None:
+            return self._peek_srt()
+        if self._raw_text is not None:
+            return bool(self.srt_pattern.search(self._raw_text))
+        return parser.has_srt_timecode(self._source, sections=self._index_sections())
+
+    def _peek_srt(self) -> bool:
+        # A lazily read stream cannot be searched, so its format is told from the first non-blank line
+        if self._stream_srt is None:
+            peeked = []
+            for line in self._stream:
+                peeked.append(line)
+                if line.strip():
+                    break
+            self._stream = itertools.chain(peeked, self._stream)
+            self._stream_srt = bool(peeked) and peeked[-1].strip().lstrip("\ufeff").isdigit()
+        return self._stream_srt
 
     def convert(self):
         """
@@ -122,12 +510,92 @@ class Subtitle:
 
         This method processes the raw text, applies any necessary filters (like removing effects),
         and prepares the dialogues for formatting. Automatically detects ASS or SRT format.
+        When a :attr:`cache` is set, the dialogues are loaded from it instead if the same
+        content was already converted with the same options.
+
+        The result is kept until the options change: calling this method again, or any method
+        that needs the converted dialogues, does not parse the file again. Options are compared
+        on every call, so changing them (including the style lists in place) makes the next
+        call convert from scratch. Use :meth:`invalidate` when the source file itself changed.
         """
+        key = self._options_key()
+        if self._conversion == key:
+            return
+        self._reset()
+        if self.cache is None:
+            self._convert()
+        else:
+            # The format is detected from the suffix first, so identical content may convert differently
+            options = dict(self.options, srt_suffix=self._suffix == ".srt")
+            source = self._source if self._source is not None else self.get_text().encode("utf8")
+            with self._measure("cache"):
+                cache_key = self.cache.key(source, options)
+                entry = self.cache.get(cache_key)
+                if entry is not None:
+                    self._from_cache_entry(entry)
+            if entry is None:
+                self._convert()
+                with self._measure("cache"):
+                    self.cache.put(cache_key, self._to_cache_entry())
+        self._conversion = key
+
+    def _reset(self):
+        self.dialogues = DialogueTable() if self._compact else []
+        self.styles = []
+        self._conversion = None
+
+    def invalidate(self):
+        """
+        Forget the converted dialogues and styles, so that the next conversion reads the source again.
+
+        Changing the options is detected automatically; this is needed when the file was modified
+        on disk. Retiming done with :meth:`shift`, :meth:`scale`, :meth:`retime_fps` or :meth:`clip`
+        is discarded as well.
+
+        :Example:
+
+        >>> sub = Subtitle("path/to/subtitle.ass")
+        >>> sub.export()
+        >>> # ... the file is edited ...
+        >>> sub.invalidate()
+        >>> sub.export()
+        """
+        self._reset()
+        self._sections = None
+
+    def _convert(self):
         if self.is_srt_format():
             self._convert_srt()
         else:
             self._convert_ass()
 
+    def _to_cache_entry(self) -> Dict[str, Any]:
+        if isinstance(self.dialogues, DialogueTable):
+            index, start, end, text = (
+                self.dialogues.index,
+                self.dialogues.start,
+                self.dialogues.end,
+                self.dialogues.text,
+            )
+        else:
+            index = [dialogue.index for dialogue in self.dialogues]
+            start = [dialogue.start.total_milliseconds for dialogue in self.dialogues]
+            end = [dialogue.end.total_milliseconds for dialogue in self.dialogues]
+            text = [dialogue.text for dialogue in self.dialogues]
+        return {"styles": self.styles, "index": list(index), "start": list(start), "end": list(end), "text": text}
+
+    def _from_cache_entry(self, entry: Dict[str, Any]):
+        self.styles = entry["styles"]
+        index, start, end, text = entry["index"], entry["start"], entry["end"], entry["text"]
+        if isinstance(self.dialogues, DialogueTable):
+            self.dialogues.index.extend(index)
+            self.dialogues.start.extend(start)
+            self.dialogues.end.extend(end)
+            self.dialogues.text.extend(text)
+            return
+        for row in range(len(text)):
+            self.dialogues.append(Dialogue(index[row], start[row], end[row], text[row]))
+
     def _convert_ass(self):
         """
         Convert ASS subtitles to SRT format.
@@ -135,88 +603,141 @@ class Subtitle:
         This method processes ASS format, applies any necessary filters (like removing effects),
         and prepares the dialogues for formatting.
         """
-        cleaning_old_format = re.compile(r"{.*?}")
-        dialogs = re.findall(self.dialog_mask, re.sub(cleaning_old_format, "", self.raw_text))
+        dialogs = list(self._parse_ass())
 
         # Collect unique styles
         self.styles = sorted(set(d[2] for d in dialogs))
 
+        # Sort by (start, end, text) for chronological and stable order
+        dialogs = self._sorted(self._filter_ass_events(dialogs))
+
+        self.subtitle_formatting(dialogs)
+
+    def _parse_ass(self) -> Iterable[Tuple[str, str, str, str]]:
+        if self._source is None:
+            events = self.engine.iter_ass_events(self._memory_lines())
+        else:
+            # Reads only the [Events] section, skipping embedded fonts and graphics
+            events = self.engine.iter_ass_events(self._source, sections=self._index_sections())
+        return events if self.stats is None else self.stats.iterate("parse", events, self._input_size())
+
+    def _filter_ass_events(self, dialogs: Iterable[Tuple[str, str, str, str]]) -> Iterable[Tuple[int, int, str]]:
         # Filter by styles if specified
         if self.only_default_style and not self.include_styles and not self.exclude_styles:
             # Keep only styles containing "Default" (e.g., Default, Default_dvd, etc.)
-            dialogs = list(filter(lambda d: "Default" in d[2], dialogs))
+            dialogs = filter(lambda d: "Default" in d[2], dialogs)
         elif self.include_styles:
             # Build inclusion set for efficient lookup
             include_set = set(self.include_styles)
-            dialogs = list(filter(lambda d: d[2] in include_set, dialogs))
+            dialogs = filter(lambda d: d[2] in include_set, dialogs)
         elif self.exclude_styles:
             # Build exclusion set for efficient lookup
             exclude_set = set(self.exclude_styles)
-            dialogs = list(filter(lambda d: d[2] not in exclude_set, dialogs))
+            dialogs = filter(lambda d: d[2] not in exclude_set, dialogs)
 
         if self.removing_effects:
             dialogs = filter(lambda x: re.sub(self.effects, "", x[3]), dialogs)
-        dialogs = list(filter(lambda x: x[3], dialogs))
+        dialogs = filter(lambda x: x[3], dialogs)
 
-        # Convert from (start, end, style, text) to (start, end, text) for subtitle_formatting
-        dialogs = [(d[0], d[1], d[3]) for d in dialogs]
+        # Convert from (start, end, style, text) to (start_ms, end_ms, text) for subtitle_formatting
+        return self._stage("filter", self._event_times(dialogs))
 
-        # Sort by (start, end, text) for chronological and stable order
-        dialogs = sorted(dialogs)
-
-        self.subtitle_formatting(dialogs)
+    @staticmethod
+    def _event_times(dialogs: Iterable[Tuple[str, str, str, str]]) -> Iterator[Tuple[int, int, str]]:
+        # Events whose timestamps cannot be parsed are skipped
+        for start, end, _, text in dialogs:
+            try:
+                yield ass_to_ms(start), ass_to_ms(end), text
+            except ValueError:
+                continue
 
     def _convert_srt(self):
         """
         Parse SRT subtitles into internal tuple format.
 
-        Converts SRT format to the same (start, end, text) tuple format used by _convert_ass(),
+        Converts SRT format to the same (start_ms, end_ms, text) tuple format used by _convert_ass(),
         then uses the shared subtitle_formatting() pipeline for creating Dialogue objects.
+        Timestamps keep their full millisecond precision.
 
         Note: SRT subtitle numbers are ignored - new sequential indices are generated
         by subtitle_formatting() using enumerate(start=1).
         """
-        # Parse all SRT entries using regex (similar to _convert_ass approach)
-        srt_entry_pattern = re.compile(
-            r"^\d+\s*$\s+"  # Subtitle number (ignored)
-            r"^(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*$\s+"  # Timecodes
-            r"((?:^(?!\d+\s*$).+$\s*)*)",  # Text (lines that are NOT just a number)
-            re.MULTILINE,
-        )
-
-        dialogs = []
-        for match in srt_entry_pattern.finditer(self.raw_text):
-            start_srt, end_srt, text = match.groups()
-
-            # Convert to ASS format for Time class: "00:00:10,580" → "0:00:10.58"
-            start_ass = self._srt_time_to_ass(start_srt)
-            end_ass = self._srt_time_to_ass(end_srt)
+        # Sort by time, then use shared formatting pipeline
+        dialogs = self._sorted(self._srt_events())
+        self.subtitle_formatting(dialogs)
 
-            # Clean and join multiline text, filtering empty lines
-            text = " ".join(line.strip() for line in text.strip().split("\n") if line.strip())
+    def _srt_events(self) -> Iterable[Tuple[int, int, str]]:
+        source = self._source if self._source is not None else self._memory_lines()
+        entries = self.engine.iter_srt_entries(source)
+        if self.stats is not None:
+            entries = self.stats.iterate("parse", entries, self._input_size())
+        return self._stage("filter", self._srt_times(entries))
 
+    @staticmethod
+    def _srt_times(entries: Iterable[Tuple[str, str, str]]) -> Iterator[Tuple[int, int, str]]:
+        for start, end, text in entries:
             if text:
-                dialogs.append((start_ass, end_ass, text))
+                yield srt_to_ms(start), srt_to_ms(end), text
 
-        # Sort by time, then use shared formatting pipeline
-        dialogs = sorted(dialogs)
-        self.subtitle_formatting(dialogs)
+    def _sorted(self, events: Iterable[Tuple[int, int, str]]) -> List[Tuple[int, int, str]]:
+        with self._measure("sort") as run:
+            events = sorted(events)
+            if run is not None:
+                run.items = len(events)
+        return events
+
+    def _events(self, srt: bool) -> Iterable[Tuple[int, int, str]]:
+        # Prepared (start_ms, end_ms, text) events in file order
+        return self._srt_events() if srt else self._filter_ass_events(self._parse_ass())
 
     @staticmethod
-    def _srt_time_to_ass(srt_time: str) -> str:
+    def _in_order(events: Iterable[Tuple[int, int, str]]) -> Iterator[Tuple[int, int, str]]:
+        # Passes the events through, stopping as soon as one would have to be sorted earlier
+        previous = None
+        for event in events:
+            if previous is not None and event < previous:
+                raise _OutOfOrder
+            previous = event
+            yield event
+
+    def _rows(self, dialogues: Iterable[Tuple[Any, Any, str]]) -> Iterator[Tuple[int, Any, Any, str]]:
+        # Merge duplicates, clean the text and number the sorted dialogues
+        if self.is_remove_duplicates:
+            dialogues = self._stage("merge", self.merged_dialogues(dialogues))
+        text_clearing = self.text_clearing
+        for index, (start, end, text) in enumerate(dialogues, start=1):
+            yield index, start, end, text_clearing(text.strip())
+
+    def iter_dialogues(self, sort: bool = True) -> Iterator[Dialogue]:
         """
-        Convert SRT time format to ASS time format.
+        Iterate over the dialogues without storing them in :attr:`dialogues`.
 
-        :param srt_time: Time in SRT format (HH:MM:SS,mmm)
-        :type srt_time: str
-        :return: Time in ASS format (H:MM:SS.mm)
-        :rtype: str
+        Parsing, style filtering, duplicate merging and text cleaning run lazily as the
+        iterator is consumed, and each :class:`~pyasstosrt.dialogue.Dialogue` is created
+        only when it is yielded. If the subtitles were already converted, the stored
+        dialogues are yielded instead.
+
+        Dialogues are yielded in chronological order like after :meth:`convert`, which needs
+        the prepared (start, end, text) events of the whole file to be collected and sorted
+        before the first one is yielded. Pass ``sort=False`` to skip that step and get the
+        dialogues in file order with constant memory use.
+
+        :param sort: Whether to yield the dialogues in chronological order
+        :type sort: bool
+        :return: Generator yielding dialogues
+        :rtype: Iterator[Dialogue]
+
+        :Example:
+
+        >>> for dialogue in Subtitle("path/to/subtitle.ass").iter_dialogues():
+        ...     print(dialogue.start, dialogue.text)
         """
-        # SRT: 00:00:10,580 -> ASS: 0:00:10.58
-        time_part, ms_part = srt_time.split(",")
-        h, m, s = time_part.split(":")
-        # Remove leading zero from hours and truncate milliseconds to 2 digits
-        return f"{int(h)}:{m}:{s}.{ms_part[:2]}"
+        if self._converted:
+            yield from self.dialogues
+            return
+        events = self._events(self.is_srt_format())
+        rows = self._rows(self._sorted(events) if sort else events)
+        yield from self._stage("format", (Dialogue(*row) for row in rows))
 
     @staticmethod
     def text_clearing(raw_text: str) -> str:
@@ -267,58 +788,331 @@ class Subtitle:
         """
         return list(self.merged_dialogues(dialogues))
 
-    def subtitle_formatting(self, dialogues: List[Tuple[str, str, str]]):
+    def subtitle_formatting(self, dialogues: List[Tuple[Union[str, int], Union[str, int], str]]):
         """
         Format ASS dialogues into SRT format.
 
         This method processes the dialogues, removes duplicates if necessary, and creates
         :class:`~pyasstosrt.dialogue.Dialogue` objects for each subtitle entry.
 
-        :param dialogues: Prepared dialogues as tuples (start_time, end_time, text)
-        :type dialogues: List[Tuple[str, str, str]]
+        :param dialogues: Prepared dialogues as tuples (start_time, end_time, text), with times given
+            as ASS timestamps or in milliseconds
+        :type dialogues: List[Tuple[Union[str, int], Union[str, int], str]]
+        """
+        count = len(self.dialogues)
+        with self._measure("format") as run:
+            if isinstance(self.dialogues, DialogueTable):
+                for index, start, end, text in self._rows(dialogues):
+                    self.dialogues.add(index, start, end, text)
+            else:
+                for index, start, end, text in self._rows(dialogues):
+                    self.dialogues.append(Dialogue(index, start, end, text))
+            if run is not None:
+                run.items = len(self.dialogues) - count
+
+    def _retime(self, operation, *args):
+        if not self._converted:
+            self.convert()
+        starts, ends = timing.get_columns(self.dialogues)
+        starts, ends = operation(starts, ends, *args)
+        timing.set_columns(self.dialogues, starts, ends)
+
+    def shift(self, ms: int):
+        """
+        Move all dialogues by a fixed offset.
+
+        Times that would become negative are clamped to zero. Like the other timing methods,
+        this converts the subtitles first if needed and runs as a single NumPy array operation
+        over all start and end times when NumPy is installed, falling back to a pure-Python loop.
+
+        :param ms: Offset in milliseconds, negative values move subtitles earlier
+        :type ms: int
+        """
+        self._retime(timing.shift, ms)
+
+    def scale(self, factor: float):
         """
-        cleaned_dialogues = self.remove_duplicates(dialogues) if self.is_remove_duplicates else dialogues
+        Multiply all start and end times by a factor.
 
-        for index, values in enumerate(cleaned_dialogues, start=1):
-            start, end, text = values
-            text = self.text_clearing(text.strip())
-            dialogue = Dialogue(index, start, end, text)
-            self.dialogues.append(dialogue)
+        :param factor: Positive scaling factor
+        :type factor: float
+        :raises ValueError: If the factor is not positive
+        """
+        self._retime(timing.scale, factor)
+
+    def retime_fps(self, src: float, dst: float):
+        """
+        Retime the subtitles from one frame rate to another, e.g. from 23.976 to 25 fps.
+
+        :param src: Frame rate the subtitles were timed for
+        :type src: float
+        :param dst: Frame rate of the target video
+        :type dst: float
+        :raises ValueError: If either frame rate is not positive
+        """
+        if src <= 0 or dst <= 0:
+            raise ValueError(f"Frame rates must be positive, got {src} and {dst}")
+        self._retime(timing.scale, src / dst)
+
+    def clip(self, min_duration: Optional[int] = None, max_duration: Optional[int] = None):
+        """
+        Limit how long each dialogue stays on screen by moving its end time.
+
+        :param min_duration: Minimum duration in milliseconds (optional)
+        :type min_duration: Optional[int]
+        :param max_duration: Maximum duration in milliseconds (optional)
+        :type max_duration: Optional[int]
+        :raises ValueError: If ``min_duration`` is greater than ``max_duration``
+        """
+        self._retime(timing.clip, min_duration, max_duration)
+
+    def output_path(self, output_dir: Optional[Union[str, os.PathLike]] = None) -> Path:
+        """
+        Return the path :meth:`export` writes the SRT file to.
+
+        :param output_dir: Export path for the SRT file (optional, defaults to the source directory)
+        :type output_dir: Optional[Union[str, os.PathLike]]
+        :return: Path to the SRT file
+        :rtype: Path
+        """
+        file = f"{self.file}.srt"
+        if output_dir:
+            return Path(output_dir) / file
+        if self.filepath is None:
+            return Path(file)
+        return self.filepath.parent / file
 
     def export(
         self,
         output_dir: Optional[Union[str, os.PathLike]] = None,
         encoding: str = "utf8",
         output_dialogues: bool = False,
-    ) -> Optional[List[Dialogue]]:
+        stream: Optional[Union[TextIO, BinaryIO]] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        sort: bool = True,
+    ) -> Optional[Sequence[Dialogue]]:
         """
         Export the subtitles either to a file or as a list of dialogues.
 
-        If `output_dialogues` is False, this method exports the subtitles to an SRT file.
-        Otherwise, it returns a list of :class:`~pyasstosrt.dialogue.Dialogue` objects.
+        If `output_dialogues` is False, this method exports the subtitles to an SRT file,
+        or writes them to `stream` if one is given. Otherwise, it returns a list of
+        :class:`~pyasstosrt.dialogue.Dialogue` objects.
+
+        Unless the subtitles were already converted (or a :attr:`cache` is set), the SRT output
+        is streamed from :meth:`iter_dialogues`'s pipeline without filling :attr:`dialogues`:
+        when the source is in chronological order the file is written in a single pass with
+        constant memory use.
 
         :param output_dir: Export path for the SRT file (optional)
         :type output_dir: Optional[Union[str, os.PathLike]]
-        :param encoding: Encoding to use when saving the file (default is UTF-8)
+        :param encoding: Encoding to use when saving the file or writing to a binary stream (default is UTF-8)
         :type encoding: str
         :param output_dialogues: Whether to return a list of dialogues instead of creating an SRT file
         :type output_dialogues: bool
-        :return: List of :class:`~pyasstosrt.dialogue.Dialogue` objects if `output_dialogues` is True, otherwise None
-        :rtype: Optional[List[Dialogue]]
-        """
-        self.convert()
+        :param stream: Text or binary file-like object, or a socket, to write the SRT output to instead of
+            a file (optional). The stream is left open.
+        :type stream: Optional[Union[TextIO, BinaryIO]]
+        :param buffer_size: Number of characters formatted before each write, see :class:`~pyasstosrt.SrtWriter`
+        :type buffer_size: int
+        :param sort: Whether to write the dialogues in chronological order. When False, the dialogues of
+            subtitles that were not converted yet are written in file order as soon as they are parsed,
+            which lets output flow before the input is fully read
+        :type sort: bool
+        :return: List of :class:`~pyasstosrt.dialogue.Dialogue` objects (or a
+            :class:`~pyasstosrt.table.DialogueTable` in compact mode) if `output_dialogues` is True, otherwise None
+        :rtype: Optional[Sequence[Dialogue]]
 
+        :Example:
+
+        >>> buffer = io.BytesIO()
+        >>> Subtitle.from_bytes(upload).export(stream=buffer)
+        """
         if output_dialogues:
+            if not self._converted:
+                self.convert()
             return self.dialogues
 
-        file = f"{self.file}.srt"
+        self.save(output_dir, encoding, stream, buffer_size, sort)
+        return None
+
+    def save(
+        self,
+        output_dir: Optional[Union[str, os.PathLike]] = None,
+        encoding: str = "utf8",
+        stream: Optional[Union[TextIO, BinaryIO]] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        sort: bool = True,
+    ) -> int:
+        """
+        Write the SRT output like :meth:`export` and return the number of dialogues written.
+
+        The file is written to a temporary file next to :meth:`output_path` and moved into place
+        once complete, so a failed conversion leaves the previous output untouched.
+
+        :param output_dir: Export path for the SRT file (optional)
+        :type output_dir: Optional[Union[str, os.PathLike]]
+        :param encoding: Encoding to use when saving the file or writing to a binary stream (default is UTF-8)
+        :type encoding: str
+        :param stream: Text or binary file-like object, or a socket, to write the SRT output to instead of
+            a file (optional). The stream is left open.
+        :type stream: Optional[Union[TextIO, BinaryIO]]
+        :param buffer_size: Number of characters formatted before each write, see :class:`~pyasstosrt.SrtWriter`
+        :type buffer_size: int
+        :param sort: Whether to write the dialogues in chronological order, see :meth:`export`
+        :type sort: bool
+        :return: Number of dialogues written
+        :rtype: int
+
+        :Example:
+
+        >>> Subtitle("episode01.ass").save("output/")
+        412
+        """
+        if stream is not None:
+            with SrtWriter(stream, encoding, buffer_size) as writer:
+                return self._measured_write(writer, sort)
+
+        out_path = self.output_path(output_dir)
         if output_dir:
-            out_path = Path(output_dir)
-            out_path.mkdir(parents=True, exist_ok=True)
-            out_path = out_path / file
-        else:
-            out_path = self.filepath.parent / file
-        with open(out_path, encoding=encoding, mode="w") as writer:
-            for dialogue in self.dialogues:
-                writer.write(str(dialogue))
-            return None
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+        # Written next to the target and moved into place once complete, so an error part-way
+        # through the input never leaves a truncated file where the previous output was
+        fd, tmp_path = tempfile.mkstemp(dir=out_path.parent, prefix=f".{out_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, encoding=encoding, mode="w") as file, SrtWriter(file, encoding, buffer_size) as writer:
+                count = self._measured_write(writer, sort)
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return count
+
+    def _measured_write(self, writer: SrtWriter, sort: bool) -> int:
+        if self.stats is None:
+            return self._write_srt(writer, sort)
+        with self.stats.measure("write") as run:
+            start = writer.tell() if writer.seekable() else None
+            run.items = self._write_srt(writer, sort)
+            if start is not None:
+                run.bytes = writer.tell() - start
+        return run.items
+
+    def _write_srt(self, writer: SrtWriter, sort: bool = True) -> int:
+        if self._converted or self.cache is not None:
+            if not self._converted:
+                self.convert()
+            if isinstance(self.dialogues, DialogueTable):
+                return self.dialogues.write_srt(writer)
+            return writer.write_dialogues(self.dialogues)
+
+        # Stream the dialogues straight from the parser. Sources are almost always in
+        # chronological order already, so they are written in a single pass and only
+        # rewritten from the sorted events if an out-of-order event shows up.
+        srt = self.is_srt_format()
+        if not sort:
+            return writer.write_rows(self._stage("format", self._rows(self._events(srt))))
+        # A lazily read stream cannot be read a second time, so it is always sorted in memory
+        if writer.seekable() and self._stream is None:
+            position = writer.tell()
+            stats = self.stats
+            if stats is not None:
+                # Measured apart and only kept along with the output, so an abandoned pass does not count twice
+                self.stats = ConversionStats()
+            try:
+                count = writer.write_rows(self._stage("format", self._rows(self._in_order(self._events(srt)))))
+                if stats is not None:
+                    stats.merge(self.stats)
+                return count
+            except _OutOfOrder:
+                writer.truncate(position)
+            finally:
+                if stats is not None:
+                    self.stats = stats
+        return writer.write_rows(self._stage("format", self._rows(self._sorted(self._events(srt)))))
+
+    @classmethod
+    async def aload(
+        cls, filepath: Union[str, os.PathLike], *args: Any, executor: Optional[Executor] = None, **kwargs: Any
+    ) -> "Subtitle":
+        """
+        Create a :class:`Subtitle` without blocking the event loop.
+
+        The file system checks done by the constructor run in ``executor``. All other
+        arguments are passed to the constructor.
+
+        :param filepath: Path to a file that contains text in ASS or SRT format
+        :type filepath: Union[str, os.PathLike]
+        :param executor: Executor to run blocking work in (optional, defaults to the loop's default executor)
+        :type executor: Optional[Executor]
+        :return: The new subtitle object
+        :rtype: Subtitle
+
+        :Example:
+
+        >>> sub = await Subtitle.aload("path/to/subtitle.ass", removing_effects=True)
+        >>> await sub.aexport("output/directory")
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(cls, filepath, *args, **kwargs))
+
+    async def aconvert(self, executor: Optional[Executor] = None):
+        """
+        Run :meth:`convert` in ``executor`` so that reading and parsing do not block the event loop.
+
+        :param executor: Executor to run blocking work in (optional, defaults to the loop's default executor)
+        :type executor: Optional[Executor]
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, self.convert)
+
+    async def aexport(
+        self,
+        output_dir: Optional[Union[str, os.PathLike]] = None,
+        encoding: str = "utf8",
+        output_dialogues: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> Optional[Sequence[Dialogue]]:
+        """
+        Run :meth:`export` in ``executor`` so that conversion and writing do not block the event loop.
+
+        :param output_dir: Export path for the SRT file (optional)
+        :type output_dir: Optional[Union[str, os.PathLike]]
+        :param encoding: Encoding to use when saving the file (default is UTF-8)
+        :type encoding: str
+        :param output_dialogues: Whether to return a list of dialogues instead of creating an SRT file
+        :type output_dialogues: bool
+        :param executor: Executor to run blocking work in (optional, defaults to the loop's default executor)
+        :type executor: Optional[Executor]
+        :return: Same as :meth:`export`
+        :rtype: Optional[Sequence[Dialogue]]
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(self.export, output_dir, encoding, output_dialogues))
+
+    async def aiter_dialogues(
+        self, executor: Optional[Executor] = None, batch_size: int = 1000
+    ) -> AsyncIterator[Dialogue]:
+        """
+        Asynchronously iterate over the converted dialogues.
+
+        The subtitles are converted in ``executor`` first if needed. While iterating, control
+        is handed back to the event loop after every ``batch_size`` dialogues.
+
+        :param executor: Executor to run blocking work in (optional, defaults to the loop's default executor)
+        :type executor: Optional[Executor]
+        :param batch_size: Number of dialogues to yield between two event loop iterations
+        :type batch_size: int
+        :return: Asynchronous iterator over :class:`~pyasstosrt.dialogue.Dialogue` objects
+
+        :Example:
+
+        >>> async for dialogue in sub.aiter_dialogues():
+        ...     print(dialogue.text)
+        """
+        if not self._converted:
+            await self.aconvert(executor)
+        for count, dialogue in enumerate(self.dialogues, start=1):
+            yield dialogue
+            if count % batch_size == 0:
+                await asyncio.sleep(0)
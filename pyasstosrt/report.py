@@ -0,0 +1,172 @@
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .conversion import ConversionResult, peak_memory
+
+REPORT_FORMAT = 1
+
+
+def _size(path: Optional[Path]) -> Optional[int]:
+    if path is None or str(path) == "-":
+        return None
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+class RunReport:
+    """
+    Machine-readable report of a batch conversion, written as JSON lines while the files complete.
+
+    Every file adds one ``file`` record with its status (``ok``, ``error`` or ``skipped``),
+    source, output, error class and message, input and output sizes, events parsed and kept
+    by the filters, dialogues written, conversion time and peak memory. Finishing the run adds
+    a ``summary`` record with the totals, so a report without one comes from a run that did not
+    finish. Records are flushed as soon as they are written and only the totals are kept in
+    memory, so the report of a long run can be followed while it grows.
+
+    Event counts come from the :attr:`~pyasstosrt.ConversionResult.stats` of the results and
+    are null without them, or when a conversion was found in the cache.
+
+    :param path: Path to the report file, which is overwritten
+    :type path: Union[str, os.PathLike]
+    :param options: JSON serializable conversion options, added to the summary (optional)
+    :type options: Optional[Dict[str, Any]]
+
+    :ivar path: Path to the report file
+    :type path: Path
+    :ivar totals: Running totals written to the summary record
+    :type totals: Dict[str, Any]
+
+    :Example:
+
+    >>> report = RunReport("report.jsonl")
+    >>> for result in iter_convert_many(paths, collect_stats=True):
+    ...     report.add(result)
+    >>> report.close()
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], options: Optional[Dict[str, Any]] = None):
+        self.path = Path(path)
+        self.options = options
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf8")
+        self._started = datetime.now(timezone.utc)
+        self._clock = time.perf_counter()
+        self.totals: Dict[str, Any] = {
+            "files": 0,
+            "ok": 0,
+            "error": 0,
+            "skipped": 0,
+            "input_bytes": 0,
+            "output_bytes": 0,
+            "events": 0,
+            "kept": 0,
+            "dialogues": 0,
+            "elapsed": 0.0,
+            "peak_memory": None,
+        }
+
+    def _write(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def _add(self, record: Dict[str, Any]):
+        totals = self.totals
+        totals["files"] += 1
+        totals[record["status"]] += 1
+        for key in ("input_bytes", "output_bytes", "events", "kept", "dialogues", "elapsed"):
+            totals[key] += record[key] or 0
+        if record["peak_memory"] is not None:
+            totals["peak_memory"] = max(totals["peak_memory"] or 0, record["peak_memory"])
+        self._write(record)
+
+    def add(self, result: ConversionResult):
+        """
+        Write the record of a converted or failed file.
+
+        :param result: Result of the conversion
+        :type result: ConversionResult
+        """
+        stats = result.stats
+        input_bytes = _size(result.source)
+        if str(result.source) == "-" and stats is not None:
+            # Standard input has no size, but its reading is measured
+            input_bytes = stats["read"].bytes
+        self._add(
+            {
+                "type": "file",
+                "status": "ok" if result.ok else "error",
+                "source": str(result.source),
+                "output": str(result.output) if result.output is not None else None,
+                "error": type(result.error).__name__ if result.error is not None else None,
+                "message": str(result.error) if result.error is not None else None,
+                "input_bytes": input_bytes,
+                "output_bytes": _size(result.output) if result.ok else None,
+                "events": stats["parse"].items if stats is not None and "parse" in stats.stages else None,
+                "kept": stats["filter"].items if stats is not None and "filter" in stats.stages else None,
+                "dialogues": result.dialogue_count,
+                "elapsed": result.elapsed,
+                "peak_memory": result.peak_memory,
+            }
+        )
+
+    def add_skipped(self, source: Union[str, os.PathLike], output: Union[str, os.PathLike]):
+        """
+        Write the record of a file that was not converted because its output is up to date.
+
+        :param source: Path to the subtitle file
+        :type source: Union[str, os.PathLike]
+        :param output: Path to its SRT file
+        :type output: Union[str, os.PathLike]
+        """
+        self._add(
+            {
+                "type": "file",
+                "status": "skipped",
+                "source": str(source),
+                "output": str(output),
+                "error": None,
+                "message": None,
+                "input_bytes": _size(Path(source)),
+                "output_bytes": _size(Path(output)),
+                "events": None,
+                "kept": None,
+                "dialogues": 0,
+                "elapsed": 0.0,
+                "peak_memory": None,
+            }
+        )
+
+    def close(self):
+        """
+        Write the summary record and close the report.
+        """
+        if self._file.closed:
+            return
+        wall = time.perf_counter() - self._clock
+        totals = dict(self.totals)
+        # Worker processes report their own peaks, this one covers a serial run and the CLI itself
+        own_peak = peak_memory()
+        if own_peak is not None:
+            totals["peak_memory"] = max(totals["peak_memory"] or 0, own_peak)
+        from . import __version__
+
+        self._write(
+            {
+                "type": "summary",
+                "format": REPORT_FORMAT,
+                "version": __version__,
+                "started": self._started.isoformat(timespec="seconds"),
+                "finished": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "wall": wall,
+                **totals,
+                "options": self.options,
+            }
+        )
+        self._file.close()
@@ -0,0 +1,225 @@
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+#: Stages in pipeline order, see :class:`ConversionStats`
+STAGES = ("read", "index", "cache", "parse", "filter", "sort", "merge", "format", "write")
+
+
+@dataclass
+class StageStats:
+    """
+    Measurements of one stage of the conversion.
+
+    :ivar name: Name of the stage
+    :type name: str
+    :ivar elapsed: Wall time spent in the stage itself in seconds, without the stages it pulls its input from
+    :type elapsed: float
+    :ivar items: Number of items the stage produced, e.g. events for ``parse`` or dialogues for ``write``
+    :type items: int
+    :ivar bytes: Number of bytes the stage read or wrote, for the stages that do I/O
+    :type bytes: int
+    :ivar calls: Number of times the stage ran
+    :type calls: int
+    """
+
+    name: str
+    elapsed: float = 0.0
+    items: int = 0
+    bytes: int = 0
+    calls: int = 0
+
+    def add(self, other: "StageStats"):
+        """
+        Add the measurements of another run of the same stage.
+
+        :param other: Measurements to add
+        :type other: StageStats
+        """
+        self.elapsed += other.elapsed
+        self.items += other.items
+        self.bytes += other.bytes
+        self.calls += other.calls
+
+
+class ConversionStats:
+    """
+    Records wall time, item counts and bytes for each stage of a conversion.
+
+    Pass an instance as the ``stats`` argument of :class:`~pyasstosrt.Subtitle` to measure its
+    conversions and exports; without one, nothing is measured and the pipeline runs unchanged.
+    The stages are:
+
+    - ``read``: reading a stream passed to :meth:`~pyasstosrt.Subtitle.from_stream` with
+      ``buffered=False``, including the time spent waiting for input
+    - ``index``: locating the sections of an ASS file
+    - ``cache``: looking up and storing conversions in a :class:`~pyasstosrt.DiskCache`
+    - ``parse``: reading the file and splitting it into events with the parser engine, bytes are
+      the size of the input
+    - ``filter``: style and effect filters and timestamp conversion, items are the events kept
+    - ``sort``: sorting the events by time, skipped by exports of events already in order
+    - ``merge``: merging consecutive duplicates, with ``remove_duplicates``
+    - ``format``: text cleaning and creating the dialogues
+    - ``write``: formatting and writing the SRT output, bytes are the size of the output when
+      it goes to a file or a seekable stream
+
+    An export first writes the events in file order, and only when one turns out to be out of
+    order parses them again and writes them sorted. The stages of the abandoned pass are left out,
+    the time it took counts towards ``write``.
+
+    Stages run interleaved, as every stage pulls its input from the previous one, so the time
+    of each stage excludes the time of the stages it pulled from. Measurements add up over
+    several conversions, one call of :meth:`record` per stage and conversion. Subclasses can
+    override :meth:`record`, or a ``callback`` can be given, to forward them elsewhere.
+
+    :param callback: Function called with the :class:`StageStats` of every stage run (optional)
+    :type callback: Optional[Callable[[StageStats], Any]]
+
+    :ivar stages: Accumulated measurements by stage name, in the order the stages first ran
+    :type stages: Dict[str, StageStats]
+
+    :Example:
+
+    >>> from pyasstosrt import ConversionStats, Subtitle
+    >>> stats = ConversionStats()
+    >>> Subtitle("path/to/subtitle.ass", stats=stats).export()
+    >>> print(stats)
+    """
+
+    def __init__(self, callback: Optional[Callable[[StageStats], Any]] = None):
+        self.callback = callback
+        self.stages: Dict[str, StageStats] = {}
+        # Time already assigned to a stage, so enclosing stages can leave it out
+        self._attributed = 0.0
+
+    def record(self, run: StageStats):
+        """
+        Add the measurements of a single run of a stage.
+
+        :param run: Measurements of the run
+        :type run: StageStats
+        """
+        stage = self.stages.get(run.name)
+        if stage is None:
+            stage = self.stages[run.name] = StageStats(run.name)
+        stage.add(run)
+        if self.callback is not None:
+            self.callback(run)
+
+    def merge(self, other: "ConversionStats"):
+        """
+        Add the measurements of another instance, as one run per stage.
+
+        Work measured apart, e.g. to keep it only if its result is used, is merged this way. Its
+        time counts as attributed to stages, so stages enclosing it leave it out.
+
+        :param other: Measurements to add
+        :type other: ConversionStats
+        """
+        for stage in other.stages.values():
+            self.record(stage)
+        self._attributed += other._attributed
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[StageStats]:
+        """
+        Measure a block of code as a run of a stage.
+
+        :param name: Name of the stage
+        :type name: str
+        :return: Context manager yielding the :class:`StageStats` of the run, to set its items and bytes
+        :rtype: Iterator[StageStats]
+        """
+        run = StageStats(name, calls=1)
+        attributed = self._attributed
+        start = time.perf_counter()
+        try:
+            yield run
+        finally:
+            elapsed = time.perf_counter() - start
+            run.elapsed = elapsed - (self._attributed - attributed)
+            self._attributed = attributed + elapsed
+            self.record(run)
+
+    def iterate(
+        self, name: str, iterable: Iterable[T], nbytes: int = 0, size: Optional[Callable[[T], int]] = None
+    ) -> Iterator[T]:
+        """
+        Measure the production of the items of an iterable as a run of a stage.
+
+        The run is recorded when the iterable is exhausted or the returned generator is closed.
+
+        :param name: Name of the stage
+        :type name: str
+        :param iterable: Iterable whose items the stage produces
+        :type iterable: Iterable[T]
+        :param nbytes: Number of bytes to record for the stage
+        :type nbytes: int
+        :param size: Function returning the number of bytes of an item, added to ``nbytes`` (optional)
+        :type size: Optional[Callable[[T], int]]
+        :return: Generator yielding the items of ``iterable``
+        :rtype: Iterator[T]
+        """
+        run = StageStats(name, bytes=nbytes, calls=1)
+        clock = time.perf_counter
+        iterator = iter(iterable)
+        try:
+            while True:
+                attributed = self._attributed
+                start = clock()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed = clock() - start
+                    run.elapsed += elapsed - (self._attributed - attributed)
+                    self._attributed = attributed + elapsed
+                run.items += 1
+                if size is not None:
+                    run.bytes += size(item)
+                yield item
+        finally:
+            self.record(run)
+
+    def __getitem__(self, name: str) -> StageStats:
+        """
+        Return the measurements of a stage, empty if it did not run.
+
+        :param name: Name of the stage
+        :type name: str
+        :return: Measurements of the stage
+        :rtype: StageStats
+        """
+        return self.stages.get(name) or StageStats(name)
+
+    @property
+    def elapsed(self) -> float:
+        """Total wall time of all stages in seconds."""
+        return sum(stage.elapsed for stage in self.stages.values())
+
+    def reset(self):
+        """Discard all measurements."""
+        self.stages.clear()
+        self._attributed = 0.0
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the measurements as plain data, e.g. for JSON.
+
+        :return: Measurements of each stage by name, in pipeline order
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        order = {name: position for position, name in enumerate(STAGES)}
+        stages = sorted(self.stages.values(), key=lambda stage: order.get(stage.name, len(STAGES)))
+        return {stage.name: asdict(stage) for stage in stages}
+
+    def __str__(self) -> str:
+        lines = [f"{'stage':<8} {'time':>10} {'items':>10} {'bytes':>12}"]
+        for name, stage in self.as_dict().items():
+            lines.append(f"{name:<8} {stage['elapsed'] * 1000:7.1f} ms {stage['items']:>10} {stage['bytes']:>12}")
+        lines.append(f"{'total':<8} {self.elapsed * 1000:7.1f} ms")
+        return "\n".join(lines)
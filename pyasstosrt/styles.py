@@ -0,0 +1,47 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass
+class StyleReport:
+    """
+    Styles of a subtitle file, as returned by :meth:`Subtitle.scan_styles <pyasstosrt.Subtitle.scan_styles>`.
+
+    :ivar source: Path to the scanned file, None for subtitles read from memory
+    :type source: Optional[Path]
+    :ivar declared: Names of the styles declared in the ``[V4+ Styles]`` section, in file order
+    :type declared: List[str]
+    :ivar counts: Number of dialogue events of each style used in ``[Events]``
+    :type counts: Dict[str, int]
+    :ivar elapsed: Wall time spent on the scan, in seconds
+    :type elapsed: float
+    :ivar error: Exception raised while scanning, None on success
+    :type error: Optional[BaseException]
+    """
+
+    source: Optional[Path]
+    declared: List[str] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was scanned without errors."""
+        return self.error is None
+
+    @property
+    def styles(self) -> List[str]:
+        """Sorted names of the styles used by at least one event."""
+        return sorted(self.counts)
+
+    @property
+    def unused(self) -> List[str]:
+        """Declared styles that no event uses, in file order."""
+        return [name for name in self.declared if name not in self.counts]
+
+    @property
+    def event_count(self) -> int:
+        """Total number of dialogue events."""
+        return sum(self.counts.values())
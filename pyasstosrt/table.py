@@ -0,0 +1,129 @@
+from array import array
+from typing import BinaryIO, Iterable, Iterator, List, Sequence, TextIO, Union, overload
+
+from .dialogue import Dialogue
+from .time import Time, ass_to_ms
+from .writer import SrtWriter
+
+
+def _to_ms(value: Union[str, int, Time]) -> int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, Time):
+        return value.total_milliseconds
+    return ass_to_ms(value)
+
+
+class DialogueTable(Sequence[Dialogue]):
+    """
+    Compact columnar storage for a large number of dialogues.
+
+    Instead of keeping one :class:`~pyasstosrt.dialogue.Dialogue` and two
+    :class:`~pyasstosrt.time.Time` objects per subtitle entry, the table stores indices and
+    times in ``array('q')`` columns of milliseconds and the texts in a plain list. Dialogue
+    objects are only materialized when an item is accessed, and the table can be written
+    as SRT straight from its columns.
+
+    Items returned by indexing are copies: modifying them does not change the table.
+    Assign them back with ``table[i] = dialogue`` to store the changes.
+
+    :param dialogues: Dialogues to fill the table with (optional)
+    :type dialogues: Iterable[Dialogue]
+
+    :ivar index: Position of each dialogue in the subtitle file
+    :type index: array
+    :ivar start: Start time of each dialogue in milliseconds
+    :type start: array
+    :ivar end: End time of each dialogue in milliseconds
+    :type end: array
+    :ivar text: Text content of each dialogue
+    :type text: List[str]
+
+    :Example:
+
+    >>> from pyasstosrt import Subtitle
+    >>> sub = Subtitle("path/to/subtitle.ass", compact=True)
+    >>> sub.convert()
+    >>> sub.dialogues[0].text
+    "It's time for the main event!"
+    """
+
+    def __init__(self, dialogues: Iterable[Dialogue] = ()):
+        self.index = array("q")
+        self.start = array("q")
+        self.end = array("q")
+        self.text: List[str] = []
+        for dialogue in dialogues:
+            self.append(dialogue)
+
+    def add(self, index: int, start: Union[str, int, Time], end: Union[str, int, Time], text: str):
+        """
+        Add a row to the table without creating a :class:`~pyasstosrt.dialogue.Dialogue` object.
+
+        :param index: The position of the dialogue in the subtitle file
+        :type index: int
+        :param start: The start time as an ASS timestamp or in milliseconds
+        :type start: Union[str, int, Time]
+        :param end: The end time as an ASS timestamp or in milliseconds
+        :type end: Union[str, int, Time]
+        :param text: The text content of the dialogue
+        :type text: str
+        """
+        self.index.append(index)
+        self.start.append(_to_ms(start))
+        self.end.append(_to_ms(end))
+        self.text.append(text)
+
+    def append(self, dialogue: Dialogue):
+        """
+        Add a :class:`~pyasstosrt.dialogue.Dialogue` to the end of the table.
+
+        :param dialogue: The dialogue to add
+        :type dialogue: Dialogue
+        """
+        self.add(dialogue.index, dialogue.start, dialogue.end, dialogue.text)
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @overload
+    def __getitem__(self, item: int) -> Dialogue: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> "DialogueTable": ...
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            table = DialogueTable()
+            table.index = self.index[item]
+            table.start = self.start[item]
+            table.end = self.end[item]
+            table.text = self.text[item]
+            return table
+        return Dialogue(self.index[item], Time.from_ms(self.start[item]), Time.from_ms(self.end[item]), self.text[item])
+
+    def __setitem__(self, item: int, dialogue: Dialogue):
+        self.index[item] = dialogue.index
+        self.start[item] = _to_ms(dialogue.start)
+        self.end[item] = _to_ms(dialogue.end)
+        self.text[item] = dialogue.text
+
+    def __iter__(self) -> Iterator[Dialogue]:
+        for row in range(len(self.text)):
+            yield self[row]
+
+    def write_srt(self, writer: Union[TextIO, BinaryIO, SrtWriter]) -> int:
+        """
+        Write the table in SRT format directly from its columns.
+
+        :param writer: Stream to write to, or an :class:`~pyasstosrt.writer.SrtWriter`
+        :type writer: Union[TextIO, BinaryIO, SrtWriter]
+        :return: Number of dialogues written
+        :rtype: int
+        """
+        index, start, end, text = self.index, self.start, self.end, self.text
+        rows = ((index[row], start[row], end[row], text[row]) for row in range(len(text)))
+        if isinstance(writer, SrtWriter):
+            return writer.write_rows(rows)
+        with SrtWriter(writer) as srt_writer:
+            return srt_writer.write_rows(rows)
@@ -1,36 +1,188 @@
+from typing import Optional, Union
+
+
+def ass_to_ms(text: str) -> int:
+    """
+    Convert an ASS timestamp to milliseconds.
+
+    Args:
+        text (str): A string representing time in the format '0:00:00.00'.
+
+    Returns:
+        int: The timestamp in milliseconds.
+
+    Raises:
+        ValueError: If the timestamp is not hours, two-digit minutes and seconds and two-digit
+            centiseconds, all made of ASCII digits.
+
+    Example:
+        >>> ass_to_ms("1:23:45.67")
+        5025670
+    """
+    hours, minutes, seconds = text.split(":")
+    seconds, centiseconds = seconds.split(".")
+    # int() alone would take "1.5" as 50 ms and "1.500" as 5 s, or accept signs and spaces
+    digits = hours + minutes + seconds + centiseconds
+    if not (hours and len(minutes) == len(seconds) == len(centiseconds) == 2 and digits.isdigit() and digits.isascii()):
+        raise ValueError(f"Invalid ASS timestamp: {text!r}")
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(centiseconds) * 10
+
+
+def srt_to_ms(text: str) -> int:
+    """
+    Convert an SRT timestamp to milliseconds without losing precision.
+
+    Args:
+        text (str): A string representing time in the format '00:00:00,000'.
+
+    Returns:
+        int: The timestamp in milliseconds.
+
+    Example:
+        >>> srt_to_ms("01:23:45,678")
+        5025678
+    """
+    hours, minutes, seconds = text.split(":")
+    seconds, milliseconds = seconds.split(",")
+    return ((int(hours) * 60 + int(minutes)) * 60 + int(seconds)) * 1000 + int(milliseconds)
+
+
+def format_srt(ms: int) -> str:
+    """
+    Format a number of milliseconds as an SRT timestamp.
+
+    Args:
+        ms (int): The timestamp in milliseconds.
+
+    Returns:
+        str: A string representation of the time in the format '00:00:00,000'.
+
+    Example:
+        >>> format_srt(5025670)
+        '01:23:45,670'
+    """
+    seconds, ms = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return "%02d:%02d:%02d,%03d" % (hours, minutes, seconds, ms)
+
+
 class Time:
     """
     Represents a time structure for subtitle timestamps.
 
+    The time is stored as a single integer number of milliseconds, so arithmetic,
+    comparison and sorting are plain integer operations. The SRT representation is
+    computed on first use and cached.
+
     Attributes:
         hour (int): The hour component of the time.
         minute (int): The minute component of the time.
         second (int): The second component of the time.
         millisecond (int): The millisecond component of the time.
+        total_milliseconds (int): The whole timestamp in milliseconds.
     """
 
-    hour: int
-    minute: int
-    second: int
-    millisecond: int
+    __slots__ = ("_ms", "_srt")
+
+    _ms: int
+    _srt: Optional[str]
 
-    def __init__(self, text: str):
+    def __init__(self, value: Union[str, int, "Time"]):
         """
-        Initialize a Time object from a string representation.
+        Initialize a Time object from an ASS timestamp or a number of milliseconds.
 
         Args:
-            text (str): A string representing time in the format '0:00:00.00'.
+            value (Union[str, int, Time]): A string representing time in the format '0:00:00.00',
+                a number of milliseconds or another :class:`Time` object.
 
         Example:
             >>> time = Time("1:23:45.67")
             >>> print(time)
             01:23:45,670
         """
-        s = text.split(":")
-        self.hour, self.minute = [int(sr) for sr in s[:-1]]
-        self.second, self.millisecond = [int(sr) for sr in s[-1].split(".")]
-        # fix for srt
-        self.millisecond *= 10
+        if isinstance(value, int):
+            self._ms = value
+        elif isinstance(value, Time):
+            self._ms = value._ms
+        else:
+            self._ms = ass_to_ms(value)
+        self._srt = None
+
+    @classmethod
+    def from_ms(cls, ms: int) -> "Time":
+        """
+        Create a :class:`Time` object from a number of milliseconds.
+
+        Args:
+            ms (int): The timestamp in milliseconds.
+
+        Returns:
+            Time: The new :class:`Time` object.
+
+        Example:
+            >>> print(Time.from_ms(5025670))
+            01:23:45,670
+        """
+        time = cls.__new__(cls)
+        time._ms = ms
+        time._srt = None
+        return time
+
+    @classmethod
+    def from_ass(cls, text: str) -> "Time":
+        """
+        Create a :class:`Time` object from an ASS timestamp with centisecond precision.
+
+        Args:
+            text (str): A string representing time in the format '0:00:00.00'.
+
+        Returns:
+            Time: The new :class:`Time` object.
+        """
+        return cls.from_ms(ass_to_ms(text))
+
+    @classmethod
+    def from_srt(cls, text: str) -> "Time":
+        """
+        Create a :class:`Time` object from an SRT timestamp with millisecond precision.
+
+        Args:
+            text (str): A string representing time in the format '00:00:00,000'.
+
+        Returns:
+            Time: The new :class:`Time` object.
+
+        Example:
+            >>> print(Time.from_srt("01:23:45,678"))
+            01:23:45,678
+        """
+        return cls.from_ms(srt_to_ms(text))
+
+    @property
+    def total_milliseconds(self) -> int:
+        """The whole timestamp in milliseconds."""
+        return self._ms
+
+    @property
+    def hour(self) -> int:
+        """The hour component of the time."""
+        return self._ms // 3_600_000
+
+    @property
+    def minute(self) -> int:
+        """The minute component of the time."""
+        return self._ms // 60_000 % 60
+
+    @property
+    def second(self) -> int:
+        """The second component of the time."""
+        return self._ms // 1000 % 60
+
+    @property
+    def millisecond(self) -> int:
+        """The millisecond component of the time."""
+        return self._ms % 1000
 
     def __sub__(self, other: "Time") -> float:
         """
@@ -48,12 +200,41 @@ class Time:
             >>> print(t1 - t2)
             5.0
         """
-        return (
-            (self.hour - other.hour) * 3600
-            + (self.minute - other.minute) * 60
-            + (self.second - other.second)
-            + (self.millisecond - other.millisecond) / 1000
-        )
+        return (self._ms - other._ms) / 1000
+
+    def __int__(self) -> int:
+        return self._ms
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._ms == other._ms
+
+    def __lt__(self, other: "Time") -> bool:
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._ms < other._ms
+
+    def __le__(self, other: "Time") -> bool:
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._ms <= other._ms
+
+    def __gt__(self, other: "Time") -> bool:
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._ms > other._ms
+
+    def __ge__(self, other: "Time") -> bool:
+        if not isinstance(other, Time):
+            return NotImplemented
+        return self._ms >= other._ms
+
+    def __hash__(self) -> int:
+        return hash(self._ms)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}.from_ms({self._ms})"
 
     def __str__(self) -> str:
         """
@@ -67,4 +248,6 @@ class Time:
             >>> str(time)
             '01:23:45,670'
         """
-        return f"{self.hour:02d}:{self.minute:02d}:{self.second:02d},{self.millisecond:03d}"
+        if self._srt is None:
+            self._srt = format_srt(self._ms)
+        return self._srt
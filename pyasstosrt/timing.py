@@ -0,0 +1,152 @@
+from array import array
+from typing import List, Optional, Sequence, Tuple, Union
+
+from .dialogue import Dialogue
+from .table import DialogueTable
+from .time import Time
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+Columns = Tuple[Sequence[int], Sequence[int]]
+
+
+def has_numpy() -> bool:
+    """
+    Check whether timing operations run vectorized with NumPy.
+
+    :return: True if NumPy is installed, False if the pure-Python fallback is used
+    :rtype: bool
+    """
+    return np is not None
+
+
+def get_columns(dialogues: Union[List[Dialogue], DialogueTable]) -> Columns:
+    """
+    Collect the start and end times of the dialogues in milliseconds.
+
+    With NumPy installed the columns are returned as ``int64`` arrays; for a
+    :class:`~pyasstosrt.table.DialogueTable` they share memory with the table.
+
+    :param dialogues: Converted dialogues
+    :type dialogues: Union[List[Dialogue], DialogueTable]
+    :return: Tuple of (starts, ends)
+    :rtype: Tuple[Sequence[int], Sequence[int]]
+    """
+    if isinstance(dialogues, DialogueTable):
+        starts, ends = dialogues.start, dialogues.end
+    else:
+        starts = array("q", [dialogue.start.total_milliseconds for dialogue in dialogues])
+        ends = array("q", [dialogue.end.total_milliseconds for dialogue in dialogues])
+    if np is not None:
+        return np.frombuffer(starts, dtype=np.int64), np.frombuffer(ends, dtype=np.int64)
+    return starts, ends
+
+
+def set_columns(dialogues: Union[List[Dialogue], DialogueTable], starts: Sequence[int], ends: Sequence[int]):
+    """
+    Store new start and end times, given in milliseconds, back into the dialogues.
+
+    :param dialogues: Converted dialogues to update
+    :type dialogues: Union[List[Dialogue], DialogueTable]
+    :param starts: New start times
+    :type starts: Sequence[int]
+    :param ends: New end times
+    :type ends: Sequence[int]
+    """
+    if isinstance(dialogues, DialogueTable):
+        dialogues.start = _to_array(starts)
+        dialogues.end = _to_array(ends)
+        return
+    if np is not None:
+        starts, ends = starts.tolist(), ends.tolist()
+    for row, dialogue in enumerate(dialogues):
+        dialogue.start = Time.from_ms(starts[row])
+        dialogue.end = Time.from_ms(ends[row])
+
+
+def _to_array(values: Sequence[int]) -> array:
+    if np is not None:
+        column = array("q")
+        column.frombytes(np.ascontiguousarray(values, dtype=np.int64).tobytes())
+        return column
+    return array("q", values)
+
+
+def shift(starts: Sequence[int], ends: Sequence[int], ms: int) -> Columns:
+    """
+    Move all times by a fixed offset, clamping results below zero to zero.
+
+    :param starts: Start times in milliseconds
+    :type starts: Sequence[int]
+    :param ends: End times in milliseconds
+    :type ends: Sequence[int]
+    :param ms: Offset in milliseconds, negative values move subtitles earlier
+    :type ms: int
+    :return: Tuple of shifted (starts, ends)
+    :rtype: Tuple[Sequence[int], Sequence[int]]
+    """
+    if np is not None:
+        return np.maximum(starts + ms, 0), np.maximum(ends + ms, 0)
+    return [max(start + ms, 0) for start in starts], [max(end + ms, 0) for end in ends]
+
+
+def scale(starts: Sequence[int], ends: Sequence[int], factor: float) -> Columns:
+    """
+    Multiply all times by a factor, rounding to the nearest millisecond.
+
+    :param starts: Start times in milliseconds
+    :type starts: Sequence[int]
+    :param ends: End times in milliseconds
+    :type ends: Sequence[int]
+    :param factor: Positive scaling factor
+    :type factor: float
+    :return: Tuple of scaled (starts, ends)
+    :rtype: Tuple[Sequence[int], Sequence[int]]
+    :raises ValueError: If the factor is not positive
+    """
+    if factor <= 0:
+        raise ValueError(f"Scaling factor must be positive, got {factor}")
+    if np is not None:
+        return np.rint(starts * factor).astype(np.int64), np.rint(ends * factor).astype(np.int64)
+    return [round(start * factor) for start in starts], [round(end * factor) for end in ends]
+
+
+def clip(
+    starts: Sequence[int],
+    ends: Sequence[int],
+    min_duration: Optional[int] = None,
+    max_duration: Optional[int] = None,
+) -> Columns:
+    """
+    Limit the duration of every dialogue by moving its end time.
+
+    :param starts: Start times in milliseconds
+    :type starts: Sequence[int]
+    :param ends: End times in milliseconds
+    :type ends: Sequence[int]
+    :param min_duration: Minimum duration in milliseconds (optional)
+    :type min_duration: Optional[int]
+    :param max_duration: Maximum duration in milliseconds (optional)
+    :type max_duration: Optional[int]
+    :return: Tuple of (starts, ends) with clipped end times
+    :rtype: Tuple[Sequence[int], Sequence[int]]
+    :raises ValueError: If ``min_duration`` is greater than ``max_duration``
+    """
+    if min_duration is not None and max_duration is not None and min_duration > max_duration:
+        raise ValueError(f"min_duration ({min_duration}) is greater than max_duration ({max_duration})")
+    if min_duration is None and max_duration is None:
+        return starts, ends
+    if np is not None:
+        return starts, starts + np.clip(ends - starts, min_duration, max_duration)
+    clipped = []
+    for row, start in enumerate(starts):
+        duration = ends[row] - start
+        if min_duration is not None and duration < min_duration:
+            duration = min_duration
+        if max_duration is not None and duration > max_duration:
+            duration = max_duration
+        clipped.append(start + duration)
+    return starts, clipped
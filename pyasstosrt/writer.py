@@ -0,0 +1,197 @@
+import io
+from typing import Any, BinaryIO, Iterable, List, TextIO, Tuple, Union
+
+from .dialogue import Dialogue
+from .time import Time
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+ENTRY_TEMPLATE = "%d\n%02d:%02d:%02d,%03d --> %02d:%02d:%02d,%03d\n%s\n\n"
+
+Row = Tuple[int, int, int, str]
+
+
+def is_binary_stream(stream: Any) -> bool:
+    """
+    Tell whether a file-like object expects bytes rather than text.
+
+    :param stream: File-like object
+    :type stream: Any
+    :return: True for binary streams
+    :rtype: bool
+    """
+    if isinstance(stream, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    if isinstance(stream, io.TextIOBase):
+        return False
+    return "b" in getattr(stream, "mode", "") or not hasattr(stream, "write")
+
+
+class SrtWriter:
+    """
+    Buffered writer of SRT entries.
+
+    Entries are formatted into a buffer and written with one call per ``buffer_size``
+    characters instead of one call per dialogue. Any text or binary stream is accepted:
+    regular files, ``sys.stdout``, :class:`io.StringIO`, :class:`io.BytesIO` or sockets.
+    Text is encoded with ``encoding`` for binary streams, and objects without a ``write``
+    method but with ``sendall`` (such as :class:`socket.socket`) receive the encoded
+    bytes through it.
+
+    The stream itself is never closed. Use the writer as a context manager, or call
+    :meth:`flush`, to write the last partial buffer.
+
+    :param stream: Text or binary file-like object, or a socket
+    :type stream: Union[TextIO, BinaryIO, Any]
+    :param encoding: Encoding used for binary streams and sockets
+    :type encoding: str
+    :param buffer_size: Number of characters to collect before writing to the stream
+    :type buffer_size: int
+    :raises ValueError: If ``buffer_size`` is not positive
+
+    :Example:
+
+    >>> import sys
+    >>> from pyasstosrt import SrtWriter, Subtitle
+    >>> with SrtWriter(sys.stdout.buffer, buffer_size=256 * 1024) as writer:
+    ...     writer.write_dialogues(Subtitle("path/to/subtitle.ass").iter_dialogues())
+    """
+
+    def __init__(
+        self,
+        stream: Union[TextIO, BinaryIO, Any],
+        encoding: str = "utf8",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        if buffer_size <= 0:
+            raise ValueError(f"Buffer size must be positive, got {buffer_size}")
+        self.stream = stream
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self._parts: List[str] = []
+        self._pending = 0
+        self._binary = is_binary_stream(stream)
+        self._send = stream.write if hasattr(stream, "write") else stream.sendall
+
+    def write(self, dialogue: Dialogue):
+        """
+        Write a single dialogue.
+
+        :param dialogue: Dialogue to write
+        :type dialogue: Dialogue
+        """
+        self.write_dialogues((dialogue,))
+
+    def write_dialogues(self, dialogues: Iterable[Dialogue]) -> int:
+        """
+        Write dialogues, keeping their own indices.
+
+        :param dialogues: Dialogues to write
+        :type dialogues: Iterable[Dialogue]
+        :return: Number of dialogues written
+        :rtype: int
+        """
+        return self.write_rows((dialogue.index, dialogue.start, dialogue.end, dialogue.text) for dialogue in dialogues)
+
+    def write_rows(self, rows: Iterable[Row]) -> int:
+        """
+        Write entries given as ``(index, start_ms, end_ms, text)`` tuples without creating dialogues.
+
+        :class:`~pyasstosrt.time.Time` objects are accepted in place of milliseconds.
+
+        :param rows: Entries to write
+        :type rows: Iterable[Tuple[int, int, int, str]]
+        :return: Number of entries written
+        :rtype: int
+        """
+        parts = self._parts
+        append = parts.append
+        pending = self._pending
+        buffer_size = self.buffer_size
+        written = 0
+        try:
+            for index, start, end, text in rows:
+                if isinstance(start, Time):
+                    start = start.total_milliseconds
+                if isinstance(end, Time):
+                    end = end.total_milliseconds
+                # One formatting operation per entry, with the timestamps split inline
+                start_seconds, start_ms = divmod(start, 1000)
+                start_minutes, start_seconds = divmod(start_seconds, 60)
+                end_seconds, end_ms = divmod(end, 1000)
+                end_minutes, end_seconds = divmod(end_seconds, 60)
+                entry = ENTRY_TEMPLATE % (
+                    index,
+                    start_minutes // 60,
+                    start_minutes % 60,
+                    start_seconds,
+                    start_ms,
+                    end_minutes // 60,
+                    end_minutes % 60,
+                    end_seconds,
+                    end_ms,
+                    text,
+                )
+                append(entry)
+                written += 1
+                pending += len(entry)
+                if pending >= buffer_size:
+                    self._pending = 0
+                    self._write_parts()
+                    pending = 0
+        finally:
+            self._pending = pending
+        return written
+
+    def _write_parts(self):
+        data = "".join(self._parts)
+        self._parts.clear()
+        self._send(data.encode(self.encoding) if self._binary else data)
+
+    def flush(self):
+        """
+        Write the buffered entries and flush the stream.
+        """
+        if self._parts:
+            self._write_parts()
+        self._pending = 0
+        flush = getattr(self.stream, "flush", None)
+        if flush is not None:
+            flush()
+
+    def seekable(self) -> bool:
+        """
+        Tell whether :meth:`tell` and :meth:`truncate` are supported by the stream.
+
+        :return: True if the stream is seekable
+        :rtype: bool
+        """
+        seekable = getattr(self.stream, "seekable", None)
+        return bool(seekable and seekable())
+
+    def tell(self) -> Any:
+        """
+        Flush the buffer and return the current position of the stream.
+
+        :return: Position that can be passed to :meth:`truncate`
+        :rtype: Any
+        """
+        self.flush()
+        return self.stream.tell()
+
+    def truncate(self, position: Any):
+        """
+        Discard the buffered entries and everything written after ``position``.
+
+        :param position: Position returned by :meth:`tell`
+        :type position: Any
+        """
+        self._parts.clear()
+        self._pending = 0
+        self.stream.seek(position)
+        self.stream.truncate()
+
+    def __enter__(self) -> "SrtWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.flush()
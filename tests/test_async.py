@@ -0,0 +1,55 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pyasstosrt import Subtitle
+
+
+def test_aload():
+    sub = asyncio.run(Subtitle.aload("tests/sub_with_styles.ass", include_styles=["Default"]))
+
+    assert isinstance(sub, Subtitle)
+    assert sub.include_styles == ["Default"]
+
+
+def test_aconvert(sub):
+    asyncio.run(sub.aconvert())
+
+    assert len(sub.dialogues) == Path("tests/sub_standard.srt").read_text(encoding="utf-8").count(" --> ")
+
+
+def test_aexport(sub, tmp_path):
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await sub.aexport(tmp_path, executor=executor)
+
+    asyncio.run(main())
+
+    with open("tests/sub_standard.srt", encoding="utf-8") as standard:
+        assert (tmp_path / "sub.srt").read_text(encoding="utf-8") == standard.read()
+
+
+def test_aexport_output_dialogues(sub_srt):
+    dialogues = asyncio.run(sub_srt.aexport(output_dialogues=True))
+
+    assert len(dialogues) == 5
+
+
+def test_aiter_dialogues(sub):
+    async def collect():
+        return [dialogue async for dialogue in sub.aiter_dialogues(batch_size=10)]
+
+    dialogues = asyncio.run(collect())
+
+    assert [str(d) for d in dialogues] == [str(d) for d in Subtitle("tests/sub.ass").export(output_dialogues=True)]
+
+
+def test_concurrent_conversions(tmp_path):
+    async def main():
+        subs = await asyncio.gather(*(Subtitle.aload(path) for path in ["tests/sub.ass", "tests/test_sample.srt"]))
+        await asyncio.gather(*(sub.aexport(tmp_path) for sub in subs))
+
+    asyncio.run(main())
+
+    assert (tmp_path / "sub.srt").is_file()
+    assert (tmp_path / "test_sample.srt").is_file()
@@ -1,8 +1,11 @@
+import json
 import sys
 import unittest.mock
+from pathlib import Path
 
 from pyasstosrt import Subtitle as OriginalSubtitle
 from pyasstosrt.batch import app
+from pyasstosrt.conversion import profile_path
 
 
 def test_version(cli_runner):
@@ -343,6 +346,126 @@ def test_export_with_file_not_found_error(cli_runner, test_files, monkeypatch):
     assert "File not found" in result.stdout
 
 
+def test_export_stdin_to_stdout(cli_runner, test_files):
+    result = cli_runner.invoke(app, ["export", "-"], input=test_files["sub"].read_bytes())
+    assert result.exit_code == 0
+    assert result.stdout == Path("tests/sub_standard.srt").read_text(encoding="utf-8")
+
+
+def test_export_stdin_srt_with_encoding(cli_runner, test_dir):
+    result = cli_runner.invoke(
+        app, ["export", "-", "--encoding", "utf-16"], input=(test_dir / "test_sample.srt").read_bytes()
+    )
+    assert result.exit_code == 0
+    assert result.stdout_bytes.decode("utf-16").startswith("1\n00:00:10,580 --> 00:00:13,040\n")
+
+
+UNORDERED_EVENTS = b"""[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:05.00,0:00:06.00,Default,,0,0,0,,Later
+Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Earlier
+"""
+
+
+def test_export_stdin_keeps_input_order(cli_runner):
+    result = cli_runner.invoke(app, ["export", "-"], input=UNORDERED_EVENTS)
+    assert result.exit_code == 0
+    assert result.stdout.index("Later") < result.stdout.index("Earlier")
+
+
+def test_export_stdin_sort(cli_runner):
+    result = cli_runner.invoke(app, ["export", "-", "--sort"], input=UNORDERED_EVENTS)
+    assert result.exit_code == 0
+    assert result.stdout == "1\n00:00:01,000 --> 00:00:02,000\nEarlier\n\n2\n00:00:05,000 --> 00:00:06,000\nLater\n\n"
+
+
+def test_export_with_engine(cli_runner, test_files):
+    result = cli_runner.invoke(app, ["export", "-", "--engine", "regex"], input=test_files["sub"].read_bytes())
+    assert result.exit_code == 0
+    assert result.stdout == Path("tests/sub_standard.srt").read_text(encoding="utf-8")
+
+
+def test_export_with_unknown_engine(cli_runner, test_files):
+    result = cli_runner.invoke(app, ["export", str(test_files["sub"]), "--engine", "nonexistent"])
+    assert result.exit_code == 1
+    assert "Unknown parser engine" in result.stdout
+
+
+def test_export_with_stats_and_profile(cli_runner, test_files, tmp_path):
+    sources = [str(test_files["sub"]), str(Path("tests/test_sample.srt"))]
+    result = cli_runner.invoke(
+        app, ["export", *sources, "-o", str(tmp_path), "--stats", "--profile", str(tmp_path / "profiles"), "-j", "1"]
+    )
+    assert result.exit_code == 0
+    assert "Conversion stats" in result.stdout
+    assert "Total" in result.stdout
+    assert "events/s" in result.stdout
+    assert sorted(path.name for path in (tmp_path / "profiles").iterdir()) == [
+        profile_path(tmp_path / "profiles", source).name for source in sources
+    ]
+
+
+def test_export_stdin_with_stats(cli_runner, test_files, tmp_path):
+    result = cli_runner.invoke(
+        app, ["export", "-", "--stats", "--profile", str(tmp_path)], input=test_files["sub"].read_bytes()
+    )
+    assert result.exit_code == 0
+    expected = Path("tests/sub_standard.srt").read_text(encoding="utf-8")
+    if sys.version_info < (3, 10):
+        # The click version used there mixes standard error into result.stdout
+        assert result.stdout.startswith(expected)
+        assert "Conversion stats" in result.stdout[len(expected) :]
+    else:
+        assert result.stdout == expected
+        assert "Conversion stats" in result.stderr
+    assert (tmp_path / "stdin.prof").is_file()
+
+
+def test_export_with_report(cli_runner, test_files, tmp_path):
+    report = tmp_path / "run.jsonl"
+    broken = tmp_path / "broken.ass"
+    broken.write_text("", encoding="utf-8")
+
+    def subtitle(path, **kwargs):
+        if path == broken:
+            raise ValueError("broken")
+        return OriginalSubtitle(path, **kwargs)
+
+    with unittest.mock.patch("pyasstosrt.conversion.Subtitle", side_effect=subtitle):
+        result = cli_runner.invoke(
+            app,
+            ["export", str(test_files["sub"]), str(broken), "-o", str(tmp_path), "-j", "1", "--report", str(report)],
+        )
+    assert result.exit_code == 1
+
+    records = [json.loads(line) for line in report.read_text(encoding="utf-8").splitlines()]
+    assert [record["status"] for record in records[:2]] == ["ok", "error"]
+    assert records[0]["events"] == records[0]["dialogues"] > 0
+    assert records[1]["error"] == "ValueError"
+    assert records[-1]["type"] == "summary"
+    assert (records[-1]["ok"], records[-1]["error"]) == (1, 1)
+
+
+def test_export_stdin_with_report(cli_runner, test_files, tmp_path):
+    report = tmp_path / "run.jsonl"
+    result = cli_runner.invoke(app, ["export", "-", "--report", str(report)], input=test_files["sub"].read_bytes())
+    assert result.exit_code == 0
+
+    record, summary = (json.loads(line) for line in report.read_text(encoding="utf-8").splitlines())
+    assert record["source"] == record["output"] == "-"
+    assert record["input_bytes"] == test_files["sub"].stat().st_size
+    assert summary["files"] == summary["ok"] == 1
+
+
+def test_export_stdin_rejects_file_options(cli_runner, test_files, tmp_path):
+    result = cli_runner.invoke(app, ["export", "-", "-o", str(tmp_path)], input=b"")
+    assert result.exit_code == 1
+    assert "standard input" in result.output
+
+    result = cli_runner.invoke(app, ["export", "-", str(test_files["sub"])], input=b"")
+    assert result.exit_code == 1
+
+
 def test_styles_command_simple_list(cli_runner, test_files):
     """Test styles command with simple list output."""
     test_file = test_files["sub_with_styles"]
@@ -368,6 +491,34 @@ def test_styles_command_table_format(cli_runner, test_files):
     assert "Styles in" in result.stdout
 
 
+def test_styles_command_shows_event_counts(cli_runner, test_files):
+    result = cli_runner.invoke(app, ["styles", str(test_files["sub_with_styles"])])
+    assert result.exit_code == 0
+    assert "12 event(s)" in result.stdout
+    assert "25 event(s)" in result.stdout
+
+
+def test_styles_command_many_files(cli_runner, test_files, test_dir):
+    files = [str(test_files["sub_with_styles"]), str(test_files["sub"]), str(test_dir / "test_sample.srt")]
+
+    result = cli_runner.invoke(app, ["styles", *files, "--jobs", "1"])
+    assert result.exit_code == 0
+    assert "Analyzing styles in 3 files" in result.stdout
+    assert "Styles across files" in result.stdout
+    assert "388" in result.stdout
+    assert "6 unique style(s) in 3 file(s)" in result.stdout
+
+
+def test_styles_command_many_files_with_error(cli_runner, test_files, tmp_path):
+    broken = tmp_path / "broken.ass"
+    broken.write_bytes(b"[Events]\nDialogue: \xff\xfe invalid utf-8\n")
+
+    result = cli_runner.invoke(app, ["styles", str(test_files["sub"]), str(broken), "--jobs", "1"])
+    assert result.exit_code == 1
+    assert "broken.ass" in result.stdout
+    assert "1 file(s) failed" in result.stdout
+
+
 def test_styles_command_file_not_found(cli_runner):
     """Test styles command with non-existent file."""
     result = cli_runner.invoke(app, ["styles", "nonexistent.ass"])
@@ -410,3 +561,82 @@ def test_styles_command_with_srt_file(cli_runner, test_dir):
     result = cli_runner.invoke(app, ["styles", str(test_file)])
     assert result.exit_code == 0
     assert ("No styles found" in result.stdout) or ("file is in SRT format" in result.stdout)
+
+
+def test_export_parallel_jobs(cli_runner, tmp_path):
+    """Test converting several files in worker processes."""
+    files = []
+    for name in ("first", "second", "third"):
+        file = tmp_path / f"{name}.ass"
+        file.write_text(Path("tests/sub.ass").read_text(encoding="utf-8"), encoding="utf-8")
+        files.append(file)
+
+    result = cli_runner.invoke(app, ["export", *map(str, files), "--jobs", "2", "--output-dir", str(tmp_path / "out")])
+
+    assert result.exit_code == 0
+    assert "Conversion completed successfully! (3 file(s))" in result.stdout
+    expected = Path("tests/sub_standard.srt").read_text(encoding="utf-8")
+    for file in files:
+        assert f"✓ Success: {file.name} → {file.stem}.srt" in result.stdout
+        assert (tmp_path / "out" / f"{file.stem}.srt").read_text(encoding="utf-8") == expected
+
+
+def test_export_parallel_jobs_with_failure(cli_runner, tmp_path):
+    """Test that errors raised in worker processes are reported and counted."""
+    good = tmp_path / "good.ass"
+    good.write_text(Path("tests/sub.ass").read_text(encoding="utf-8"), encoding="utf-8")
+    bad = tmp_path / "bad.ass"
+    bad.write_bytes(b"[Events]\nDialogue: \xff\xfe\xfa invalid utf-8\n")
+
+    result = cli_runner.invoke(app, ["export", str(good), str(bad), "-j", "2"])
+
+    assert result.exit_code == 1
+    assert f"Failed to convert {bad.name}" in result.stdout
+    assert "1 successful, 1 failed" in result.stdout
+    assert (tmp_path / "good.srt").exists()
+
+
+def test_export_incremental(cli_runner, tmp_path):
+    """Test that --incremental only converts new or changed files."""
+    files = []
+    for name in ("first", "second"):
+        file = tmp_path / f"{name}.ass"
+        file.write_text(Path("tests/sub.ass").read_text(encoding="utf-8"), encoding="utf-8")
+        files.append(file)
+    out = tmp_path / "out"
+    args = ["export", *map(str, files), "--incremental", "-j", "1", "-o", str(out)]
+
+    result = cli_runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "(2 file(s))" in result.stdout
+    assert (out / ".pyasstosrt-manifest.json").exists()
+
+    result = cli_runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "Processing" not in result.stdout
+    assert "2 file(s) already up to date" in result.stdout
+
+    files[1].write_text(files[1].read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    result = cli_runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert f"Success: {files[1].name}" in result.stdout
+    assert f"Success: {files[0].name}" not in result.stdout
+
+    result = cli_runner.invoke(app, [*args, "--remove-effects"])
+    assert "(2 file(s))" in result.stdout
+
+
+def test_export_with_cache_dir(cli_runner, tmp_path):
+    """Test that --cache-dir stores conversions and reuses them for identical files."""
+    first = tmp_path / "first.ass"
+    second = tmp_path / "second.ass"
+    for file in (first, second):
+        file.write_bytes(Path("tests/sub.ass").read_bytes())
+    cache_dir = tmp_path / "cache"
+
+    result = cli_runner.invoke(app, ["export", str(first), str(second), "-j", "1", "--cache-dir", str(cache_dir)])
+
+    assert result.exit_code == 0
+    assert len(list(cache_dir.glob("*/*.json"))) == 1
+    expected = Path("tests/sub_standard.srt").read_text(encoding="utf-8")
+    assert (tmp_path / "second.srt").read_text(encoding="utf-8") == expected
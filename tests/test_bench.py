@@ -0,0 +1,140 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from pyasstosrt import Subtitle
+from pyasstosrt.bench import (
+    WORKLOADS,
+    collect_metadata,
+    compare_results,
+    load_results,
+    run_suite,
+    save_results,
+    slower_p_value,
+    suite,
+    write_workload,
+)
+from pyasstosrt.bench.__main__ import main
+
+BASELINE = [1.00, 1.01, 1.02, 1.03, 1.04]
+
+
+def document(timings, events=100):
+    result = {"workload": "dialogue", "operation": "convert", "events": events, "bytes": 1000, "timings": timings}
+    return {"metadata": collect_metadata(), "parameters": {"scale": 1.0}, "results": [result]}
+
+
+@pytest.mark.parametrize("name", sorted(WORKLOADS))
+def test_workloads_are_deterministic(tmp_path, name):
+    first = write_workload(name, str(tmp_path / "first"), events=50)
+    second = write_workload(name, str(tmp_path / "second"), events=50)
+    other_seed = write_workload(name, str(tmp_path / "second"), seed=1, events=50)
+
+    with open(first, "rb") as a, open(second, "rb") as b, open(other_seed, "rb") as c:
+        assert a.read() == b.read() != c.read()
+    assert len(Subtitle(first).export(output_dialogues=True)) == 50
+
+
+def test_run_suite(tmp_path, monkeypatch):
+    def measure_once(function, repeat):
+        function()
+        return [0.5] * repeat
+
+    monkeypatch.setattr(suite, "measure", measure_once)
+    lines = []
+
+    results = run_suite(
+        ["srt"], ["init", "convert", "export"], scale=0.001, repeat=2, directory=str(tmp_path), log=lines.append
+    )
+
+    assert [result["operation"] for result in results] == ["init", "convert", "export"]
+    assert all(result["events"] == 100 and result["timings"] == [0.5, 0.5] for result in results)
+    assert "events/s" in lines[-1]
+
+
+def test_measure_returns_time_per_call():
+    timings = suite.measure(lambda: None, 2)
+    assert len(timings) == 2
+    assert all(0 < timing < 0.001 for timing in timings)
+
+
+def test_save_and_load_results(tmp_path):
+    path = save_results(tmp_path, [], {"scale": 1.0})
+
+    assert path.parent == tmp_path
+    assert path.suffix == ".json"
+    assert load_results(path)["parameters"] == {"scale": 1.0}
+    assert save_results(f"{tmp_path / 'history'}/", [], {}).parent == tmp_path / "history"
+
+    (tmp_path / "other.json").write_text(json.dumps({"results": []}), encoding="utf8")
+    with pytest.raises(ValueError):
+        load_results(tmp_path / "other.json")
+
+
+def test_collect_metadata():
+    metadata = collect_metadata()
+    assert metadata["python"]["version"]
+    assert metadata["commit"] is None or len(metadata["commit"]["hash"]) == 40
+
+
+def test_slower_p_value():
+    slower = [timing * 1.5 for timing in BASELINE]
+    assert slower_p_value(BASELINE, slower) == pytest.approx(1 / 252)
+    assert slower_p_value(slower, BASELINE) == 1.0
+    assert slower_p_value(BASELINE, BASELINE) > 0.5
+    assert slower_p_value([], BASELINE) == 1.0
+
+
+@pytest.mark.parametrize(
+    ("factor", "events", "status"),
+    [(1.2, 100, "slower"), (0.8, 100, "faster"), (1.02, 100, "unchanged"), (1.2, 50, "incomparable")],
+)
+def test_compare_results(factor, events, status):
+    current = document([timing * factor for timing in BASELINE], events)
+
+    (comparison,) = compare_results(document(BASELINE), current)
+
+    assert comparison.status == status
+    assert comparison.regression is (status == "slower")
+    assert comparison.change == pytest.approx(factor - 1)
+
+
+def test_compare_results_skips_missing():
+    current = document(BASELINE)
+    current["results"][0]["operation"] = "export"
+    assert compare_results(document(BASELINE), current) == []
+
+
+def test_main_compare_exit_code(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    save_results(baseline, document(BASELINE)["results"], {"scale": 1.0})
+    save_results(current, document([timing * 1.3 for timing in BASELINE])["results"], {"scale": 1.0})
+
+    assert main(["--results", str(current), "--compare", str(baseline)]) == 1
+    assert "1 significant slowdown(s)" in capsys.readouterr().out
+    assert main(["--results", str(baseline), "--compare", str(current)]) == 0
+
+
+def test_workloads_module_runs_without_warning(tmp_path):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-W",
+            "error",
+            "-m",
+            "pyasstosrt.bench.workloads",
+            str(tmp_path),
+            "--workload",
+            "dialogue",
+            "--scale",
+            "0.001",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert [path.name for path in tmp_path.iterdir()] == ["dialogue-100-0.ass"]
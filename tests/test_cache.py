@@ -0,0 +1,178 @@
+from pathlib import Path
+
+import pytest
+
+from pyasstosrt import DiskCache, Subtitle, SubtitleCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiskCache(tmp_path / "cache")
+
+
+def copy_sub(directory: Path, name: str) -> Path:
+    path = directory / name
+    path.write_bytes(Path("tests/sub.ass").read_bytes())
+    return path
+
+
+def test_identical_content_shares_entry(tmp_path, cache, monkeypatch):
+    first = copy_sub(tmp_path, "first.ass")
+    second = copy_sub(tmp_path, "second.ass")
+
+    sub = Subtitle(first, cache=cache)
+    sub.export()
+
+    def fail(self):
+        raise AssertionError("cache hit must not parse the file")
+
+    monkeypatch.setattr(Subtitle, "_convert", fail)
+    cached = Subtitle(second, cache=cache)
+    cached.export()
+
+    expected = Path("tests/sub_standard.srt").read_text(encoding="utf-8")
+    assert (tmp_path / "second.srt").read_text(encoding="utf-8") == expected
+    assert cached.get_styles() == sub.get_styles()
+
+
+def test_options_are_part_of_key(tmp_path, cache):
+    source = copy_sub(tmp_path, "sub.ass")
+    Subtitle(source, cache=cache).convert()
+
+    sub = Subtitle(source, removing_effects=True, cache=cache)
+    sub.convert()
+
+    assert len(list(cache.directory.glob("*/*.json"))) == 2
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_cached_dialogues_match(tmp_path, cache, compact):
+    source = copy_sub(tmp_path, "sub.ass")
+    expected = Subtitle(source).export(output_dialogues=True)
+
+    Subtitle(source, cache=cache, compact=compact).convert()
+    dialogues = Subtitle(source, cache=cache, compact=compact).export(output_dialogues=True)
+
+    assert [str(dialogue) for dialogue in dialogues] == [str(dialogue) for dialogue in expected]
+
+
+def test_lru_eviction(tmp_path):
+    cache = DiskCache(tmp_path / "cache", max_size=100)
+    cache.put("aa" + "0" * 62, {"text": "x" * 60})
+    cache.put("bb" + "0" * 62, {"text": "y" * 60})
+
+    assert cache.get("aa" + "0" * 62) is None
+    assert cache.get("bb" + "0" * 62) == {"text": "y" * 60}
+    assert cache.size() <= 100
+
+
+def test_rewriting_entry_keeps_size(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path / "cache", max_size=200)
+    cache.put("aa" + "0" * 62, {"text": "x" * 60})
+    cache.put("bb" + "0" * 62, {"text": "y" * 60})
+    evictions = []
+    monkeypatch.setattr(cache, "evict", lambda: evictions.append(True))
+
+    for _ in range(5):
+        cache.put("bb" + "0" * 62, {"text": "z" * 60})
+
+    assert cache._size == cache.size()
+    assert evictions == []
+    assert cache.get("aa" + "0" * 62) == {"text": "x" * 60}
+
+
+def test_corrupt_entry_is_a_miss(tmp_path, cache):
+    key = "cd" + "0" * 62
+    cache.put(key, {"text": "x"})
+    (cache.directory / "cd" / f"{key}.json").write_text("{broken", encoding="utf-8")
+
+    assert cache.get(key) is None
+
+
+def test_clear(tmp_path, cache):
+    cache.put("ef" + "0" * 62, {"text": "x"})
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_default_directory(monkeypatch, tmp_path):
+    monkeypatch.setenv("PYASSTOSRT_CACHE_DIR", str(tmp_path))
+    assert DiskCache().directory == tmp_path
+
+
+def test_subtitle_cache_hits_and_misses(tmp_path):
+    source = copy_sub(tmp_path, "sub.ass")
+    cache = SubtitleCache()
+
+    first = cache.get(source, removing_effects=True)
+    second = cache.get(str(source), removing_effects=True)
+    other = cache.get(source)
+
+    assert first is second
+    assert other is not first
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 2
+    assert first.dialogues
+
+
+def test_subtitle_cache_hit_only_stats(tmp_path, monkeypatch):
+    source = copy_sub(tmp_path, "sub.ass")
+    cache = SubtitleCache()
+    cache.get(source)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache hit must not open the file")
+
+    monkeypatch.setattr("builtins.open", fail)
+    cache.get(source)
+    assert cache.hits == 1
+
+
+def test_subtitle_cache_reloads_changed_file(tmp_path):
+    source = copy_sub(tmp_path, "sub.ass")
+    cache = SubtitleCache()
+    first = cache.get(source)
+
+    source.write_text(source.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+
+    assert cache.get(source) is not first
+    assert (cache.hits, cache.misses, len(cache)) == (0, 2, 1)
+
+
+def test_subtitle_cache_eviction(tmp_path):
+    sources = [copy_sub(tmp_path, f"{name}.ass") for name in ("a", "b", "c")]
+    cache = SubtitleCache(max_entries=2)
+    for source in sources:
+        cache.get(source)
+    cache.get(sources[0])
+    assert (cache.hits, cache.misses, len(cache)) == (0, 4, 2)
+
+    cache = SubtitleCache(max_bytes=sources[0].stat().st_size * 2)
+    for source in sources:
+        cache.get(source)
+    assert len(cache) == 2
+    assert cache.size == sources[0].stat().st_size * 2
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache), cache.size) == (0, 0, 0, 0)
+
+
+def test_subtitle_cached(tmp_path):
+    source = copy_sub(tmp_path, "sub.ass")
+    assert Subtitle.cached(source) is Subtitle.cached(source)
+
+
+def test_subtitle_cache_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        SubtitleCache().get(tmp_path / "missing.ass")
+
+
+def test_memory_source_uses_content_key(tmp_path, cache):
+    source = copy_sub(tmp_path, "sub.ass")
+    Subtitle(source, cache=cache).convert()
+
+    sub = Subtitle.from_bytes(source.read_bytes(), name="upload.ass", cache=cache)
+    sub.convert()
+
+    assert len(list(cache.directory.glob("*/*.json"))) == 1
+    assert sub.dialogues
@@ -0,0 +1,77 @@
+import shutil
+
+import pytest
+
+from pyasstosrt import Subtitle
+
+
+@pytest.fixture
+def count_conversions(monkeypatch):
+    calls = []
+    original = Subtitle._convert
+
+    def counting(self):
+        calls.append(self)
+        original(self)
+
+    monkeypatch.setattr(Subtitle, "_convert", counting)
+    return calls
+
+
+def test_convert_is_idempotent(count_conversions):
+    sub = Subtitle("tests/sub_with_styles.ass")
+    sub.convert()
+    dialogues = list(sub.dialogues)
+    sub.convert()
+
+    assert sub.dialogues == dialogues
+    assert len(count_conversions) == 1
+
+
+@pytest.mark.parametrize("path", ["tests/sub_with_styles.ass", "tests/test_sample.srt"])
+def test_conversion_is_shared_between_calls(count_conversions, path, tmp_path):
+    sub = Subtitle(path)
+    sub.get_styles()
+    sub.get_styles()
+    dialogues = sub.export(output_dialogues=True)
+    sub.export(tmp_path)
+    sub.export(tmp_path)
+
+    assert len(count_conversions) == 1
+    assert (tmp_path / f"{sub.file}.srt").read_text(encoding="utf8") == "".join(str(d) for d in dialogues)
+
+
+def test_changed_options_convert_again(count_conversions):
+    sub = Subtitle("tests/sub_with_styles.ass")
+    assert len(sub.export(output_dialogues=True)) == 25
+
+    sub.include_styles = ["Signs"]
+    assert len(sub.export(output_dialogues=True)) == 3
+
+    sub.include_styles.append("Credits")
+    assert len(sub.export(output_dialogues=True)) == 4
+    assert len(count_conversions) == 3
+
+
+def test_retiming_is_kept_until_invalidated():
+    sub = Subtitle("tests/sub.ass")
+    first_start = sub.export(output_dialogues=True)[0].start.total_milliseconds
+    sub.shift(1000)
+
+    assert sub.export(output_dialogues=True)[0].start.total_milliseconds == first_start + 1000
+
+    sub.invalidate()
+    assert sub.export(output_dialogues=True)[0].start.total_milliseconds == first_start
+
+
+def test_invalidate_reads_changed_file(tmp_path):
+    path = tmp_path / "sub.ass"
+    shutil.copy("tests/sub_with_styles.ass", path)
+    sub = Subtitle(path, include_styles=["Default"])
+    assert len(sub.export(output_dialogues=True)) == 12
+
+    path.write_text(path.read_text(encoding="utf8").replace(",Alt,", ",Default,"), encoding="utf8")
+    assert len(sub.export(output_dialogues=True)) == 12
+
+    sub.invalidate()
+    assert len(sub.export(output_dialogues=True)) == 15
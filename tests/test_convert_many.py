@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from pyasstosrt import ConversionResult, ConversionStats, convert_many, iter_convert_many
+from pyasstosrt.conversion import convert_file, profile_path
+
+
+@pytest.fixture
+def sources(tmp_path):
+    files = []
+    for name in ("first", "second", "third"):
+        file = tmp_path / f"{name}.ass"
+        file.write_text(Path("tests/sub.ass").read_text(encoding="utf-8"), encoding="utf-8")
+        files.append(file)
+    return files
+
+
+@pytest.mark.parametrize("executor", ["process", "thread", "serial"])
+def test_convert_many(sources, tmp_path, executor):
+    results = convert_many(sources, tmp_path / "out", executor=executor, max_workers=2)
+
+    expected = Path("tests/sub_standard.srt").read_text(encoding="utf-8")
+    assert [result.source for result in results] == sources
+    for result in results:
+        assert isinstance(result, ConversionResult)
+        assert result.ok
+        assert result.output == tmp_path / "out" / f"{result.source.stem}.srt"
+        assert result.output.read_text(encoding="utf-8") == expected
+        assert result.dialogue_count == expected.count(" --> ")
+        assert result.elapsed > 0
+
+
+def test_convert_many_collects_errors(sources, tmp_path):
+    missing = tmp_path / "missing.ass"
+
+    results = convert_many([sources[0], missing], executor="thread")
+
+    assert results[0].ok
+    assert not results[1].ok
+    assert isinstance(results[1].error, FileNotFoundError)
+    assert results[1].output is None
+
+
+def test_convert_many_passes_options(tmp_path):
+    results = convert_many(
+        ["tests/sub_with_styles.ass"], executor="serial", output_dialogues=True, include_styles=["Default"]
+    )
+
+    assert results[0].output is None
+    assert results[0].dialogue_count == 12
+    assert len(results[0].dialogues) == 12
+
+
+def test_convert_many_collects_stats_and_profiles(sources, tmp_path):
+    results = convert_many(
+        sources[:2], tmp_path / "out", executor="process", collect_stats=True, profile_dir=tmp_path / "profiles"
+    )
+
+    for result in results:
+        assert result.stats["parse"].bytes == result.source.stat().st_size
+        assert result.stats["write"].items == result.dialogue_count
+        assert result.profile == profile_path(tmp_path / "profiles", result.source)
+        assert result.profile.stat().st_size > 0
+
+    assert convert_many(sources[:1], tmp_path / "out", executor="serial")[0].stats is None
+
+
+def test_profiles_of_files_with_the_same_name(tmp_path):
+    sources = []
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        sources.append(tmp_path / directory / "ep1.ass")
+        sources[-1].write_text(Path("tests/sub.ass").read_text(encoding="utf-8"), encoding="utf-8")
+
+    results = convert_many(sources, executor="serial", profile_dir=tmp_path / "profiles")
+
+    assert results[0].profile != results[1].profile
+    assert all(result.profile.name.startswith("ep1-") for result in results)
+    assert len(list((tmp_path / "profiles").iterdir())) == 2
+
+
+@pytest.mark.parametrize("collect_stats", [False, True])
+def test_convert_file_with_given_stats(sources, tmp_path, collect_stats):
+    stats = ConversionStats()
+
+    result = convert_file(sources[0], tmp_path / "out", collect_stats=collect_stats, stats=stats)
+
+    assert result.ok
+    assert result.stats is stats
+    assert stats["write"].items == result.dialogue_count > 0
+
+
+def test_iter_convert_many_yields_every_result(sources, tmp_path):
+    submitted = []
+
+    results = list(iter_convert_many(sources, tmp_path, executor="process", on_submit=submitted.append))
+
+    assert submitted == sources
+    assert sorted(result.source for result in results) == sorted(sources)
+    assert all(result.ok for result in results)
+
+
+def test_iter_convert_many_with_existing_executor(sources, tmp_path):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(iter_convert_many(sources, tmp_path, executor=executor))
+        assert executor.submit(len, "still running").result() == 13
+
+    assert len(results) == 3
+
+
+def test_unknown_executor(sources):
+    with pytest.raises(ValueError):
+        convert_many(sources, executor="cluster")
@@ -0,0 +1,92 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from pyasstosrt import ParserEngine, Subtitle, get_engine, register_engine
+from pyasstosrt.engines import ENGINES, RegexEngine, ScannerEngine
+
+REORDERED_EVENTS = """[Events]
+Format: Layer, Style, Start, End, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,Default,0:00:01.00,0:00:02.00,,0,0,0,,Reordered
+"""
+
+
+@pytest.mark.parametrize(
+    "path", ["tests/sub.ass", "tests/sub_with_styles.ass", "tests/sub_standard.srt", "tests/test_sample.srt"]
+)
+def test_engines_agree_on_well_formed_files(path):
+    scanner = Subtitle(path).export(output_dialogues=True)
+    regex = Subtitle(path, engine="regex").export(output_dialogues=True)
+
+    assert [str(d) for d in regex] == [str(d) for d in scanner]
+
+
+def test_engines_agree_on_streamed_export():
+    outputs = []
+    for engine in ("scanner", "regex"):
+        stream = io.StringIO()
+        Subtitle.from_string(Path("tests/sub.ass").read_text(encoding="utf8"), engine=engine).export(stream=stream)
+        outputs.append(stream.getvalue())
+
+    assert outputs[0] == outputs[1]
+
+
+def test_engines_differ_on_reordered_columns():
+    assert [d.text for d in Subtitle.from_string(REORDERED_EVENTS).export(output_dialogues=True)] == ["Reordered"]
+    assert Subtitle.from_string(REORDERED_EVENTS, engine="regex").export(output_dialogues=True) == []
+
+
+def test_get_engine():
+    assert isinstance(get_engine(), ScannerEngine)
+    assert isinstance(get_engine("regex"), RegexEngine)
+    engine = RegexEngine()
+    assert get_engine(engine) is engine
+
+    with pytest.raises(ValueError, match="Unknown parser engine"):
+        get_engine("nonexistent")
+    with pytest.raises(ValueError):
+        Subtitle("tests/sub.ass", engine="nonexistent")
+
+
+def test_register_custom_engine(monkeypatch):
+    class UpperEngine(ScannerEngine):
+        name = "upper"
+
+        def iter_ass_events(self, source, encoding="utf8", sections=None):
+            for start, end, style, text in super().iter_ass_events(source, encoding, sections):
+                yield start, end, style, text.upper()
+
+    monkeypatch.setattr("pyasstosrt.engines.ENGINES", dict(ENGINES))
+    register_engine(UpperEngine())
+    dialogues = Subtitle("tests/sub_with_styles.ass", engine="upper").export(output_dialogues=True)
+
+    assert all(d.text == d.text.upper() for d in dialogues)
+
+    class NamelessEngine(ScannerEngine):
+        name = ""
+
+    with pytest.raises(ValueError):
+        register_engine(NamelessEngine())
+
+
+def test_incomplete_engine_cannot_be_created():
+    class AssOnlyEngine(ParserEngine):
+        name = "ass-only"
+
+        def iter_ass_events(self, source, encoding="utf8", sections=None):
+            return iter(())
+
+    with pytest.raises(TypeError):
+        ParserEngine()
+    with pytest.raises(TypeError):
+        AssOnlyEngine()
+
+
+def test_changing_engine_converts_again():
+    sub = Subtitle.from_string(REORDERED_EVENTS)
+    assert len(sub.export(output_dialogues=True)) == 1
+
+    sub.engine = "regex"
+    assert sub.options["engine"] == "regex"
+    assert sub.export(output_dialogues=True) == []
@@ -1,3 +1,4 @@
+import io
 from pathlib import Path
 
 
@@ -39,3 +40,17 @@ def test_export_compatibility(sub):
 def test_export_output_dialogues_true(sub):
     assert sub.export(None, "utf8", True)
     assert not Path("tests/sub.srt").is_file()
+
+
+def test_export_text_stream(sub):
+    stream = io.StringIO()
+    assert sub.export(stream=stream) is None
+    assert stream.getvalue() == Path("tests/sub_standard.srt").read_text(encoding="utf-8")
+    assert not Path("tests/sub.srt").is_file()
+
+
+def test_export_binary_stream(sub):
+    stream = io.BytesIO()
+    sub.export(stream=stream, encoding="utf-16")
+    assert not stream.closed
+    assert stream.getvalue().decode("utf-16") == Path("tests/sub_standard.srt").read_text(encoding="utf-8")
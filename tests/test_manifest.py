@@ -0,0 +1,89 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pyasstosrt.manifest import MANIFEST_NAME, Manifest, file_digest
+
+OPTIONS = {"removing_effects": False, "encoding": "utf8"}
+
+
+def make_source(tmp_path: Path) -> Path:
+    source = tmp_path / "sub.ass"
+    source.write_text(Path("tests/sub.ass").read_text(encoding="utf-8"), encoding="utf-8")
+    return source
+
+
+def test_file_digest_matches_hashlib(tmp_path):
+    import hashlib
+
+    source = make_source(tmp_path)
+    assert file_digest(source, chunk_size=7) == hashlib.sha256(source.read_bytes()).hexdigest()
+
+
+def test_record_and_reload(tmp_path):
+    source = make_source(tmp_path)
+    output = tmp_path / "sub.srt"
+    output.write_text("1\n", encoding="utf-8")
+
+    manifest = Manifest.for_directory(tmp_path, "1.0")
+    assert not manifest.is_up_to_date(source, output, OPTIONS)
+    manifest.record(source, output, OPTIONS)
+    manifest.save()
+
+    assert (tmp_path / MANIFEST_NAME).exists()
+    reloaded = Manifest.for_directory(tmp_path, "1.0")
+    assert reloaded.is_up_to_date(source, output, OPTIONS)
+
+
+def test_changed_options_version_or_missing_output(tmp_path):
+    source = make_source(tmp_path)
+    output = tmp_path / "sub.srt"
+    output.write_text("1\n", encoding="utf-8")
+    manifest = Manifest.for_directory(tmp_path, "1.0")
+    manifest.record(source, output, OPTIONS)
+    manifest.save()
+
+    assert not manifest.is_up_to_date(source, output, dict(OPTIONS, removing_effects=True))
+    assert not Manifest.for_directory(tmp_path, "2.0").is_up_to_date(source, output, OPTIONS)
+    output.unlink()
+    assert not manifest.is_up_to_date(source, output, OPTIONS)
+
+
+def test_touched_source_is_hashed(tmp_path):
+    source = make_source(tmp_path)
+    output = tmp_path / "sub.srt"
+    output.write_text("1\n", encoding="utf-8")
+    manifest = Manifest.for_directory(tmp_path, "1.0")
+    manifest.record(source, output, OPTIONS)
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert manifest.is_up_to_date(source, output, OPTIONS)
+    assert manifest.entries[str(source.resolve())]["mtime_ns"] == source.stat().st_mtime_ns
+
+    content = source.read_bytes()
+    source.write_bytes(content.replace(b"Dialogue:", b"Dialogue;", 1))
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    assert not manifest.is_up_to_date(source, output, OPTIONS)
+
+
+def test_corrupt_manifest_is_ignored(tmp_path):
+    (tmp_path / MANIFEST_NAME).write_text("{not json", encoding="utf-8")
+    assert Manifest.for_directory(tmp_path, "1.0").entries == {}
+
+
+def test_concurrent_saves(tmp_path):
+    source = make_source(tmp_path)
+    output = tmp_path / "sub.srt"
+    output.write_text("1\n", encoding="utf-8")
+
+    def save(_):
+        manifest = Manifest.for_directory(tmp_path, "1.0")
+        manifest.record(source, output, OPTIONS)
+        manifest.save()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(save, range(32)))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([MANIFEST_NAME, "sub.ass", "sub.srt"])
+    assert Manifest.for_directory(tmp_path, "1.0").is_up_to_date(source, output, OPTIONS)
@@ -1,3 +1,4 @@
+import io
 from pathlib import Path
 
 import pytest
@@ -45,3 +46,102 @@ def test_open_errors(file_path, expected_error):
     else:
         with pytest.raises(expected_error):
             Subtitle(file_path)
+
+
+def test_from_string():
+    text = Path("tests/sub.ass").read_text(encoding="utf-8")
+    sub = Subtitle.from_string(text, name="episode.ass")
+    assert sub.filepath is None
+    assert sub.file == "episode"
+    assert sub.raw_text == text
+    assert [str(d) for d in sub.export(output_dialogues=True)] == [
+        str(d) for d in Subtitle("tests/sub.ass").export(output_dialogues=True)
+    ]
+
+
+def test_from_bytes_srt():
+    data = Path("tests/test_sample.srt").read_bytes()
+    sub = Subtitle.from_bytes(data, name="sample.srt", remove_duplicates=True)
+    assert sub.is_remove_duplicates
+    assert [str(d) for d in sub.export(output_dialogues=True)] == [
+        str(d) for d in Subtitle("tests/test_sample.srt", remove_duplicates=True).export(output_dialogues=True)
+    ]
+
+
+def test_from_stream():
+    with open("tests/sub.ass", "rb") as stream:
+        sub = Subtitle.from_stream(stream)
+    assert sub.file == "sub"
+    assert sub.get_styles() == Subtitle("tests/sub.ass").get_styles()
+
+    with open("tests/sub.ass", encoding="utf-8") as stream:
+        assert Subtitle.from_stream(stream, name="other.ass").file == "other"
+
+
+def test_from_stream_unbuffered_reads_lazily():
+    with open("tests/sub.ass", "rb") as stream:
+        sub = Subtitle.from_stream(stream, buffered=False)
+        assert not sub.is_srt_format()
+        assert stream.tell() < Path("tests/sub.ass").stat().st_size
+
+        output = io.StringIO()
+        sub.export(stream=output)
+
+    assert output.getvalue() == Path("tests/sub_standard.srt").read_text(encoding="utf-8")
+    with pytest.raises(ValueError):
+        sub.export(stream=io.StringIO())
+
+
+def test_from_stream_unbuffered_detects_srt():
+    text = Path("tests/test_sample.srt").read_text(encoding="utf-8")
+    sub = Subtitle.from_stream(io.StringIO("\n" + text), buffered=False)
+
+    assert sub.is_srt_format()
+    assert [str(d) for d in sub.iter_dialogues()] == [str(d) for d in Subtitle.from_string(text).iter_dialogues()]
+
+
+def test_from_stream_unbuffered_reads_rest_when_needed():
+    with open("tests/sub.ass", encoding="utf-8") as stream:
+        sub = Subtitle.from_stream(stream, buffered=False)
+        sub.is_srt_format()
+        assert sub.get_text() == Path("tests/sub.ass").read_text(encoding="utf-8")
+
+    assert sub.get_styles() == ["Default"]
+
+
+def test_from_string_output_path(tmp_path):
+    sub = Subtitle.from_string(Path("tests/sub.ass").read_text(encoding="utf-8"), name="episode.ass")
+    assert sub.output_path() == Path("episode.srt")
+    sub.export(tmp_path)
+    assert (tmp_path / "episode.srt").read_text(encoding="utf-8") == Path("tests/sub_standard.srt").read_text(
+        encoding="utf-8"
+    )
+
+
+CRLF_DOCUMENT = (
+    "[Script Info]\r\n"
+    "ScriptType: v4.00+\r\n"
+    "\r\n"
+    "[Events]\r\n"
+    "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\r\n"
+    "Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Hello\r\n"
+    "Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,\r\n"
+    "Dialogue: 0,0:00:05.00,0:00:06.00,Default,,0,0,0,,{\\an8}\r\n"
+)
+
+
+@pytest.mark.parametrize("engine", ["scanner", "regex"])
+def test_crlf_text_in_memory_matches_file(tmp_path, engine):
+    path = tmp_path / "crlf.ass"
+    path.write_bytes(CRLF_DOCUMENT.encode("utf8"))
+    expected = Subtitle(path, engine=engine).export(output_dialogues=True)
+
+    subs = [
+        Subtitle.from_bytes(CRLF_DOCUMENT.encode("utf8"), engine=engine),
+        Subtitle.from_string(CRLF_DOCUMENT, engine=engine),
+        Subtitle.from_stream(io.BytesIO(CRLF_DOCUMENT.encode("utf8")), engine=engine),
+    ]
+
+    assert [dialogue.text for dialogue in expected] == ["Hello"]
+    for sub in subs:
+        assert [str(dialogue) for dialogue in sub.export(output_dialogues=True)] == [str(d) for d in expected]
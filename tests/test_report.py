@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+
+from pyasstosrt import convert_many
+from pyasstosrt.report import REPORT_FORMAT, RunReport
+
+
+def read_records(path: Path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_report_records_and_summary(tmp_path):
+    results = convert_many(["tests/sub.ass", tmp_path / "missing.ass"], tmp_path, executor="serial", collect_stats=True)
+    report = RunReport(tmp_path / "reports" / "run.jsonl", {"engine": "scanner"})
+    for result in results:
+        report.add(result)
+    report.add_skipped("tests/test_sample.srt", tmp_path / "test_sample.srt")
+    report.close()
+    report.close()
+
+    converted, failed, skipped, summary = read_records(tmp_path / "reports" / "run.jsonl")
+    assert converted["status"] == "ok"
+    assert converted["output"] == str(tmp_path / "sub.srt")
+    assert converted["input_bytes"] == Path("tests/sub.ass").stat().st_size
+    assert converted["output_bytes"] == (tmp_path / "sub.srt").stat().st_size
+    assert converted["events"] == converted["kept"] == converted["dialogues"] == 376
+    assert converted["error"] is None
+
+    assert failed["status"] == "error"
+    assert failed["error"] == "FileNotFoundError"
+    assert "missing.ass" in failed["message"]
+    assert failed["output"] is None and failed["input_bytes"] is None
+
+    assert skipped["status"] == "skipped"
+    assert skipped["events"] is None
+
+    assert summary["type"] == "summary"
+    assert summary["format"] == REPORT_FORMAT
+    assert (summary["files"], summary["ok"], summary["error"], summary["skipped"]) == (3, 1, 1, 1)
+    assert summary["dialogues"] == 376
+    assert summary["input_bytes"] == converted["input_bytes"] + skipped["input_bytes"]
+    assert summary["peak_memory"] >= converted["peak_memory"] > 0
+    assert summary["options"] == {"engine": "scanner"}
+
+
+def test_report_is_flushed_per_record(tmp_path):
+    result = convert_many(["tests/sub.ass"], tmp_path, executor="serial")[0]
+    report = RunReport(tmp_path / "run.jsonl")
+    report.add(result)
+
+    # Readable before the report is closed, without event counts when no stats were collected
+    (record,) = read_records(tmp_path / "run.jsonl")
+    assert record["status"] == "ok"
+    assert record["events"] is None
+    report.close()
@@ -2,16 +2,6 @@ import os
 import tempfile
 
 from pyasstosrt import Subtitle
-from pyasstosrt.pyasstosrt import Subtitle as SubtitleClass
-
-
-def test_srt_time_conversion():
-    """Test SRT time format conversion to ASS format."""
-    # SRT: 00:00:10,580 -> ASS: 0:00:10.58
-    assert SubtitleClass._srt_time_to_ass("00:00:10,580") == "0:00:10.58"
-    assert SubtitleClass._srt_time_to_ass("00:01:23,456") == "0:01:23.45"
-    assert SubtitleClass._srt_time_to_ass("01:23:45,678") == "1:23:45.67"
-    assert SubtitleClass._srt_time_to_ass("12:34:56,789") == "12:34:56.78"
 
 
 def test_srt_dialogue_count(sub_srt):
@@ -136,3 +126,31 @@ def test_srt_dialogue_structure(sub_srt):
         # Start should be before end (using subtraction since Time supports it)
         duration = dialogue.end - dialogue.start
         assert duration > 0
+
+
+def test_srt_keeps_millisecond_precision():
+    """Test that SRT timestamps are not truncated to centiseconds."""
+    srt_content = """1
+00:00:01,005 --> 00:00:03,999
+Precise
+
+2
+10:00:00,000 --> 10:00:01,000
+Late
+
+3
+02:00:00,000 --> 02:00:01,000
+Early
+"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".srt", delete=False, encoding="utf-8") as f:
+        f.write(srt_content)
+        temp_path = f.name
+
+    try:
+        sub = Subtitle(temp_path)
+        sub.convert()
+
+        assert sub.dialogues[0].get_timestamp() == "00:00:01,005 --> 00:00:03,999"
+        assert [d.text for d in sub.dialogues] == ["Precise", "Early", "Late"]
+    finally:
+        os.unlink(temp_path)
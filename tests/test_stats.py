@@ -0,0 +1,130 @@
+import io
+import time
+from pathlib import Path
+
+from pyasstosrt import ConversionStats, DiskCache, Subtitle
+
+DUPLICATES = """[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Hello
+Dialogue: 0,0:00:02.00,0:00:03.00,Default,,0,0,0,,Hello
+Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,World
+"""
+
+UNORDERED = """[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,First
+Dialogue: 0,0:00:05.00,0:00:06.00,Default,,0,0,0,,Third
+Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Second
+"""
+
+
+def test_export_records_stages(tmp_path):
+    stats = ConversionStats()
+    Subtitle("tests/sub.ass", stats=stats).export(tmp_path)
+
+    # Events already in order are written without sorting them
+    assert list(stats.as_dict()) == ["index", "parse", "filter", "format", "write"]
+    assert stats["parse"].bytes == Path("tests/sub.ass").stat().st_size
+    assert stats["parse"].items >= stats["filter"].items
+    assert stats["format"].items == stats["write"].items > 0
+    assert stats["write"].bytes == (tmp_path / "sub.srt").stat().st_size
+    assert all(stage.calls == 1 and stage.elapsed >= 0 for stage in stats.stages.values())
+    assert stats.elapsed == sum(stage.elapsed for stage in stats.stages.values())
+
+
+def test_convert_records_sort_merge_and_format():
+    stats = ConversionStats()
+    sub = Subtitle.from_string(DUPLICATES, remove_duplicates=True, stats=stats)
+    sub.convert()
+
+    assert list(stats.as_dict()) == ["parse", "filter", "sort", "merge", "format"]
+    assert stats["parse"].items == stats["filter"].items == stats["sort"].items == 3
+    assert stats["merge"].items == stats["format"].items == len(sub.dialogues) == 2
+
+
+def test_srt_and_unbuffered_stream():
+    stats = ConversionStats()
+    Subtitle("tests/test_sample.srt", stats=stats).export(stream=io.StringIO())
+    assert stats["parse"].items == stats["write"].items > 0
+
+    text = Path("tests/sub.ass").read_text(encoding="utf8")
+    stats = ConversionStats()
+    sub = Subtitle.from_stream(io.StringIO(text), buffered=False, stats=stats)
+    sub.export(stream=io.StringIO(), sort=False)
+
+    assert stats["read"].bytes == len(text.encode("utf8"))
+    assert stats["read"].items == len(text.splitlines())
+    assert "sort" not in stats.stages
+
+
+def test_out_of_order_export_counts_kept_pass_only(tmp_path):
+    source = tmp_path / "unordered.ass"
+    source.write_text(UNORDERED, encoding="utf-8")
+    runs = []
+    stats = ConversionStats(callback=runs.append)
+
+    Subtitle(source, stats=stats).export(tmp_path)
+
+    assert stats["parse"].items == stats["filter"].items == stats["sort"].items == 3
+    assert stats["parse"].bytes == source.stat().st_size
+    assert stats["format"].items == stats["write"].items == 3
+    assert [run.name for run in runs].count("parse") == 1
+    assert all(stage.calls == 1 for stage in stats.stages.values())
+
+
+def test_in_order_export_is_merged(tmp_path):
+    runs = []
+    stats = ConversionStats(callback=runs.append)
+
+    Subtitle("tests/sub.ass", stats=stats).export(tmp_path)
+
+    assert [run.name for run in runs].count("parse") == 1
+    assert stats.elapsed >= stats["write"].elapsed > 0
+
+
+def test_cache_hit_skips_conversion(tmp_path):
+    cache = DiskCache(tmp_path / "cache")
+    Subtitle("tests/sub.ass", cache=cache).convert()
+
+    stats = ConversionStats()
+    Subtitle("tests/sub.ass", cache=cache, stats=stats).convert()
+
+    assert list(stats.stages) == ["cache"]
+
+
+def test_callback_and_accumulation():
+    runs = []
+    stats = ConversionStats(callback=runs.append)
+    for _ in range(2):
+        Subtitle("tests/sub.ass", stats=stats).convert()
+
+    assert stats["parse"].calls == 2
+    assert stats["parse"].items == sum(run.items for run in runs if run.name == "parse")
+    assert "parse" in str(stats)
+
+    stats.reset()
+    assert stats.stages == {}
+    assert stats["parse"].calls == 0
+
+
+def test_reused_after_reset():
+    stats = ConversionStats()
+    with stats.measure("parse"):
+        time.sleep(0.05)
+    stats.reset()
+    outer = ConversionStats()
+
+    with outer.measure("write"):
+        time.sleep(0.02)
+        outer.merge(stats)
+
+    assert outer.stages.keys() == {"write"}
+    assert outer["write"].elapsed >= 0.02
+
+
+def test_stats_do_not_change_output():
+    expected = Subtitle("tests/sub.ass").export(output_dialogues=True)
+    measured = Subtitle("tests/sub.ass", stats=ConversionStats()).export(output_dialogues=True)
+
+    assert [str(d) for d in measured] == [str(d) for d in expected]
@@ -0,0 +1,347 @@
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyasstosrt import Subtitle
+from pyasstosrt.parser import (
+    has_srt_timecode,
+    index_sections,
+    iter_ass_events,
+    iter_ass_events_regex,
+    iter_section_lines,
+    iter_srt_entries,
+)
+
+# The whole-document pattern the SRT reader replaced, kept as a reference implementation
+SRT_ENTRY_PATTERN = re.compile(
+    r"^\d+\s*$\s+"
+    r"^(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*$\s+"
+    r"((?:^(?!\d+\s*$).+$\s*)*)",
+    re.MULTILINE,
+)
+
+
+def regex_srt_entries(text):
+    for start, end, body in SRT_ENTRY_PATTERN.findall(text):
+        yield start, end, " ".join(line.strip() for line in body.strip().split("\n") if line.strip())
+
+
+ASS_DOCUMENT = """[Script Info]
+Title: Streaming
+Dialogue: 0,0:00:00.00,0:00:01.00,Default,,0,0,0,,Outside of events
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Comment: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Commented out
+Dialogue: 0,0:00:02.00,0:00:03.00,Default,,0,0,0,,{\\i1}First{\\i0} line
+Dialogue: 0,0:00:04.00,0:00:05.00,Signs,,0,0,0,,Second, with commas
+
+[Fonts]
+Dialogue: 0,0:00:06.00,0:00:07.00,Default,,0,0,0,,Not an event
+"""
+
+
+def test_iter_ass_events_only_reads_events_section():
+    events = list(iter_ass_events(io.StringIO(ASS_DOCUMENT)))
+
+    assert events == [
+        ("0:00:02.00", "0:00:03.00", "Default", "First line"),
+        ("0:00:04.00", "0:00:05.00", "Signs", "Second, with commas"),
+    ]
+
+
+def test_iter_ass_events_is_lazy():
+    consumed = []
+
+    def lines():
+        for line in io.StringIO(ASS_DOCUMENT):
+            consumed.append(line)
+            yield line
+
+    events = iter_ass_events(lines())
+    assert consumed == []
+
+    next(events)
+    assert consumed[-1].startswith("Dialogue: 0,0:00:02.00")
+    assert len(consumed) < len(ASS_DOCUMENT.splitlines())
+
+
+def test_convert_does_not_load_raw_text(sub):
+    sub.convert()
+
+    assert sub.dialogues
+    assert sub._raw_text is None
+
+
+def test_raw_text_is_read_on_access(sub):
+    assert sub.raw_text.startswith("[Script Info]")
+    assert sub._raw_text is sub.raw_text
+
+
+def test_assigning_raw_text_replaces_the_source(tmp_path):
+    sub = Subtitle("tests/sub.ass")
+    sub.convert()
+    assert len(sub.dialogues) > 1
+
+    sub.raw_text = UNORDERED_DOCUMENT
+
+    assert [dialogue.text for dialogue in sub.export(output_dialogues=True)] == ["First", "Second", "Third"]
+    assert sub.scan_styles().counts == {"Default": 3}
+    sub.export(tmp_path)
+    assert (tmp_path / "sub.srt").read_text(encoding="utf-8").count("-->") == 3
+
+
+def test_streamed_conversion_matches_standard(tmp_path):
+    sub = Subtitle("tests/sub.ass")
+    sub.export(tmp_path)
+
+    with open("tests/sub_standard.srt", encoding="utf-8") as standard:
+        assert (tmp_path / "sub.srt").read_text(encoding="utf-8") == standard.read()
+
+
+def test_export_streams_without_converting(tmp_path):
+    sub = Subtitle("tests/sub.ass")
+    sub.export(tmp_path)
+
+    assert sub.dialogues == []
+    assert not sub._converted
+
+
+def test_save_returns_dialogue_count(tmp_path):
+    count = Subtitle("tests/sub.ass").save(tmp_path)
+
+    assert count == len(Subtitle("tests/sub.ass").export(output_dialogues=True))
+    with open("tests/sub_standard.srt", encoding="utf-8") as standard:
+        assert (tmp_path / "sub.srt").read_text(encoding="utf-8") == standard.read()
+
+
+def test_failed_export_keeps_previous_output(tmp_path):
+    source = tmp_path / "sub.ass"
+    data = open("tests/sub.ass", "rb").read()
+    source.write_bytes(data[: len(data) // 2] + b"\xff\xfe\n" + data[len(data) // 2 :])
+    previous = tmp_path / "sub.srt"
+    previous.write_text("previous\n", encoding="utf-8")
+
+    with pytest.raises(UnicodeDecodeError):
+        Subtitle(source).export(tmp_path)
+
+    assert previous.read_text(encoding="utf-8") == "previous\n"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["sub.ass", "sub.srt"]
+
+
+def test_concurrent_saves_of_the_same_output(tmp_path):
+    sub = Subtitle("tests/sub.ass")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        counts = list(executor.map(lambda _: sub.save(tmp_path), range(32)))
+
+    assert len(set(counts)) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["sub.srt"]
+    with open("tests/sub_standard.srt", encoding="utf-8") as standard:
+        assert (tmp_path / "sub.srt").read_text(encoding="utf-8") == standard.read()
+    (tmp_path / "plain").write_text("", encoding="utf-8")
+    assert (tmp_path / "sub.srt").stat().st_mode == (tmp_path / "plain").stat().st_mode
+
+
+UNORDERED_DOCUMENT = """[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,First
+Dialogue: 0,0:00:05.00,0:00:06.00,Default,,0,0,0,,Third
+Dialogue: 0,0:00:03.00,0:00:04.00,Default,,0,0,0,,Second
+"""
+
+
+class UnseekableStream(io.StringIO):
+    def seekable(self):
+        return False
+
+
+@pytest.mark.parametrize("stream_type", [io.StringIO, UnseekableStream])
+def test_streamed_export_sorts_unordered_events(stream_type):
+    stream = stream_type()
+    stream.write("prefix\n")
+    Subtitle.from_string(UNORDERED_DOCUMENT).export(stream=stream)
+
+    assert stream.getvalue() == (
+        "prefix\n"
+        "1\n00:00:01,000 --> 00:00:02,000\nFirst\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nSecond\n\n"
+        "3\n00:00:05,000 --> 00:00:06,000\nThird\n\n"
+    )
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["tests/sub.ass", "tests/sub_with_styles.ass", "tests/test_sample.srt"],
+)
+@pytest.mark.parametrize("options", [{}, {"removing_effects": True, "remove_duplicates": True}])
+def test_iter_dialogues_matches_convert(path, options):
+    converted = Subtitle(path, **options)
+    converted.convert()
+    sub = Subtitle(path, **options)
+
+    assert [str(dialogue) for dialogue in sub.iter_dialogues()] == [str(d) for d in converted.dialogues]
+    assert sub.dialogues == []
+
+
+def test_iter_dialogues_in_file_order():
+    texts = [dialogue.text for dialogue in Subtitle.from_string(UNORDERED_DOCUMENT).iter_dialogues(sort=False)]
+
+    assert texts == ["First", "Third", "Second"]
+
+
+def test_iter_dialogues_after_convert(sub):
+    sub.convert()
+
+    assert list(sub.iter_dialogues()) == sub.dialogues
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["tests/test_sample.srt", "tests/sub_standard.srt", "tests/sub_standard-removing-effects.srt"],
+)
+def test_iter_srt_entries_matches_regex_on_fixtures(path):
+    with open(path, encoding="utf8") as file:
+        expected = list(regex_srt_entries(file.read()))
+
+    assert expected
+    assert list(iter_srt_entries(path)) == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "1\n00:00:01,000 --> 00:00:03,000\nFirst\n\n\nstill first\n\n2\n00:00:04,000 --> 00:00:06,000\nSecond\n",
+        "1\n00:00:01,000 -> 00:00:03,000\nMalformed\n\n2\n00:00:04,000 --> 00:00:06,000\nCorrect\n",
+        "1\n\n00:00:01,000 --> 00:00:03,000\n\n\nAfter blanks\n1984\n00:00:04,000 --> 00:00:06,000\nAfter number\n",
+        "1\n2\n00:00:01,000-->00:00:03,000   \nTight arrows\n3\n",
+        "garbage\n00:00:01,000 --> 00:00:03,000\nNo number\n",
+    ],
+)
+def test_iter_srt_entries_matches_regex_on_edge_cases(content):
+    assert list(iter_srt_entries(io.StringIO(content))) == list(regex_srt_entries(content))
+
+
+def test_iter_srt_entries_is_lazy():
+    lines = iter(["1\n", "00:00:01,000 --> 00:00:02,000\n", "Hello\n", "\n", "2\n"])
+
+    entries = iter_srt_entries(lines)
+
+    assert next(entries) == ("00:00:01,000", "00:00:02,000", "Hello")
+    assert list(lines) == []
+
+
+def test_iter_srt_entries_keeps_indented_lines():
+    content = "1\n00:00:01,000 --> 00:00:03,000\nFirst\n  indented\n\n"
+
+    assert list(iter_srt_entries(io.StringIO(content))) == [("00:00:01,000", "00:00:03,000", "First indented")]
+
+
+def test_iter_ass_events_matches_regex_parser():
+    for path in ("tests/sub.ass", "tests/sub-removing-effects.ass", "tests/sub_with_styles.ass"):
+        assert list(iter_ass_events(path)) == list(iter_ass_events_regex(path))
+
+
+def test_iter_ass_events_uses_format_line():
+    document = (
+        "[Events]\n"
+        "Format: Layer, Style, Start, End, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+        "Dialogue: 0,Signs,0:00:01.00,0:00:02.00,,0,0,0,,Reordered, with commas\n"
+    )
+    assert list(iter_ass_events(io.StringIO(document))) == [
+        ("0:00:01.00", "0:00:02.00", "Signs", "Reordered, with commas"),
+    ]
+    assert list(iter_ass_events_regex(io.StringIO(document))) == []
+
+
+def test_iter_ass_events_ssa_format():
+    document = (
+        "[Events]\n"
+        "Format: Marked, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+        "Dialogue: Marked=0,0:00:01.00,0:00:02.00,Default,,0000,0000,0000,,SSA line\n"
+    )
+    assert list(iter_ass_events(io.StringIO(document))) == [("0:00:01.00", "0:00:02.00", "Default", "SSA line")]
+
+
+def test_iter_ass_events_skips_malformed_lines():
+    document = (
+        "[Events]\n"
+        "Format: Layer, Start, End, Text\n"
+        "Dialogue: 0,0:00:01.00,0:00:02.00,Missing style\n"
+        "Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Default layout\n"
+        "Dialogue: 0,0:00:01.00,0:00:02.00,Default\n"
+    )
+    assert list(iter_ass_events(io.StringIO(document))) == [
+        ("0:00:01.00", "0:00:02.00", "Default", "Default layout"),
+    ]
+
+
+def test_convert_skips_events_with_malformed_times():
+    document = (
+        "[Events]\n"
+        "Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Valid\n"
+        "Dialogue: 0,broken,0:00:02.00,Default,,0,0,0,,Bad time\n"
+        "Dialogue: 0,0:00:01.500,0:00:02.00,Default,,0,0,0,,Milliseconds\n"
+        "Dialogue: 0,0:00:01.5,0:00:02.00,Default,,0,0,0,,Deciseconds\n"
+        "Dialogue: 0,0:00:01.00,0:0:02.00,Default,,0,0,0,,Short minutes\n"
+        "Dialogue: 0,0:00:01.00,0:00:+2.00,Default,,0,0,0,,Signed seconds\n"
+    )
+    dialogues = Subtitle.from_string(document).export(output_dialogues=True)
+    assert [dialogue.text for dialogue in dialogues] == ["Valid"]
+
+
+FONTS_DOCUMENT = (
+    b"\xef\xbb\xbf[Script Info]\r\nTitle: Fonts\r\n\r\n"
+    b"[Fonts]\r\nfontname: font.ttf\r\n" + b"[\xff\xfe not utf-8 font data]\r\n" * 50 + b"\r\n"
+    b"[Events]\r\n"
+    b"Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\r\n"
+    b"Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,After fonts\r\n"
+    b"\r\n[Graphics]\r\nfilename: logo.png\r\n" + b"\xff\xfe\xfa\r\n" * 50
+)
+
+
+def test_index_sections(tmp_path):
+    path = tmp_path / "fonts.ass"
+    path.write_bytes(FONTS_DOCUMENT)
+
+    sections = index_sections(path)
+
+    start, end = sections["[events]"][0]
+    assert FONTS_DOCUMENT[start:end].startswith(b"Format: Layer")
+    assert FONTS_DOCUMENT[end:].startswith(b"[Graphics]")
+    assert "[script info]" in sections
+    assert "[fonts]" in sections
+
+    empty = tmp_path / "empty.ass"
+    empty.touch()
+    assert index_sections(empty) == {}
+
+
+def test_iter_section_lines_skips_undecodable_sections(tmp_path):
+    path = tmp_path / "fonts.ass"
+    path.write_bytes(FONTS_DOCUMENT)
+
+    lines = list(iter_section_lines(path, "[Events]"))
+
+    assert lines[1] == "Dialogue: 0,0:00:01.00,0:00:02.00,Default,,0,0,0,,After fonts\n"
+    assert list(iter_ass_events(path)) == [("0:00:01.00", "0:00:02.00", "Default", "After fonts")]
+    assert [d.text for d in Subtitle(path).export(output_dialogues=True)] == ["After fonts"]
+
+
+def test_has_srt_timecode(tmp_path):
+    path = tmp_path / "fonts.ass"
+    path.write_bytes(FONTS_DOCUMENT)
+    assert not has_srt_timecode(path)
+
+    path.write_bytes(FONTS_DOCUMENT + b"1\r\n00:00:01,000 --> 00:00:02,000\r\nText\r\n")
+    assert has_srt_timecode(path)
+
+
+def test_has_srt_timecode_skips_binary_sections(tmp_path):
+    path = tmp_path / "fonts.ass"
+    path.write_bytes(FONTS_DOCUMENT.replace(b"fontname: font.ttf", b"00:00:01,000-->00:00:02,000"))
+
+    assert has_srt_timecode(path)
+    assert not has_srt_timecode(path, sections=index_sections(path))
@@ -1,6 +1,7 @@
 import pytest
 
-from pyasstosrt import Subtitle
+from pyasstosrt import StyleReport, Subtitle, scan_styles
+from pyasstosrt.parser import count_event_styles, iter_style_names
 
 
 def test_include_single_style(sub_with_styles):
@@ -171,3 +172,93 @@ def test_get_styles_srt_format(sub_srt):
 
     # SRT files don't have styles
     assert styles == []
+
+
+def test_scan_styles_matches_conversion(sub_with_styles):
+    report = sub_with_styles.scan_styles()
+
+    assert report.declared == ["Default", "Alt", "Thoughts", "Top", "Signs", "Credits"]
+    assert report.counts == {"Default": 12, "Alt": 3, "Thoughts": 4, "Top": 2, "Signs": 3, "Credits": 1}
+    assert report.styles == sub_with_styles.get_styles()
+    assert report.event_count == 25
+    assert report.unused == []
+
+
+def test_scan_styles_does_not_convert(sub_with_styles):
+    sub_with_styles.scan_styles()
+
+    assert sub_with_styles.dialogues == []
+    assert sub_with_styles.styles == []
+
+
+def test_scan_styles_srt_format(sub_srt):
+    report = sub_srt.scan_styles()
+
+    assert report.declared == []
+    assert report.counts == {}
+
+
+def test_scan_styles_from_string():
+    text = (
+        "[V4+ Styles]\n"
+        "Format: Fontname, Name, Fontsize\n"
+        "Style: Arial, Main, 20\n"
+        "Style: Arial, Unused, 20\n"
+        "\n"
+        "[Events]\n"
+        "Format: Layer, Style, Start, End, Text\n"
+        "Dialogue: 0,Main,0:00:01.00,0:00:02.00,Hello, world\n"
+        "Dialogue: 0,Extra,0:00:03.00,0:00:04.00,Sign\n"
+        "Comment: 0,Main,0:00:05.00,0:00:06.00,Note\n"
+    )
+    report = Subtitle.from_string(text).scan_styles()
+
+    assert report.source is None
+    assert report.declared == ["Main", "Unused"]
+    assert report.counts == {"Main": 1, "Extra": 1}
+    assert report.unused == ["Unused"]
+
+
+def test_style_scanners_skip_other_sections():
+    lines = [
+        "[Script Info]\n",
+        "Style: Fake\n",
+        "[V4 Styles]\n",
+        "Style: Default,Arial,20\n",
+        "[Events]\n",
+        "Dialogue: Marked=0,0:00:01.00,0:00:02.00,Default,,0,0,0,,Text\n",
+        "Dialogue: too,few,columns\n",
+    ]
+
+    assert list(iter_style_names(lines)) == ["Default"]
+    assert count_event_styles(lines) == {"Default": 1}
+
+
+def test_style_scanners_strip_padded_columns():
+    sub = Subtitle.from_string(
+        "[V4+ Styles]\n"
+        "Format: Name, Fontname, Fontsize\n"
+        "Style: Main, Arial, 20\n"
+        "[Events]\n"
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+        "Dialogue: 0, 0:00:01.00, 0:00:02.00, Main , , 0, 0, 0, ,Text\n"
+    )
+
+    report = sub.scan_styles()
+
+    assert report.declared == ["Main"]
+    assert report.counts == {"Main": 1}
+    assert report.unused == []
+
+
+@pytest.mark.parametrize("executor", ["serial", "thread"])
+def test_scan_styles_many(executor):
+    paths = ["tests/sub_with_styles.ass", "tests/sub.ass", "tests/missing.ass"]
+    reports = scan_styles(paths, executor=executor)
+
+    assert [str(report.source) for report in reports] == paths
+    assert reports[0].event_count == 25
+    assert reports[1].counts == {"Default": 376}
+    assert not reports[2].ok
+    assert isinstance(reports[2], StyleReport)
+    assert isinstance(reports[2].error, FileNotFoundError)
@@ -0,0 +1,49 @@
+import pytest
+
+from pyasstosrt import Dialogue, Subtitle, Time
+from pyasstosrt.table import DialogueTable
+
+
+@pytest.mark.parametrize("path", ["tests/sub.ass", "tests/sub_with_styles.ass", "tests/test_sample.srt"])
+def test_compact_dialogues_match_list(path):
+    expected = Subtitle(path).export(output_dialogues=True)
+    table = Subtitle(path, compact=True).export(output_dialogues=True)
+
+    assert isinstance(table, DialogueTable)
+    assert len(table) == len(expected)
+    assert [str(d) for d in table] == [str(d) for d in expected]
+    assert str(table[-1]) == str(expected[-1])
+
+
+def test_compact_export_matches_standard(tmp_path):
+    Subtitle("tests/sub.ass", compact=True).export(tmp_path)
+
+    with open("tests/sub_standard.srt", encoding="utf-8") as standard:
+        assert (tmp_path / "sub.srt").read_text(encoding="utf-8") == standard.read()
+
+
+def test_table_rows_and_views():
+    table = DialogueTable([Dialogue(1, "0:00:01.00", "0:00:02.00", "One")])
+    table.add(2, 3000, Time.from_srt("00:00:04,500"), "Two")
+
+    assert list(table.start) == [1000, 3000]
+    assert list(table.end) == [2000, 4500]
+    assert table[1].get_timestamp() == "00:00:03,000 --> 00:00:04,500"
+
+    view = table[0]
+    view.text = "Changed"
+    assert table.text[0] == "One"
+    table[0] = view
+    assert table.text[0] == "Changed"
+
+
+def test_table_slice():
+    table = DialogueTable()
+    for index in range(1, 6):
+        table.add(index, index * 1000, index * 1000 + 500, f"Line {index}")
+
+    part = table[1:3]
+
+    assert isinstance(part, DialogueTable)
+    assert [d.index for d in part] == [2, 3]
+    assert part.text == ["Line 2", "Line 3"]
@@ -1,6 +1,7 @@
 import pytest
 
 from pyasstosrt import Time
+from pyasstosrt.time import ass_to_ms
 
 
 def test_negative_sub_time():
@@ -36,3 +37,58 @@ def test_millisecond_sub():
 def test_str_conversion(input_time, expected_output):
     t = Time(input_time)
     assert str(t) == expected_output
+
+
+@pytest.mark.parametrize(
+    "time, expected_ms",
+    [
+        (Time("1:23:45.67"), 5025670),
+        (Time.from_ass("0:00:10.58"), 10580),
+        (Time.from_srt("01:23:45,678"), 5025678),
+        (Time.from_ms(61001), 61001),
+        (Time(61001), 61001),
+        (Time(Time.from_ms(42)), 42),
+    ],
+)
+def test_constructors(time, expected_ms):
+    assert time.total_milliseconds == expected_ms
+    assert int(time) == expected_ms
+
+
+def test_components():
+    t = Time.from_srt("12:34:56,789")
+    assert (t.hour, t.minute, t.second, t.millisecond) == (12, 34, 56, 789)
+
+
+def test_srt_precision_round_trip():
+    assert str(Time.from_srt("00:01:23,456")) == "00:01:23,456"
+    assert str(Time.from_ms(100 * 3_600_000)) == "100:00:00,000"
+
+
+def test_comparison_and_sorting():
+    times = [Time("0:00:02.00"), Time.from_srt("00:00:01,005"), Time.from_ms(1000)]
+
+    assert sorted(times) == [Time.from_ms(1000), Time.from_ms(1005), Time.from_ms(2000)]
+    assert Time("0:00:01.00") == Time.from_ms(1000)
+    assert Time.from_ms(1000) != Time.from_ms(1001)
+    assert Time.from_ms(1000) <= Time.from_ms(1000) < Time.from_ms(1001)
+    assert len({Time.from_ms(5), Time("0:00:00.00"), Time.from_ms(0)}) == 2
+
+
+def test_slots():
+    with pytest.raises(AttributeError):
+        Time.from_ms(0).extra = 1
+
+
+def test_ass_to_ms():
+    assert ass_to_ms("1:23:45.67") == 5025670
+    assert ass_to_ms("12:00:00.01") == 43200010
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["0:00:01.500", "0:00:01.5", "0:0:01.00", "0:00:1.00", ":00:01.00", "0:00:+1.00", "0:00: 1.00", "0:00:0١.00"],
+)
+def test_ass_to_ms_rejects_malformed_timestamps(text):
+    with pytest.raises(ValueError):
+        ass_to_ms(text)
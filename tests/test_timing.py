@@ -0,0 +1,79 @@
+import pytest
+
+from pyasstosrt import Subtitle, timing
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(timing, "np", None)
+    return request.param
+
+
+@pytest.fixture(params=[False, True], ids=["list", "compact"])
+def sub_timed(request):
+    return Subtitle("tests/sub_with_styles.ass", compact=request.param)
+
+
+def spans(sub):
+    return [(d.start.total_milliseconds, d.end.total_milliseconds) for d in sub.dialogues]
+
+
+def test_shift(backend, sub_timed):
+    sub_timed.convert()
+    original = spans(sub_timed)
+
+    sub_timed.shift(1500)
+
+    assert spans(sub_timed) == [(start + 1500, end + 1500) for start, end in original]
+
+
+def test_shift_clamps_negative_times(backend, sub_timed):
+    sub_timed.shift(-(10**9))
+
+    assert set(spans(sub_timed)) == {(0, 0)}
+
+
+def test_scale(backend, sub_timed):
+    sub_timed.convert()
+    original = spans(sub_timed)
+
+    sub_timed.scale(0.5)
+
+    assert spans(sub_timed) == [(round(start * 0.5), round(end * 0.5)) for start, end in original]
+
+
+def test_retime_fps(backend, sub_timed):
+    sub_timed.convert()
+    original = spans(sub_timed)
+
+    sub_timed.retime_fps(24000 / 1001, 25)
+
+    factor = 24000 / 1001 / 25
+    assert spans(sub_timed) == [(round(start * factor), round(end * factor)) for start, end in original]
+
+
+def test_clip(backend, sub_timed):
+    sub_timed.clip(min_duration=2000, max_duration=2500)
+
+    assert all(2000 <= end - start <= 2500 for start, end in spans(sub_timed))
+
+
+def test_timing_is_kept_on_export(backend, sub_timed, tmp_path):
+    sub_timed.shift(3_600_000)
+    sub_timed.export(tmp_path)
+
+    content = (tmp_path / "sub_with_styles.srt").read_text(encoding="utf-8")
+    assert content.startswith("1\n01:00:")
+    assert content.count(" --> ") == len(sub_timed.dialogues)
+
+
+@pytest.mark.parametrize(
+    "method, args",
+    [("scale", (0,)), ("retime_fps", (25, 0)), ("clip", (3000, 1000))],
+)
+def test_invalid_arguments(backend, sub_timed, method, args):
+    with pytest.raises(ValueError):
+        getattr(sub_timed, method)(*args)
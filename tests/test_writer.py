@@ -0,0 +1,131 @@
+import io
+import socket
+
+import pytest
+
+from pyasstosrt import Dialogue, DialogueTable, SrtWriter, Subtitle
+from pyasstosrt.writer import is_binary_stream
+
+DIALOGUES = [
+    Dialogue(1, "0:00:01.00", "0:00:02.50", "First"),
+    Dialogue(2, 3_600_000, 3_601_234, "Second\nline"),
+]
+EXPECTED = "1\n00:00:01,000 --> 00:00:02,500\nFirst\n\n2\n01:00:00,000 --> 01:00:01,234\nSecond\nline\n\n"
+
+
+class RecordingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def test_writer_matches_str_dialogue():
+    stream = io.StringIO()
+    with SrtWriter(stream) as writer:
+        assert writer.write_dialogues(DIALOGUES) == 2
+
+    assert stream.getvalue() == EXPECTED == "".join(str(dialogue) for dialogue in DIALOGUES)
+
+
+def test_writer_rows_and_single_dialogue():
+    stream = io.StringIO()
+    with SrtWriter(stream) as writer:
+        writer.write(DIALOGUES[0])
+        writer.write_rows([(2, 3_600_000, 3_601_234, "Second\nline")])
+
+    assert stream.getvalue() == EXPECTED
+
+
+def test_writer_binary_stream():
+    stream = io.BytesIO()
+    with SrtWriter(stream, encoding="utf-16") as writer:
+        writer.write_dialogues(DIALOGUES)
+
+    assert stream.getvalue().decode("utf-16") == EXPECTED
+
+
+def test_writer_socket():
+    sender, receiver = socket.socketpair()
+    with sender, receiver:
+        with SrtWriter(sender) as writer:
+            writer.write_dialogues(DIALOGUES)
+        sender.shutdown(socket.SHUT_WR)
+        received = b""
+        while True:
+            chunk = receiver.recv(4096)
+            if not chunk:
+                break
+            received += chunk
+
+    assert received.decode("utf8") == EXPECTED
+
+
+def test_writer_buffers_writes():
+    rows = [(i, i * 1000, i * 1000 + 500, "Text") for i in range(1, 1001)]
+    batched, unbuffered = RecordingStream(), RecordingStream()
+
+    with SrtWriter(batched, buffer_size=8192) as writer:
+        writer.write_rows(rows)
+    with SrtWriter(unbuffered, buffer_size=1) as writer:
+        writer.write_rows(rows)
+
+    assert batched.getvalue() == unbuffered.getvalue()
+    assert unbuffered.writes == 1000
+    assert batched.writes < 10
+
+
+def test_writer_nothing_written_before_flush():
+    stream = io.StringIO()
+    writer = SrtWriter(stream)
+    writer.write_dialogues(DIALOGUES)
+
+    assert stream.getvalue() == ""
+    writer.flush()
+    assert stream.getvalue() == EXPECTED
+
+
+def test_writer_truncate_discards_output():
+    stream = io.StringIO()
+    stream.write("header\n")
+    with SrtWriter(stream) as writer:
+        position = writer.tell()
+        writer.write_dialogues(DIALOGUES)
+        writer.truncate(position)
+        writer.write(DIALOGUES[0])
+
+    assert stream.getvalue() == "header\n" + str(DIALOGUES[0])
+
+
+def test_writer_invalid_buffer_size():
+    with pytest.raises(ValueError):
+        SrtWriter(io.StringIO(), buffer_size=0)
+
+
+@pytest.mark.parametrize(
+    ("stream", "binary"),
+    [(io.StringIO(), False), (io.BytesIO(), True), (socket.socket(), True)],
+)
+def test_is_binary_stream(stream, binary):
+    assert is_binary_stream(stream) is binary
+    if isinstance(stream, socket.socket):
+        stream.close()
+
+
+def test_table_write_srt_counts_rows():
+    table = DialogueTable(DIALOGUES)
+    stream = io.StringIO()
+
+    assert table.write_srt(stream) == 2
+    assert stream.getvalue() == EXPECTED
+
+
+@pytest.mark.parametrize("buffer_size", [1, 4096])
+def test_export_buffer_size(tmp_path, buffer_size):
+    Subtitle("tests/sub.ass").export(tmp_path, buffer_size=buffer_size)
+
+    with open("tests/sub_standard.srt", encoding="utf-8") as standard:
+        assert (tmp_path / "sub.srt").read_text(encoding="utf-8") == standard.read()